@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+''' Benchmark pyracf on a synthetic IRRDBU00 unload.
+
+The unload is generated by pyracf.synthetic, so a given --lines and --seed always measure the same data.
+Results are saved as JSON in benchmarks/results, use --compare to show the change against an earlier run.
+
+    python benchmarks/run_benchmarks.py --lines 100000
+    python benchmarks/run_benchmarks.py --lines 100000 --compare benchmarks/results/20240101-120000-100000.json
+'''
+
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pandas as pd
+from pyracf import RACF
+from pyracf.cache import frameCache
+from pyracf.synthetic import generate
+
+frameCache.maxsize = 0  # measure the work of gfilter and rfilter, not the cached results
+
+resultsDir = os.path.join(os.path.dirname(__file__), 'results')
+
+
+def timed(func, repeat=1):
+    ''' best elapsed time of repeat calls '''
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def importTimes(repeat=5):
+    ''' best cumulative import time of pyracf and of pandas in seconds, in a new interpreter, after a first run compiled the modules '''
+    env = {k: v for (k, v) in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    env['PYTHONPATH'] = os.path.join(os.path.dirname(__file__), '..', 'src')
+    best = {}
+    for _ in range(repeat + 1):
+        trace = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import pyracf'], env=env, capture_output=True, text=True).stderr
+        for (micros, module) in re.findall(r'\|\s+(\d+) \| +(pyracf|pandas)$', trace, re.M):
+            best[module] = min(best.get(module, float('inf')), int(micros) / 1e6)
+    return best
+
+
+def parsed(unload):
+    r = RACF(unload, cache=0)  # measure the work, not the cached views
+    r.parse_t()  # synchronous, parse() would run this in a thread
+    return r
+
+
+def benchmarks(r, pickledir, workdir):
+    ''' name -> (function, repeat) for the operations on a parsed RACF object r '''
+    return {
+        'save_pickles': (lambda: r.save_pickles(path=pickledir, prefix='bench-'), 1),
+        'RACF(pickles)': (lambda: RACF(pickles=pickledir, prefix='bench-', cache=0), 3),
+        'gfilter.datasets': (lambda: r.datasets.gfilter('SYS1.**'), 5),
+        'gfilter.generals': (lambda: r.generals.gfilter('FACI*', 'BPX.**'), 5),
+        'gfilter.datasetAccess': (lambda: r.datasetAccess.gfilter(None, 'U00000*'), 5),
+        'user': (lambda: [r.user(f'U{u:07d}') for u in range(100)], 3),
+        'connect': (lambda: [r.connect(None, f'U{u:07d}') for u in range(100)], 3),
+        'acl': (lambda: r.datasets.gfilter('DEPT*.**').acl(), 3),
+        'acl.resolve': (lambda: r.datasets.gfilter('DEPT*.**').acl(resolve=True), 3),
+        'acl.admin': (lambda: r.datasets.gfilter('DEPT*.**').acl(admin=True), 3),
+        'acl.allows': (lambda: r.datasetAccess.acl(allows='UPDATE', resolve=True), 3),
+        'acl.user': (lambda: r.datasetAccess.acl(resolve=True, user='U0000001'), 3),
+        'access_of': (lambda: [r.access_of(f'U{u:07d}') for u in range(100)], 3),
+        'user_lifecycle': (lambda: r.user_lifecycle(asof='2024-01-01'), 3),
+        'uid_users': (lambda: [r.uid_users(u) for u in range(100)], 3),
+        'superusers': (lambda: r.superusers, 3),
+        'certificates_expiring': (lambda: r.certificates_expiring(30, asof='2024-01-01', started=True), 3),
+        'orphans': (lambda: r.orphans, 3),
+        'getdatasetrisk': (lambda: r.getdatasetrisk('SYS1.**'), 3),
+        'xls': (lambda: r.xls(fileName=os.path.join(workdir, 'bench.xlsx')), 1),
+    }
+
+
+def run(lines, seed, skip=(), unload=None):
+    result = {'created': datetime.now().isoformat(), 'lines': lines, 'seed': seed,
+              'python': platform.python_version(), 'pandas': pd.__version__, 'machine': platform.machine(),
+              'results': {}}
+    imports = importTimes()
+    result['results']['import pyracf'] = imports['pyracf']
+    result['results']['import pandas'] = imports['pandas']
+    with tempfile.TemporaryDirectory() as workdir:
+        if not unload:
+            unload = os.path.join(workdir, 'synthetic.unload')
+            result['generate'] = timed(lambda: generate(unload, lines=lines, seed=seed))
+        r = None
+        def parse():
+            nonlocal r
+            r = parsed(unload)
+        result['results']['parse'] = timed(parse)
+        phases = r.status['phases']
+        result['results']['_correlate'] = phases['correlate']['seconds']  # elapsed, the stages may run concurrently
+        result['phases'] = phases
+        result['input-lines'] = r.status['input-lines']
+        pickledir = os.path.join(workdir, 'pickles')
+        for (name, (func, repeat)) in benchmarks(r, pickledir, workdir).items():
+            if name in skip:
+                continue
+            result['results'][name] = timed(func, repeat)
+            print(f'{name:24} {result["results"][name]:10.4f}s', file=sys.stderr)
+    return result
+
+
+def compare(new, old):
+    print(f'{"benchmark":24} {"old":>10} {"new":>10} {"ratio":>7}')
+    for (name, seconds) in new['results'].items():
+        if name in old['results']:
+            before = old['results'][name]
+            ratio = f'{seconds/before:7.2f}' if before else '    n.a'
+            print(f'{name:24} {before:10.4f} {seconds:10.4f} {ratio}')
+        else:
+            print(f'{name:24} {"":10} {seconds:10.4f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark pyracf on a synthetic unload.')
+    parser.add_argument('--lines', type=int, default=100000, help='size of the synthetic unload, 10000 up to 50000000')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--unload', help='use this unload instead of a synthetic one')
+    parser.add_argument('--skip', nargs='*', default=[], help='benchmarks to skip, e.g. xls')
+    parser.add_argument('--compare', help='earlier result file to compare with')
+    parser.add_argument('--output', help='result file, default benchmarks/results/<timestamp>-<lines>.json')
+    args = parser.parse_args()
+
+    result = run(args.lines, args.seed, skip=args.skip, unload=args.unload)
+    output = args.output or os.path.join(resultsDir, f'{datetime.now().strftime("%Y%m%d-%H%M%S")}-{args.lines}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(result, f, indent=2)
+    print(f'results saved to {output}')
+    if args.compare:
+        with open(args.compare) as f:
+            compare(result, json.load(f))
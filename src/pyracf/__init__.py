@@ -1,25 +1,29 @@
-import importlib.resources
-import json
 import pandas as pd 
+import numpy as np
 
 import math
 
-
-# No mess with my header lines
-import pandas.io.formats.excel
-pandas.io.formats.excel.ExcelFormatter.header_style = None
-
 import threading
 import time
 from datetime import datetime
 
-import xlsxwriter
-
 import os
-import glob
+import shutil
+import tempfile
+import weakref
 
 import warnings 
 
+from .instrumentation import PhaseTimer
+from .cache import ViewCache, cachedView, cachedFilter, frameCache, bindCache, cacheOf
+from .profile_index import ProfileIndexes
+from .conditional import ConditionIndex
+from .grouping import memberIndex
+from . import sqlstore
+from .unload import Unload, decodeFields
+from .stages import StageGraph
+from .overlay import racfOf
+
 class StoopidException(Exception):
     def __init__(self, message):
         self.message = message
@@ -256,29 +260,26 @@ class RACF:
     '05L0': {'name':'GRJES', 'df':'_generalJES', 'publisher':'JES'}
     }
 
+    # record types that parse_t always turns into frames, because _correlate or the reporting methods use them.
+    # With RACF(lazy=True) the other record types are built when they are first used.
+    _eagerRecords = ['GPBD','GPMEM','USBD','USCON','DSBD','DSCACC','DSACC','GRBD','GRMEM','GRACC','GRCACC','GRCDT']
+
     _recordname_type = {}    # {'GPBD': '0100', ....}
     _recordname_df = {}      # {'GPBD': '_groups', ....}
     for (rtype,rinfo) in _recordtype_info.items():
         _recordname_type.update({rinfo['name']: rtype})
         _recordname_df.update({rinfo['name']: rinfo['df']})
     
-    # load irrdbu00 field definitions, save offsets in _recordtype_info
-    # strictly speaking only needed for parse() function, but also not limited to one instance.
-    with importlib.resources.open_text("pyracf", "offsets.json") as file:
-        _offsets = json.load(file)
-    for offset in _offsets:
-        rtype = _offsets[offset]['record-type']
-        if rtype in _recordtype_info.keys():
-          _recordtype_info[rtype].update({"offsets": _offsets[offset]["offsets"]})
     try:
-        del file, rtype, rinfo, offset, _offsets  # don't need these as class attributes
+        del rtype, rinfo  # don't need these as class attributes
     except NameError:
         pass
 
     _grouptree          = None  # dict with lists
     _ownertree          = None  # dict with lists
-    _grouptreeLines     = None  # df with all supgroups up to SYS1
-    _ownertreeLines     = None  # df with owners up to SYS1 or user ID
+    _uidIndex           = None  # df with user IDs by integer UID
+    _gidIndex           = None  # df with groups by integer GID
+    _customFields       = None  # dict with the wide custom field frames by entity
     
     accessKeywords = [' ','NONE','EXECUTE','READ','UPDATE','CONTROL','ALTER','-owner-']
     
@@ -289,51 +290,98 @@ class RACF:
         '''
         return RACF.accessKeywords[RACF.accessKeywords.index(level):]
 
-    def __init__(self, irrdbu00=None, pickles=None, prefix=''):
-
-        # activate acl() method on our dataframes, so it get called with our instance's variables, the frame, and all optional parms
-        # e.g. msys._datasetAccess.loc[['SYS1.**']].acl(permits=True, explode=False, resolve=False, admin=False, sort="user")
-        pd.core.base.PandasObject.acl = lambda *x,**y: RACF.acl(self,*x,**y)
+    def __init__(self, irrdbu00=None, pickles=None, prefix='', callback=None, cache=128, cachebytes=2**28, encoding=None, lazy=False, artifacts=None, threads=1):
 
         # generic and regex filter on the index levels of a frame
         # e.g. msys._datasets.gfilter('SYS1.**').acl(resolve=True, allows='UPDATE', sort="user")
         pd.core.base.PandasObject.gfilter = RACF.gfilter
         pd.core.base.PandasObject.rfilter = RACF.rfilter
+        pd.core.base.PandasObject.pfilter = RACF.pfilter
+        pd.core.base.PandasObject.when = RACF.when
 
         self._state = self.STATE_INIT
 
+        # timings of parse, load and correlate phases, callback(phase, entry) is called when each phase completes
+        self._timer = PhaseTimer(callback)
+
+        # derived views (specials, acl( ), gfilter( ), ...) are kept until their frames are replaced, at most cache results
+        # and cachebytes bytes are kept
+        self._cache = ViewCache(maxsize=cache, maxbytes=cachebytes)
+        self._admins = None  # (weakrefs to the frames, result) of _adminIndex( ), kept outside the LRU cache
+
+        # hash indexes for single profile lookups, per frame
+        self._profileIndex = ProfileIndexes()
+        self._sqlite = None  # database written by save_sqlite( ), used by sql( )
+
+        # with lazy=True parse_t keeps the records of rarely used record types, their frame is built on first use
+        self._lazy = lazy
+        self._lazyFrames = {}  # frame and publisher name -> record type, for frames that are not built yet
+        self._lazySources = {}  # record type -> pickle file, for lazy frames of a snapshot
+        self._lazyLock = threading.Lock()
+
+        # _correlate runs its stages on threads threads, and pickles are read and written on threads threads.
+        # artifacts selects the derived stages of _correlate (None: all correlateStages)
+        self._artifacts = artifacts
+        self._threads = threads
+
         if not irrdbu00 and not pickles:
             self._state = self.STATE_BAD
         else:
             if not pickles:
                 self._irrdbu00 = irrdbu00
                 self._state    = self.STATE_INIT
-                self._unloadlines = sum(1 for _ in open(self._irrdbu00, errors="ignore"))
+                # compressed and EBCDIC unloads are recognized from their first bytes, or use encoding='cp1047'
+                self._unload = Unload(irrdbu00, encoding)
+                self._unloadlines = self._unload.count()
 
         if pickles:
-            # Read from pickles dir
-            picklefiles = glob.glob(f'{pickles}/{prefix}*.pickle')
+            # Read from pickles dir, the files listed in the manifest, or all pickles with prefix when there is no manifest
+            from . import snapshot
             self._starttime = datetime.now()
             self._records = {}
             self._unloadlines = 0
-            
-            for pickle in picklefiles:
-                fname = os.path.basename(pickle)
-                recordname = fname.replace(prefix,'').split('.')[0]
-                if recordname in RACF._recordname_type:
-                    recordtype = RACF._recordname_type[recordname]
-                    dfname = RACF._recordname_df[recordname]
-                    setattr(self, dfname, pd.read_pickle(pickle))
-                    recordsRetrieved = len(getattr(self, dfname))
-                    self._records[recordtype] = {
-                      "seen": recordsRetrieved,
-                      "parsed": recordsRetrieved
-                    }
-                    self._unloadlines += recordsRetrieved
+            manifest = snapshot.readManifest(pickles, prefix)
+            if manifest:
+                if manifest['schema']!=snapshot.schemaVersion:
+                    warnings.warn(f"pickles in {pickles} were saved with field definitions {manifest['schema']}, pyracf has {snapshot.schemaVersion}")
+                files = {name: os.path.join(pickles, entry['file']) for (name, entry) in manifest['frames'].items() if name in RACF._recordname_type}
+            else:
+                files = snapshot.pickleFiles(pickles, prefix, RACF._recordname_type)
+                if not files:
+                    raise StoopidException(f'No pickles with prefix {prefix!r} in {pickles}')
+
+            # with lazy=True and a manifest, frames that the reporting methods don't use are read when they are first used
+            if self._lazy and manifest:
+                for (recordname, fileName) in list(files.items()):
+                    if recordname not in RACF._eagerRecords:
+                        recordtype = RACF._recordname_type[recordname]
+                        rinfo = RACF._recordtype_info[recordtype]
+                        self._lazySources[recordtype] = fileName
+                        self._lazyFrames[rinfo['df']] = recordtype
+                        if 'publisher' in rinfo:
+                            self._lazyFrames[rinfo['publisher'] if rinfo['publisher']!='*' else rinfo['df'].lstrip('_')] = recordtype
+                        recordsRetrieved = manifest['frames'][recordname]['records']
+                        self._records[recordtype] = {"seen": recordsRetrieved, "parsed": recordsRetrieved}
+                        self._unloadlines += recordsRetrieved
+                        del files[recordname]
+
+            try:
+                frames = snapshot.loadFrames(files, threads=self._threads, timer=self._timer, manifest=manifest)
+            except ValueError as e:
+                raise StoopidException(f'Inconsistent pickles in {pickles}: {e}')
+            for (recordname, df) in frames.items():
+                recordtype = RACF._recordname_type[recordname]
+                setattr(self, RACF._recordname_df[recordname], df)
+                recordsRetrieved = len(df)
+                self._records[recordtype] = {
+                  "seen": recordsRetrieved,
+                  "parsed": recordsRetrieved
+                }
+                self._unloadlines += recordsRetrieved
 
             # create remaining public DFs as empty
             for (rtype,rinfo) in RACF._recordtype_info.items():
-                if not hasattr(self, rinfo['df']):
+                if rinfo['df'] not in self.__dict__ and rinfo['df'] not in self._lazyFrames:
                     setattr(self, rinfo['df'], pd.DataFrame())
                     self._records[rtype] = {
                       "seen": 0,
@@ -357,6 +405,12 @@ class RACF:
             for rtype in RACF._recordtype_info:
                 self._parsed[rtype] = []
 
+        # activate acl() method on our dataframes, so it get called with our instance's variables, the frame, and all optional parms
+        # e.g. msys._datasetAccess.loc[['SYS1.**']].acl(permits=True, explode=False, resolve=False, admin=False, sort="user")
+        # this is done last, so a RACF object that fails to load doesn't take over acl() from a working one
+        # frames taken from an overlay (and the frames selected from them) call acl() of the overlay instead
+        pd.core.base.PandasObject.acl = lambda df,*x,**y: RACF.acl(racfOf(df,self),df,*x,**y)
+
     @property
     def status(self):
         seen = 0
@@ -388,7 +442,22 @@ class RACF:
             parsetime = (self._stoptime - self._starttime).total_seconds()
         else:
             status = "Limbo"     
-        return {'status': status, 'input-lines': self._unloadlines, 'lines-read': seen, 'lines-parsed': parsed, 'lines-per-second': speed, 'parse-time': parsetime}
+        return {'status': status, 'input-lines': self._unloadlines, 'lines-read': seen, 'lines-parsed': parsed, 'lines-per-second': speed, 'parse-time': parsetime,
+                'phases': self._timer.report(), 'cache': self._cache.info()}
+
+    def clear_cache(self):
+        ''' forget derived views, needed only after a frame was modified in place '''
+        self._cache.clear()
+        self._admins = None
+        frameCache.clear()
+
+    def _viewFrame(self, name):
+        ''' frame name, or None, as it identifies the results of @cachedView methods '''
+        return getattr(self, name, None)
+
+    def save_timings(self, fileName='pyracf-timings.json'):
+        ''' write the timings, record counts and memory growth of the parse/load and correlate phases as JSON '''
+        return self._timer.to_json(fileName)
 
     def parse_fancycli(self, recordtypes=_recordtype_info.keys(), save_pickles=False, prefix=''):
         print(f'{datetime.now().strftime("%y-%m-%d %H:%M:%S")} - parsing {self._irrdbu00}')
@@ -425,32 +494,43 @@ class RACF:
             self._starttime = datetime.now()
             self._state = self.STATE_PARSING
         self.THREAD_COUNT += 1
-        with open(self._irrdbu00, 'r', encoding="utf-8", errors="replace") as infile:
-            for line in infile:
-                r = line[:4]
-                if r in self._records:
-                    self._records[r]['seen'] += 1
-                else:
-                    self._records[r] = {'seen': 1, 'parsed': 0}
-                if r in thingswewant:
-                    offsets = RACF._recordtype_info[r]["offsets"]
-                    if offsets:
-                        irrmodel = {}
-                        for model in offsets:
-                            start = int(model['start'])
-                            end   = int(model['end'])
-                            name  = model['field-name']
-                            value = line[start-1:end].strip()
-                            irrmodel[name] = str(value) 
-                        self._parsed[r].append(irrmodel)
-                        self._records[r]['parsed'] += 1
-        # all models parsed :)
+        # records of the wanted types are kept as bytes while reading, their fields are decoded per column afterwards
+        from .schema import recordOffsets  # field positions, only needed when parsing
+        perf_counter = time.perf_counter
+        linesRead = 0
+        scanStart = perf_counter()
+        codec = self._unload.encoding
+        recordType = {}  # record type in the unload's bytes -> str
+        for line in self._unload.records():
+            linesRead += 1
+            r = recordType.get(line[:4])
+            if r is None:
+                r = recordType[line[:4]] = line[:4].decode(codec, errors="replace")
+            if r in self._records:
+                self._records[r]['seen'] += 1
+            else:
+                self._records[r] = {'seen': 1, 'parsed': 0}
+            if r in thingswewant and recordOffsets.get(r):
+                self._parsed[r].append(line)
+                self._records[r]['parsed'] += 1
+        self._timer.add('read', perf_counter() - scanStart, linesRead)
 
         for (rtype,rinfo) in RACF._recordtype_info.items():
             if rtype in thingswewant:
-                setattr(self, rinfo['df'], pd.DataFrame.from_dict(self._parsed[rtype]))
-
-        # TODO: Reduce memory use, delete self._parsed after dataframes are made
+                if self._lazy and self._parsed[rtype] and rinfo['name'] not in RACF._eagerRecords:
+                    self._lazyFrames[rinfo['df']] = rtype
+                    if 'publisher' in rinfo:
+                        self._lazyFrames[rinfo['publisher'] if rinfo['publisher']!='*' else rinfo['df'].lstrip('_')] = rtype
+                    continue
+                if self._parsed[rtype]:
+                    fields = [(name, start-1, end) for (name, start, end) in recordOffsets[rtype]]
+                    with self._timer.phase(f'slice.{rinfo["name"]}', len(self._parsed[rtype])):
+                        columns = decodeFields(self._parsed[rtype], fields, codec)
+                else:
+                    columns = {}
+                with self._timer.phase(f'frame.{rinfo["name"]}', len(self._parsed[rtype])):
+                    setattr(self, rinfo['df'], pd.DataFrame(columns))
+                self._parsed[rtype] = []  # the records are in the frame now
 
         # We need the correlate anyways all the times so let's run it
         self.THREAD_COUNT -= 1
@@ -466,74 +546,178 @@ class RACF:
         rtype = RACF._recordname_type[rname]
         return self._records[rtype]['parsed'] if rtype in self._records else 0
         
+    def _indexFrame(self, rtype, rinfo):
+        """ set the index of the frame of record type rtype: profile key, connect group+user, or class+key (for G.R.) """
+        if "index" in rinfo:
+            keys = rinfo["index"]
+            names = [k.replace(rinfo["name"]+"_","_") for k in keys]
+        elif rtype[1]=="5":  # general resources
+            keys = [rinfo["name"]+"_CLASS_NAME",rinfo["name"]+"_NAME"]
+            names = ["_CLASS_NAME","_NAME"]
+        else:
+            keys = rinfo["name"]+"_NAME"
+            names = "_NAME"
+        if getattr(self,rinfo['df']).index.names!=names:  # reuse existing index for pickles
+            with self._timer.phase(f'correlate.index.{rinfo["name"]}', self._records[rtype]['parsed']):
+                getattr(self,rinfo['df']).set_index(keys,drop=False,inplace=True)
+                getattr(self,rinfo['df']).rename_axis(names,inplace=True)  # prevent ambiguous index / column names 
+                getattr(self,rinfo['df']).attrs.pop('sorted',None)
+        # lexsorted index for fast .loc slices and pfilter( ), the flag is saved in pickles so loading doesn't sort again
+        if not getattr(self,rinfo['df']).attrs.get('sorted'):
+            with self._timer.phase(f'correlate.sort.{rinfo["name"]}', self._records[rtype]['parsed']):
+                if not getattr(self,rinfo['df']).index.is_monotonic_increasing:
+                    getattr(self,rinfo['df']).sort_index(kind='stable',inplace=True)
+                getattr(self,rinfo['df']).attrs['sorted'] = True
+        bindCache(getattr(self,rinfo['df']), self._cache)
+
+    def _publishFrame(self, rinfo):
+        """ make the frame available under the name in its publisher """
+        if 'publisher' in rinfo:
+            publisher = rinfo['publisher'] if rinfo['publisher']!='*' else rinfo['df'].lstrip('_')
+            if hasattr(self, rinfo['df']):
+                setattr(self, publisher, getattr(self, rinfo['df']))
+            else:
+                setattr(self, publisher, lambda x: warnings.warn(f"{publisher} has not been collected."))
+
+    def __getattr__(self, name):
+        """ frames of lazy record types, and artifacts that _correlate did not make, are built when they are first used """
+        if name in RACF._deferredArtifacts:
+            if self.__dict__.get('_state') not in (RACF.STATE_CORRELATING, RACF.STATE_READY):
+                return None  # no frames yet
+            with self._lazyLock:
+                if name not in self.__dict__:
+                    getattr(self, RACF._deferredArtifacts[name])()
+            return self.__dict__[name]
+        rtype = self.__dict__.get('_lazyFrames', {}).get(name)
+        if rtype is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        self._materialize(rtype)
+        return getattr(self, name)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self.__dict__.get('_lazyFrames', {})) | set(RACF._deferredArtifacts))
+
+    def _materialize(self, rtype):
+        """ build, index and publish the frame of a lazy record type, from the records kept by parse_t or from its pickle """
+        from .schema import recordOffsets
+        rinfo = RACF._recordtype_info[rtype]
+        with self._lazyLock:
+            if rinfo['df'] not in self._lazyFrames:
+                return  # another thread was first
+            if rtype in self._lazySources:
+                from . import snapshot
+                try:
+                    frames = snapshot.loadFrames({rinfo['name']: self._lazySources[rtype]}, timer=self._timer)
+                except ValueError as e:
+                    raise StoopidException(f'Cannot load {rinfo["df"]} on first use, was the snapshot saved again meanwhile? {e}')
+                setattr(self, rinfo['df'], frames[rinfo['name']])
+                del self._lazySources[rtype]
+            else:
+                fields = [(name, start-1, end) for (name, start, end) in recordOffsets[rtype]]
+                with self._timer.phase(f'slice.{rinfo["name"]}', len(self._parsed[rtype])):
+                    columns = decodeFields(self._parsed[rtype], fields, self._unload.encoding)
+                with self._timer.phase(f'frame.{rinfo["name"]}', len(self._parsed[rtype])):
+                    setattr(self, rinfo['df'], pd.DataFrame(columns))
+                self._parsed[rtype] = []
+            self._indexFrame(rtype, rinfo)
+            self._publishFrame(rinfo)
+            self._lazyFrames = {n: t for (n, t) in self._lazyFrames.items() if t != rtype}
+
     def _correlate(self, thingswewant=_recordtype_info.keys()):
-        """ construct tables that combine the raw dataframes for improved processing """
-        
+        """ construct tables that combine the raw dataframes for improved processing.
+        The steps are stages in a StageGraph, stages that don't depend on each other run concurrently on
+        self._threads threads.  With RACF(artifacts=[...]) only those derived stages run, see correlateStages. """
+        graph = StageGraph(self._timer, prefix='correlate.')
+
         # use the table definitions in _recordtype_info finalize the dfs:
         # set consistent index columns for existing dfs: profile key, connect group+user, of profile class+key (for G.R.)
         # define properties to access the dfs, in addition to the properties defined as functions below
         for (rtype,rinfo) in RACF._recordtype_info.items():
+            if rinfo['df'] in self._lazyFrames:
+                continue  # indexed and published when the frame is first used
             if rtype in thingswewant and rtype in self._records and self._records[rtype]['parsed']>0:
-                if "index" in rinfo:
-                    keys = rinfo["index"]
-                    names = [k.replace(rinfo["name"]+"_","_") for k in keys]
-                elif rtype[1]=="5":  # general resources
-                    keys = [rinfo["name"]+"_CLASS_NAME",rinfo["name"]+"_NAME"]
-                    names = ["_CLASS_NAME","_NAME"]
-                else:
-                    keys = rinfo["name"]+"_NAME"
-                    names = "_NAME"
-                if getattr(self,rinfo['df']).index.names!=names:  # reuse existing index for pickles
-                    getattr(self,rinfo['df']).set_index(keys,drop=False,inplace=True)
-                    getattr(self,rinfo['df']).rename_axis(names,inplace=True)  # prevent ambiguous index / column names 
-            if 'publisher' in rinfo:
-                publisher = rinfo['publisher'] if rinfo['publisher']!='*' else rinfo['df'].lstrip('_')
-                if hasattr(self, rinfo['df']):
-                    setattr(self, publisher, getattr(self, rinfo['df']))
-                else:
-                    setattr(self, publisher, lambda x: warnings.warn(f"{publisher} has not been collected."))
-
+                graph.add(f'setup.{rinfo["name"]}', lambda rtype=rtype, rinfo=rinfo: self._indexFrame(rtype, rinfo), timed=False)
+            self._publishFrame(rinfo)
 
-        # copy group auth (USE,CREATE,CONNECT,JOIN) to complete the connectData list, using index alignment
         if self.parsed("GPBD") > 0 and self.parsed("GPMEM") > 0 and self.parsed("USCON") > 0:
-            self._connectData["GPMEM_AUTH"] = self._connects["GPMEM_AUTH"]
-
-        # copy ID(*) access into resource frames, similar to UACC: IDSTAR_ACCESS and ALL_USER_ACCESS
+            graph.add('connectAuth', self._correlateConnectAuth, after=['setup.GPMEM','setup.USCON'])
         if self.parsed("DSBD") > 0 and self.parsed("DSACC") > 0 and 'IDSTAR_ACCESS' not in self._datasets.columns:
-            uaccs = pd.DataFrame()
-            uaccs["UACC_NUM"] = self._datasets["DSBD_UACC"].map(RACF.accessKeywords.index)
-            uaccs["IDSTAR_ACCESS"] = self._datasetAccess.reindex(['*'],level=1,axis=0).droplevel([1,2])['DSACC_ACCESS']
-            uaccs["IDSTAR_ACCESS"] = uaccs["IDSTAR_ACCESS"].fillna(' ')
-            uaccs["IDSTAR_NUM"] = uaccs["IDSTAR_ACCESS"].map(RACF.accessKeywords.index)
-            uaccs["ALL_USER_NUM"] = uaccs[["IDSTAR_NUM","UACC_NUM"]].max(axis=1)
-            uaccs["ALL_USER_ACCESS"] = uaccs['ALL_USER_NUM'].map(RACF.accessKeywords.__getitem__)
-            column = self._datasets.columns.to_list().index('DSBD_UACC')
-            self._datasets.insert(column+1,"IDSTAR_ACCESS",uaccs["IDSTAR_ACCESS"])
-            self._datasets.insert(column+2,"ALL_USER_ACCESS",uaccs["ALL_USER_ACCESS"])
-            del uaccs
-        
+            graph.add('idstar.DSBD', self._correlateIdstarDatasets, after=['setup.DSBD','setup.DSACC'])
         if self.parsed("GRBD") > 0 and self.parsed("GRACC") > 0 and 'IDSTAR_ACCESS' not in self._generals.columns:
-            uaccs = pd.DataFrame()
-            uaccs["UACC"] = self._generals["GRBD_UACC"]
-            uaccs["UACC"] = uaccs["UACC"].where(uaccs["UACC"].isin(RACF.accessKeywords),other=' ')  # DIGTCERT fields may be distorted
-            uaccs["UACC_NUM"] = uaccs["UACC"].map(RACF.accessKeywords.index)
-            uaccs["IDSTAR_ACCESS"] = self._generalAccess.reindex(['*'],level=2,axis=0).droplevel([2,3]).drop_duplicates(['GRACC_CLASS_NAME','GRACC_NAME','GRACC_ACCESS'])['GRACC_ACCESS']
-            uaccs["IDSTAR_ACCESS"] = uaccs["IDSTAR_ACCESS"].fillna(' ')
-            uaccs["IDSTAR_NUM"] = uaccs["IDSTAR_ACCESS"].map(RACF.accessKeywords.index)
-            uaccs["ALL_USER_NUM"] = uaccs[["IDSTAR_NUM","UACC_NUM"]].max(axis=1)
-            uaccs["ALL_USER_ACCESS"] = uaccs['ALL_USER_NUM'].map(RACF.accessKeywords.__getitem__)
-            column = self._generals.columns.to_list().index('GRBD_UACC')
-            self._generals.insert(column+1,"IDSTAR_ACCESS",uaccs["IDSTAR_ACCESS"])
-            self._generals.insert(column+2,"ALL_USER_ACCESS",uaccs["ALL_USER_ACCESS"])
-            del uaccs
-        
-        # self._connectByUser = self._connectData.set_index("USCON_NAME",drop=False).rename_axis('NAME')
-        # self._connectByGroup = self._connectData.set_index("USCON_GRP_ID",drop=False).rename_axis('GRP_ID')
-            
+            graph.add('idstar.GRBD', self._correlateIdstarGenerals, after=['setup.GRBD','setup.GRACC'])
+        graph.add('ownertree', self._correlateOwnertree, after=['setup.GPBD'])
+        graph.add('grouptree', self._correlateGrouptree, after=['setup.GPBD'])
+        graph.add('grouptreeLines', self._correlateGrouptreeLines, after=['setup.GPBD'])
+        graph.add('ownertreeLines', self._correlateOwnertreeLines, after=['setup.GPBD'])
+        if '_userOMVS' not in self._lazyFrames and '_groupOMVS' not in self._lazyFrames:  # otherwise built on first use
+            graph.add('omvsIds', self._correlateOmvsIds, after=['setup.USOMVS','setup.GPOMVS'])
+        if not any(RACF._recordname_df[rname] in self._lazyFrames for rname in ['USCSD','GPCSD','DSCSD','GRCSD','GRCFDEF']):
+            graph.add('customFields', self._correlateCustomFields, after=['setup.USCSD','setup.GPCSD','setup.DSCSD','setup.GRCSD','setup.GRCFDEF'])
+        # hash indexes for the frames used most in single profile lookups, others are built on first use
+        graph.add('profileIndex', self._correlateProfileIndex, after=[name for name in graph.stages if name.startswith('setup.')])
+
+        if self._artifacts is None:
+            wanted = None
+        else:
+            unknown = set(self._artifacts)-set(RACF.correlateStages)
+            if unknown:
+                raise StoopidException(f'Unknown artifacts {",".join(sorted(unknown))}, use {",".join(RACF.correlateStages)}')
+            wanted = [name for name in graph.stages if name.startswith('setup.')] + RACF._columnStages + list(self._artifacts) + ['profileIndex']
+        self._profileIndex.clear()
+        with self._timer.phase('correlate'):
+            graph.run(wanted, threads=self._threads)
+
+        # frames have been modified in place, views derived before this point are obsolete
+        self.clear_cache()
+
+    # derived artifacts that _correlate can make, RACF(artifacts=[...]) selects some of them.
+    # Artifacts that were not selected are made when they are first used.  The _columnStages add columns to connectData,
+    # datasets and generals that acl( ) and the reports need, they always run.
+    correlateStages = ['connectAuth','idstar.DSBD','idstar.GRBD','ownertree','grouptree','grouptreeLines','ownertreeLines','omvsIds','customFields']
+    _columnStages = ['connectAuth','idstar.DSBD','idstar.GRBD']
+    _deferredArtifacts = {'_grouptreeLines': '_correlateGrouptreeLines', '_ownertreeLines': '_correlateOwnertreeLines'}
+
+    def _correlateConnectAuth(self):
+        # copy group auth (USE,CREATE,CONNECT,JOIN) to complete the connectData list, using index alignment
+        self._connectData["GPMEM_AUTH"] = self._connects["GPMEM_AUTH"]
+
+    def _correlateIdstarDatasets(self):
+        # copy ID(*) access into resource frames, similar to UACC: IDSTAR_ACCESS and ALL_USER_ACCESS
+        uaccs = pd.DataFrame()
+        uaccs["UACC_NUM"] = self._datasets["DSBD_UACC"].map(RACF.accessKeywords.index)
+        uaccs["IDSTAR_ACCESS"] = self._datasetAccess.reindex(['*'],level=1,axis=0).droplevel([1,2])['DSACC_ACCESS']
+        uaccs["IDSTAR_ACCESS"] = uaccs["IDSTAR_ACCESS"].fillna(' ')
+        uaccs["IDSTAR_NUM"] = uaccs["IDSTAR_ACCESS"].map(RACF.accessKeywords.index)
+        uaccs["ALL_USER_NUM"] = uaccs[["IDSTAR_NUM","UACC_NUM"]].max(axis=1)
+        uaccs["ALL_USER_ACCESS"] = uaccs['ALL_USER_NUM'].map(RACF.accessKeywords.__getitem__)
+        column = self._datasets.columns.to_list().index('DSBD_UACC')
+        self._datasets.insert(column+1,"IDSTAR_ACCESS",uaccs["IDSTAR_ACCESS"])
+        self._datasets.insert(column+2,"ALL_USER_ACCESS",uaccs["ALL_USER_ACCESS"])
+        del uaccs
+
+    def _correlateIdstarGenerals(self):
+        uaccs = pd.DataFrame()
+        uaccs["UACC"] = self._generals["GRBD_UACC"]
+        uaccs["UACC"] = uaccs["UACC"].where(uaccs["UACC"].isin(RACF.accessKeywords),other=' ')  # DIGTCERT fields may be distorted
+        uaccs["UACC_NUM"] = uaccs["UACC"].map(RACF.accessKeywords.index)
+        uaccs["IDSTAR_ACCESS"] = self._generalAccess.reindex(['*'],level=2,axis=0).droplevel([2,3]).drop_duplicates(['GRACC_CLASS_NAME','GRACC_NAME','GRACC_ACCESS'])['GRACC_ACCESS']
+        uaccs["IDSTAR_ACCESS"] = uaccs["IDSTAR_ACCESS"].fillna(' ')
+        uaccs["IDSTAR_NUM"] = uaccs["IDSTAR_ACCESS"].map(RACF.accessKeywords.index)
+        uaccs["ALL_USER_NUM"] = uaccs[["IDSTAR_NUM","UACC_NUM"]].max(axis=1)
+        uaccs["ALL_USER_ACCESS"] = uaccs['ALL_USER_NUM'].map(RACF.accessKeywords.__getitem__)
+        column = self._generals.columns.to_list().index('GRBD_UACC')
+        self._generals.insert(column+1,"IDSTAR_ACCESS",uaccs["IDSTAR_ACCESS"])
+        self._generals.insert(column+2,"ALL_USER_ACCESS",uaccs["ALL_USER_ACCESS"])
+        del uaccs
+
+    def _correlateOwnertree(self):
         # dicts containing lists of groups for printing group structure
         self._ownertree = self.ownertree
+
+    def _correlateGrouptree(self):
         self._grouptree = self.grouptree
 
+    def _correlateGrouptreeLines(self):
         # self._grouptreeLines: frame of group + name of all superior groups until SYS1
         gtl = self._groups[['GPBD_NAME','GPBD_SUPGRP_ID']]
         gtlLen = 0
@@ -546,8 +730,10 @@ class RACF:
             gtl=pd.concat([gtl,nextup],ignore_index=True,sort=False)
         self._grouptreeLines = gtl.rename(columns={'GPBD_NAME':'GROUP','GPBD_SUPGRP_ID':'PARENTS'})\
                                   .set_index("GROUP",drop=False)\
-                                  .rename_axis('GROUP_NAME')
-        
+                                  .rename_axis('GROUP_NAME')\
+                                  .sort_index(kind='stable')
+
+    def _correlateOwnertreeLines(self):
         # self._ownertreeLines: frame of group + name of all owners (group or user) until SYS1 or user ID found
         otl=self._groups[['GPBD_NAME','GPBD_SUPGRP_ID','GPBD_OWNER_ID']]
         otlLen = 0
@@ -561,9 +747,22 @@ class RACF:
         self._ownertreeLines = otl.drop('GPBD_SUPGRP_ID',axis=1)\
                                   .rename(columns={'GPBD_NAME':'GROUP','GPBD_OWNER_ID':'OWNER_IDS'})\
                                   .set_index("GROUP",drop=False)\
-                                  .rename_axis('GROUP_NAME')
+                                  .rename_axis('GROUP_NAME')\
+                                  .sort_index(kind='stable')
+
+    def _correlateOmvsIds(self):
+        # self._uidIndex and self._gidIndex: user IDs and groups by integer UID and GID
+        (self._uidIndex, self._gidIndex) = (None, None)
+        self.uidIndex, self.gidIndex  # the properties build them
+
+    def _correlateCustomFields(self):
+        # self._customFields: the CSDATA segments as one typed column per custom field
+        self._customFields = {entity: self._customFieldFrame(entity) for entity in RACF._customFieldRecords}
+
+    def _correlateProfileIndex(self):
+        for df in [self._users, self._groups, self._datasets, self._generals, self._connectData]:
+            self._profileIndex.get(df)
 
-        
     def save_pickle(self, df='', dfname='', path='', prefix=''):
         # Sanity check
         if self._state != self.STATE_READY:
@@ -572,23 +771,82 @@ class RACF:
         df.to_pickle(f'{path}/{prefix}{dfname}.pickle')
 
 
-    def save_pickles(self, path='/tmp', prefix=''):
+    def _snapshotFrames(self):
+        """ {record name: frame} of the record types that have records, as saved in pickles and snapshots """
+        frames = {}
+        for (rtype,rinfo) in RACF._recordtype_info.items():
+            if rtype in self._records and self._records[rtype]['parsed']>0:
+                frames[rinfo['name']] = getattr(self, rinfo['df'])
+        return frames
+
+    def save_pickles(self, path='/tmp', prefix='', compression=None, threads=None):
+        ''' save the frames as pickles with a manifest ({prefix}manifest.json), written on threads threads (default as given to RACF).
+        compression is None, 'gzip', 'bz2', 'xz' or 'zstd'.  Pickles of record types without records, left by an earlier
+        save with the same prefix, are removed.  Returns the manifest. '''
         # Sanity check
         if self._state != self.STATE_READY:
             raise StoopidException('Not done parsing yet! (PEBKAM/ID-10T error)')
-        # Is Path there ?
-        if not os.path.exists(path):
-            madedir = os.system(f'mkdir -p {path}')
-            if madedir != 0:
-                raise StoopidException(f'{path} does not exist, and cannot create')
-        # Let's save the pickles
+        from . import snapshot
+        try:
+            return snapshot.saveFrames(self._snapshotFrames(), path, prefix, compression=compression, threads=threads or self._threads,
+                                       names=RACF._recordname_type, timer=self._timer, source=getattr(self, '_irrdbu00', None))
+        except OSError as e:
+            raise StoopidException(f'Cannot save pickles in {path}: {e}')
+        except ValueError as e:
+            raise StoopidException(str(e))
+
+
+    def save_sqlite(self, fileName='pyracf.sqlite'):
+        ''' write all frames to an SQLite database, in tables named after the record types (USBD, DSACC, ...) with SQL indexes
+        on the index fields, and the group and owner tree lines in tables grouptreeLines and ownertreeLines. '''
+        if self._state != self.STATE_READY:
+            raise StoopidException('Not done parsing yet! (PEBKAM/ID-10T error)')
+        frames = {}
         for (rtype,rinfo) in RACF._recordtype_info.items():
             if rtype in self._records and self._records[rtype]['parsed']>0:
-                self.save_pickle(df=getattr(self, rinfo['df']), dfname=rinfo['name'], path=path, prefix=prefix)
-            else:
-                # TODO: ensure consistent data, delete old pickles that were not saved
-                pass
+                df = getattr(self, rinfo['df'])
+                frames[rinfo['name']] = (df, [rinfo['name']+n for n in df.index.names if n])
+        for tree in ['_grouptreeLines','_ownertreeLines']:
+            if getattr(self, tree) is not None:
+                frames[tree.lstrip('_')] = (getattr(self, tree), ['GROUP'])
+        with self._timer.phase('save.sqlite', sum(len(df) for (df,_) in frames.values())):
+            sqlstore.export(frames, fileName)
+        self._sqlite = fileName
+        return fileName
+
+    def sql(self, query, params=None):
+        ''' result of an SQL query on the frames as a DataFrame, e.g. sql("select USBD_NAME from USBD where USBD_SPECIAL='YES'").
+        Uses the database written by save_sqlite( ), or writes one to a temporary file on first use.
+        Run save_sqlite( ) again after frames have been changed. '''
+        if not self._sqlite or not os.path.exists(self._sqlite):
+            workdir = tempfile.mkdtemp(prefix='pyracf-')
+            weakref.finalize(self, shutil.rmtree, workdir, True)
+            self.save_sqlite(os.path.join(workdir, 'pyracf.sqlite'))
+        return sqlstore.query(self._sqlite, query, params)
+
+    def overlay(self):
+        ''' Overlay to try PERMIT, CONNECT, REMOVE and owner changes and compare access before and after, see pyracf.overlay '''
+        if self._state != self.STATE_READY:
+            raise StoopidException('Not done parsing yet! (PEBKAM/ID-10T error)')
+        from .overlay import Overlay
+        return Overlay(self)
+
+    def share(self, frames=('_datasetAccess','_generalAccess','_connectData')):
+        ''' publish frames (attribute names) in shared memory, attach(shared.handle) in other processes returns them
+        without a copy.  Call close( ) on the result when the workers are done. '''
+        if self._state != self.STATE_READY:
+            raise StoopidException('Not done parsing yet! (PEBKAM/ID-10T error)')
+        from . import sharedframes
+        return sharedframes.SharedFrames({f: getattr(self, f) for f in frames})
 
+    def map_partitions(self, func, frame='_datasetAccess', frames=('_datasetAccess','_generalAccess','_connectData'), n=None, processes=None):
+        ''' list with func(partition, frames) for partitions of frame, rows of one profile are in the same partition.
+        func runs in a process pool on frames attached from shared memory, it must be a module level function. '''
+        if self._state != self.STATE_READY:
+            raise StoopidException('Not done parsing yet! (PEBKAM/ID-10T error)')
+        frames = {f: getattr(self, f) for f in dict.fromkeys([frame, *frames])}
+        from . import sharedframes
+        return sharedframes.mapPartitions(func, frames, frame, n=n, processes=processes)
 
     def _generic2regex(selection, lenient='%&*'):
         ''' Change a RACF generic pattern into regex to match with text strings in pandas cells.  use lenient="" to match with dsnames/resources '''
@@ -615,6 +873,18 @@ class RACF:
         if not selection:
             raise StoopidException('profile criteria not specified...')
         if option in (None,'LIST','L'):  # return 1 profile
+            # complete key: use the hash index, much faster than .loc on a non-unique or unsorted index
+            if (type(selection)==str and df.index.nlevels==1)\
+               or (type(selection)==tuple and df.index.nlevels==len(selection) and not any([s in (None,'**') for s in selection])):
+                positions = self._profileIndex.get(df).positions(selection)
+                if not option:  # df with all the original columns, also when nothing was found
+                    return df.iloc[positions]
+                elif len(positions)==0:
+                    return []
+                elif type(selection)==str and len(positions)==1:  # Series for 1 row, like .loc with a unique key
+                    return df.iloc[positions[0]]
+                else:  # tuple keys select with a list, like .loc[[key]]: always a df
+                    return df.iloc[positions]
             # 1 string, several strings in a tuple, or a mix of strings and None
             if type(selection)==str and not option:
                 selection = [selection]  # [] forces return of a df, not a Series
@@ -636,6 +906,7 @@ class RACF:
             raise StoopidException(f'unexpected last parameter {option}')
 
 
+    @cachedFilter
     def gfilter(df, *selection):
         ''' Search profiles using GENERIC pattern on the index fields.  selection can be one or more values, corresponding to index levels of the df '''
         locs = pd.array([True]*df.shape[0])
@@ -647,6 +918,7 @@ class RACF:
                     locs &= (df.index.get_level_values(s).str.match(RACF._generic2regex(selection[s])))
         return df.loc[locs]
 
+    @cachedFilter
     def rfilter(df, *selection):
         ''' Search profiles using refex on the index fields.  selection can be one or more values, corresponding to index levels of the df '''
         locs = pd.array([True]*df.shape[0])
@@ -655,11 +927,119 @@ class RACF:
                 locs &= (df.index.get_level_values(s).str.match(selection[s]))
         return df.loc[locs]
 
+    @cachedFilter
+    def pfilter(df, *selection):
+        ''' Search profiles by prefix on the index fields: the last value is a prefix, values before it must match the index levels exactly,
+        e.g. datasets.pfilter('SYS1.') or generals.pfilter('FACILITY','BPX.').  Sorted indexes use binary search, O(log n + k). '''
+        *exact, prefix = selection if selection else ('',)
+        if not prefix and not exact:
+            return df
+        index = df.index
+        if index.is_monotonic_increasing:
+            # rows from the first key >= prefix to the first key >= prefix with the last character incremented
+            upper = prefix[:-1]+chr(ord(prefix[-1])+1) if prefix else None
+            if index.nlevels==1:
+                start = index.searchsorted(prefix,'left')
+                stop = index.searchsorted(upper,'left') if upper else len(index)
+            else:
+                start = index.get_slice_bound(tuple(exact)+(prefix,),'left')
+                stop = index.get_slice_bound(tuple(exact)+(upper,) if upper else tuple(exact),'left' if upper else 'right')
+            return df.iloc[start:stop]
+        else:
+            locs = index.get_level_values(len(exact)).str.startswith(prefix)
+            for (level,value) in enumerate(exact):
+                locs &= index.get_level_values(level)==value
+            return df.loc[locs]
+
+    @cachedFilter
+    def when(df, catype=None, caname=None):
+        ''' Select conditional permits on the WHEN condition, e.g. datasetConditionalAccess.when('PROGRAM','IKJEFT01') or
+        generalConditionalAccess.when('TERMINAL',['TRM001','TRM002']).  A permit for a generic CANAME matches the names it covers.
+        Follow with acl(resolve=True) to get the conditional access of each user through these permits.  Standard permits and
+        UACC are not added, and generic and specific CANAME permits are listed together, not resolved against each other. '''
+        tbName = df.columns[0].split('_')[0]
+        if tbName not in ["DSCACC","GRCACC"]:
+            raise StoopidException(f'Table {tbName} not supported for when( ), except DSCACC or GRCACC.')
+        index = cacheOf(df).get(('ConditionIndex',), [df], lambda: ConditionIndex(df, RACF._generic2regex))
+        return df.iloc[index.positions(catype, caname)]
+
+    # custom fields
+
+    # entity in CFDEF profile names -> CSDATA record name
+    _customFieldRecords = {'USER':'USCSD', 'GROUP':'GPCSD', 'DATASET':'DSCSD', 'GENERAL':'GRCSD'}
+
+    def _customFieldTypes(self, entity):
+        ''' dict from custom field name to the TYPE in its CFDEF profile (CHAR, FLAG, HEX or NUM), for the fields of entity '''
+        if self.parsed("GRCFDEF")==0:
+            return {}
+        cfdef = self._generalCFDEF
+        (entities, fields) = (cfdef["GRCFDEF_NAME"].str.split('.', n=1).str[0], cfdef["GRCFDEF_NAME"].str.split('.', n=1).str[1])
+        return dict(zip(fields.loc[entities==entity], cfdef["GRCFDEF_TYPE"].loc[entities==entity]))
+
+    @staticmethod
+    def _customFieldValues(values, ftype):
+        ''' values of a custom field typed by its CFDEF type: NUM as Int64, FLAG as boolean, CHAR and HEX as str '''
+        if ftype=="NUM":
+            numbers = pd.to_numeric(values, errors='coerce')
+            return numbers.astype('Int64') if (numbers.dropna()%1==0).all() else numbers
+        if ftype=="FLAG":
+            return values.map({'YES':True,'NO':False}).astype('boolean')
+        return values
+
+    def _customFieldFrame(self, entity):
+        ''' wide frame with one column per custom field of entity, indexed like the profile frame, from the long CSDATA frame.
+        Fields are typed by their CFDEF definition, or by the TYPE in the CSDATA record when there is no CFDEF profile. '''
+        rname = RACF._customFieldRecords[entity]
+        if self.parsed(rname)==0:
+            return pd.DataFrame()
+        df = getattr(self, RACF._recordname_df[rname])
+        types = self._customFieldTypes(entity)
+        (rows, profiles) = pd.factorize(df.index)
+        (keys, fields) = pd.factorize(df[f"{rname}_KEY"])
+        columns = {}
+        for (k, field) in sorted(enumerate(fields), key=lambda f: f[1]):
+            selected = keys==k
+            values = pd.Series(df[f"{rname}_VALUE"].to_numpy()[selected], index=rows[selected])
+            values = values.loc[~values.index.duplicated(keep='last')]
+            ftype = types.get(field, df[f"{rname}_TYPE"].to_numpy()[selected][0])
+            columns[field] = RACF._customFieldValues(values, ftype).reindex(range(len(profiles)))
+        profiles = pd.Index(profiles, name=df.index.name) if df.index.nlevels==1 else pd.MultiIndex.from_tuples(profiles, names=df.index.names)
+        return pd.DataFrame({field: values.array for (field, values) in columns.items()}, index=profiles).sort_index()
+
+    def _customFieldsOf(self, entity):
+        if self._customFields is None or entity not in self._customFields:  # not built by _correlate (artifacts, or lazy frames)
+            self._customFields = {**(self._customFields or {}), entity: self._customFieldFrame(entity)}
+        return self._customFields[entity]
+
+    @property
+    def userCustomFields(self):
+        ''' one typed column per custom field (CSDATA) of the users, indexed like users, e.g. mysys.users.join(mysys.userCustomFields) '''
+        return self._customFieldsOf('USER')
+
+    @property
+    def groupCustomFields(self):
+        ''' one typed column per custom field (CSDATA) of the groups, indexed like groups '''
+        return self._customFieldsOf('GROUP')
+
+    @property
+    def datasetCustomFields(self):
+        ''' one typed column per custom field (CSDATA) of the data set profiles, indexed like datasets '''
+        return self._customFieldsOf('DATASET')
+
+    @property
+    def generalCustomFields(self):
+        ''' one typed column per custom field (CSDATA) of the general resource profiles, indexed like generals '''
+        return self._customFieldsOf('GENERAL')
+
     # user frames
 
     def user(self, userid=None, pattern=None):
         return self._giveMeProfiles(self._users, userid, pattern)
 
+    def users_many(self, userids, frame=False):
+        ''' look up many user IDs at once: list of records (namedtuples with USBD fields, None for unknown IDs) in the order of userids, or one frame with frame=True '''
+        return self._profileIndex.get(self._users).lookup(userids, frame)
+
     def connect(self, group=None, userid=None, pattern=None):
         ''' connect('SYS1') returns 1 index level with user IDs, connect(None,'IBMUSER') returns 1 index level with group names '''
         if pattern=='L' or pattern=='LIST':
@@ -696,32 +1076,251 @@ class RACF:
 
 
     @property
+    @cachedView('_users')
     def specials(self):
         return self._users.loc[self._users['USBD_SPECIAL'] == 'YES']
 
     @property
+    @cachedView('_users')
     def operations(self):
         return self._users.loc[self._users['USBD_OPER'] == 'YES']
 
     @property
+    @cachedView('_users')
     def auditors(self):
         return self._users.loc[self._users['USBD_AUDITOR'] == 'YES']
 
     @property
+    @cachedView('_users')
     def revoked(self):
         return self._users.loc[self._users['USBD_REVOKE'] == 'YES']
 
+    @staticmethod
+    def _parseDates(values):
+        ''' datetime64 array of YYYY-MM-DD strings, NaT for blank or invalid dates, each distinct date is parsed once '''
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+        dates = pd.to_datetime(pd.Index(uniques, dtype=object), format='%Y-%m-%d', errors='coerce').to_numpy(dtype='datetime64[ns]')
+        return np.where(codes>=0, dates[codes] if len(dates) else np.datetime64('NaT','ns'), np.datetime64('NaT','ns'))
+
+    @cachedView('_users','_connectData')
+    def _connectUsers(self):
+        ''' position in users of the user ID of each connect in connectData, -1 for IDs that are not in users '''
+        return self._users.index.get_indexer(self._connectData.index.get_level_values(1))
+
+    @cachedView('_users','_connectData')
+    def _userDates(self):
+        ''' dates of each user as datetime64, indexed like users: CREATE, LASTJOB, LASTCON (latest connect), LAST_USE (the later
+        of LASTJOB and LASTCON), PWD, PHR, REVOKE and RESUME '''
+        users = self._users
+        dates = pd.DataFrame({field: RACF._parseDates(users[f"USBD_{field}_DATE"]) for field in ["CREATE","LASTJOB","PWD","PHR","REVOKE","RESUME"]},
+                             index=users.index)
+        # latest connect of each user, NaT is the lowest datetime64 so it loses from any date
+        lastcon = np.full(len(users), np.datetime64('NaT','ns'))
+        if self.parsed("USCON")>0:
+            positions = self._connectUsers()
+            connected = positions>=0
+            np.maximum.at(lastcon.view('i8'), positions[connected], RACF._parseDates(self._connectData["USCON_LASTCON_DATE"]).view('i8')[connected])
+        dates["LASTCON"] = lastcon
+        dates["LAST_USE"] = dates["LASTJOB"].where(~(dates["LASTCON"]>dates["LASTJOB"]) & dates["LASTJOB"].notna(), dates["LASTCON"])
+        return dates
+
+    @staticmethod
+    def _bucket(days, buckets):
+        ''' categorical with the age bucket of each number of days (0-29, 30-89, ..., 365+), never for missing dates '''
+        labels = [f"{lo}-{hi-1}" for (lo,hi) in zip((0,)+buckets, buckets)] + [f"{buckets[-1]}+", "never"]
+        codes = np.searchsorted(np.asarray(buckets), days, side='right')
+        codes[np.isnan(days)] = len(labels)-1
+        return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+    def user_lifecycle(self, asof=None, dormant=90, buckets=(30,90,180,365)):
+        ''' one row per user with the last use (last logon/job, or last connect to a group), password and phrase date, their age in
+        days and age bucket on date asof (default today), REVOKED, PROTECTED (no password and no phrase), the system and group
+        SPECIAL and OPERATIONS authority (GRP_SPECIAL, GRP_OPERATIONS: number of groups), DORMANT (not used for dormant days or
+        never), and DORMANT_PRIVILEGED: dormant users that are not revoked and still have SPECIAL, OPERATIONS, group-SPECIAL or
+        group-OPERATIONS.  The dates are parsed once and cached, e.g. mysys.user_lifecycle().query('DORMANT_PRIVILEGED') '''
+        if self._state != self.STATE_READY:
+            raise StoopidException('Not done parsing yet! (PEBKAM/ID-10T error)')
+        asof = pd.Timestamp(asof if asof is not None else datetime.now()).normalize()
+        return self._userLifecycle(asof, dormant, tuple(buckets))
+
+    @cachedView('_users','_connectData')
+    def _userLifecycle(self, asof, dormant, buckets):
+        users = self._users
+        dates = self._userDates()
+        report = pd.DataFrame(index=users.index)
+        for (field, date) in [("LAST_USE","LAST_USE"),("PWD","PWD"),("PHR","PHR")]:
+            days = ((asof - dates[date]).to_numpy() / np.timedelta64(1,'D')).astype(float)
+            report[f"{field}_DATE"] = dates[date].to_numpy()
+            report[f"{field}_DAYS"] = days
+            report[f"{field}_BUCKET"] = RACF._bucket(days, buckets)
+        # revoked on the revoke date, until a resume date after it has passed
+        pendingRevoke = (dates["REVOKE"]<=asof) & ~((dates["RESUME"]>dates["REVOKE"]) & (dates["RESUME"]<=asof))
+        report["REVOKED"] = users["USBD_REVOKE"].eq("YES").to_numpy() | pendingRevoke.to_numpy()
+        report["PROTECTED"] = users["USBD_NOPWD"].eq("YES").to_numpy() & dates["PHR"].isna().to_numpy() & users["USBD_PWDENV_EXISTS"].ne("YES").to_numpy()
+        report["SPECIAL"] = users["USBD_SPECIAL"].eq("YES").to_numpy()
+        report["OPERATIONS"] = users["USBD_OPER"].eq("YES").to_numpy()
+        for (field, column) in [("GRP_SPECIAL","USCON_GRP_SPECIAL"),("GRP_OPERATIONS","USCON_GRP_OPER")]:
+            if self.parsed("USCON")>0:
+                positions = self._connectUsers()
+                report[field] = np.bincount(positions[self._connectData[column].eq("YES").to_numpy() & (positions>=0)], minlength=len(users))
+            else:
+                report[field] = 0
+        report["DORMANT"] = ~(report["LAST_USE_DAYS"]<dormant)
+        privileged = report["SPECIAL"] | report["OPERATIONS"] | report["GRP_SPECIAL"].gt(0) | report["GRP_OPERATIONS"].gt(0)
+        report["DORMANT_PRIVILEGED"] = report["DORMANT"] & privileged & ~report["REVOKED"]
+        return report
+
+
+    # z/OS UNIX UIDs and GIDs
+
+    @staticmethod
+    def _idFrame(df, column, idName, profileName):
+        ''' frame indexed by the integer id in column (UID or GID), sorted by id, with the profile that has it.  Blank ids are left out. '''
+        if df is None or df.empty:
+            return pd.DataFrame({profileName: pd.Series(dtype=object)}, index=pd.Index([], dtype='int64', name=idName))
+        ids = pd.to_numeric(df[column], errors='coerce').to_numpy()
+        assigned = ~np.isnan(ids)
+        return pd.DataFrame({profileName: df.index.get_level_values(0)[assigned]}, index=pd.Index(ids[assigned].astype('int64'), name=idName))\
+                 .sort_index(kind='stable')
+
+    @property
+    def uidIndex(self):
+        ''' user IDs (USER_ID) by integer UID, sorted by UID, built by _correlate or on first use '''
+        if self._uidIndex is None:
+            self._uidIndex = RACF._idFrame(self._userOMVS if self.parsed("USOMVS")>0 else None, 'USOMVS_UID', 'UID', 'USER_ID')
+        return self._uidIndex
+
+    @property
+    def gidIndex(self):
+        ''' groups (GROUP) by integer GID, sorted by GID, built by _correlate or on first use '''
+        if self._gidIndex is None:
+            self._gidIndex = RACF._idFrame(self._groupOMVS if self.parsed("GPOMVS")>0 else None, 'GPOMVS_GID', 'GID', 'GROUP')
+        return self._gidIndex
+
+    @cachedFilter
+    def _sharedIds(df):
+        ''' rows of a sorted id frame with an id that is used more than once, and COUNT, the number of rows with the id '''
+        (ids, first, counts) = np.unique(df.index.to_numpy(), return_index=True, return_counts=True)
+        counts = np.repeat(counts, counts)  # the count of each row, the index is sorted
+        return df.assign(COUNT=counts).loc[counts>1]
+
+    @property
+    def duplicateUIDs(self):
+        ''' UIDs that are shared by more than one user ID, with USER_ID and COUNT '''
+        return RACF._sharedIds(self.uidIndex)
+
+    @property
+    def duplicateGIDs(self):
+        ''' GIDs that are shared by more than one group, with GROUP and COUNT '''
+        return RACF._sharedIds(self.gidIndex)
+
+    def uid_users(self, uids):
+        ''' rows of uidIndex for one UID or a list of UIDs, e.g. uid_users(0) '''
+        index = self.uidIndex
+        if np.ndim(uids)==0:
+            return index.iloc[index.index.slice_indexer(int(uids), int(uids))]
+        return index.loc[index.index.isin([int(u) for u in uids])]
+
+    def gid_groups(self, gids):
+        ''' rows of gidIndex for one GID or a list of GIDs '''
+        index = self.gidIndex
+        if np.ndim(gids)==0:
+            return index.iloc[index.index.slice_indexer(int(gids), int(gids))]
+        return index.loc[index.index.isin([int(g) for g in gids])]
+
+    @property
+    def superusers(self):
+        ''' users with z/OS UNIX superuser authority: UID 0 (VIA UID(0)), or READ or higher on FACILITY BPX.SUPERUSER
+        (VIA BPX.SUPERUSER, AUTH_ID shows the user or group permit, * for ID(*), -uacc- for UACC), with their UID '''
+        if self._state != self.STATE_READY:
+            raise StoopidException('Not done parsing yet! (PEBKAM/ID-10T error)')
+        return self._superusers(self.uidIndex)
+
+    @cachedView('_generalAccess','_connectData','_groups','_generals')
+    def _superusers(self, uidIndex):
+        columns = ["USER_ID","UID","VIA","AUTH_ID","ACCESS"]
+        root = uidIndex.loc[uidIndex.index==0]
+        frames = [pd.DataFrame({"USER_ID":root["USER_ID"].to_numpy(), "VIA":"UID(0)", "AUTH_ID":" ", "ACCESS":" "})]
+        if self.parsed("GRACC")>0:
+            permits = self._generalAccess.pfilter('FACILITY','BPX.SUPERUSER')
+            permits = permits.loc[(permits.index.get_level_values(1)=='BPX.SUPERUSER')]
+            if len(permits):
+                acl = RACF.acl(self, permits, resolve=True, allows='READ')
+                frames.append(pd.DataFrame({"USER_ID":acl["USER_ID"].to_numpy(), "VIA":"BPX.SUPERUSER",
+                                            "AUTH_ID":acl["AUTH_ID"].to_numpy(), "ACCESS":acl["ACCESS"].to_numpy()}))
+        result = pd.concat(frames, ignore_index=True)
+        uids = pd.Series(uidIndex.index, index=uidIndex["USER_ID"].to_numpy())
+        uids = uids.loc[~uids.index.duplicated()]
+        result["UID"] = uids.reindex(result["USER_ID"]).astype("Int64").reset_index(drop=True)
+        return result[columns].sort_values(["USER_ID","VIA"], kind="stable").reset_index(drop=True)
 
     # group frames
 
     def group(self, group=None, pattern=None):
         return self._giveMeProfiles(self._groups, group, pattern)
 
+    def groups_many(self, groups, frame=False):
+        ''' look up many groups at once, see users_many '''
+        return self._profileIndex.get(self._groups).lookup(groups, frame)
+
     @property
+    @cachedView('_groups','_connectData')
     def groupsWithoutUsers(self):
         if self._state != self.STATE_READY:
             raise StoopidException('Not done parsing yet! (PEBKAM/ID-10T error)')
         return self._groups.loc[~self.groups.GPBD_NAME.isin(self._connectData.USCON_GRP_ID)]
+
+    @property
+    @cachedView('_generalMembers','_generalCDTINFO')
+    def groupingMembers(self):
+        ''' members of resource grouping profiles, indexed by the member class and name, with the GROUPING_CLASS and
+        GROUPING_NAME of the profiles that list them: groupingMembers.loc[('TCICSTRN','CEMT')] '''
+        return memberIndex(self._generalMembers, self._generalCDTINFO if self.parsed("GRCDT")>0 else None)
+
+    @property
+    def groupAdmins(self):
+        ''' users who can change the members of each group: ADMIN_ID with AUTHORITY (OWNER, GRPSPECIAL, CONNECT, JOIN)
+        VIA the group where the authority comes from.  Group special applies to groups owned by their superior group,
+        on the group and up the owner tree '''
+        return self._adminIndex()[0].copy()
+
+    def _adminIndex(self):
+        ''' frames indexed by group name with ADMIN_ID, AUTHORITY and VIA, computed once for acl(admin=True) and getdatasetrisk
+        groupAdmins: admins of groups in an access list
+        ownerSpecials: group specials on a group that owns a profile, or any group up its owner tree
+        Every admin query needs these, so they are kept on the object instead of in the LRU cache (where they could be
+        evicted, or not kept at all with cache=0), until _groups, _connectData or _ownertreeLines is replaced. '''
+        if self._state != self.STATE_READY:
+            raise StoopidException('Not done parsing yet! (PEBKAM/ID-10T error)')
+        sources = (self._groups, self._connectData, self._ownertreeLines)
+        (refs, index) = self._admins or ((), None)
+        if len(refs)==len(sources) and all(ref() is source for (ref, source) in zip(refs, sources)):
+            return index
+        groups = self._groups[["GPBD_OWNER_ID","GPBD_SUPGRP_ID"]]
+        groupMembers = self._connectData.droplevel(1)
+        adminColumns = ["ADMIN_ID","AUTHORITY","VIA"]
+
+        # group special on the group itself and on the groups up the owner tree
+        ownerTree = pd.concat([pd.DataFrame({"VIA":groups.index}, index=groups.index),
+                               self._ownertreeLines[["OWNER_IDS"]].rename({"OWNER_IDS":"VIA"},axis=1)])
+        ownerSpecials = pd.merge(ownerTree, groupMembers.loc[groupMembers["USCON_GRP_SPECIAL"]=="YES",["USCON_NAME"]],
+                                 how="inner", left_on="VIA", right_index=True)\
+                          .rename({"USCON_NAME":"ADMIN_ID"},axis=1)
+        ownerSpecials["AUTHORITY"] = "GRPSPECIAL"
+        ownerSpecials = ownerSpecials[adminColumns].rename_axis("GROUP").sort_index(kind='stable')
+
+        # owner of groups that are not owned by their superior group
+        owned = groups["GPBD_OWNER_ID"]!=groups["GPBD_SUPGRP_ID"]
+        groupOwners = pd.DataFrame({"ADMIN_ID":groups.loc[owned,"GPBD_OWNER_ID"], "AUTHORITY":"OWNER", "VIA":groups.index[owned]})
+
+        # CONNECT or JOIN authority on the group
+        groupAuth = groupMembers.loc[groupMembers["GPMEM_AUTH"].isin(["CONNECT","JOIN"]),["USCON_NAME","GPMEM_AUTH","USCON_GRP_ID"]]
+        groupAuth.columns = adminColumns
+
+        groupAdmins = pd.concat([groupOwners, ownerSpecials.loc[ownerSpecials.index.isin(groups.index[~owned])], groupAuth])\
+                        .rename_axis("GROUP").sort_index(kind='stable')
+        self._admins = (tuple(weakref.ref(source) if source is not None else (lambda: None) for source in sources), (groupAdmins, ownerSpecials))
+        return (groupAdmins, ownerSpecials)
     
 
     # dataset frames
@@ -729,6 +1328,10 @@ class RACF:
     def dataset(self, profile=None, pattern=None):
         return self._giveMeProfiles(self._datasets, profile, pattern)
 
+    def datasets_many(self, profiles, frame=False):
+        ''' look up many data set profiles at once, see users_many '''
+        return self._profileIndex.get(self._datasets).lookup(profiles, frame)
+
     def datasetConditionalPermit(self, profile=None, id=None, access=None, pattern=None):
         return self._giveMeProfiles(self._datasetConditionalAccess, (profile,id,access), pattern)
 
@@ -736,15 +1339,19 @@ class RACF:
         return self._giveMeProfiles(self._datasetAccess, (profile,id,access), pattern)
 
     @property
+    @cachedView('_datasets')
     def uacc_read_datasets(self):
         return self._datasets.loc[self._datasets.DSBD_UACC=="READ"]
     @property
+    @cachedView('_datasets')
     def uacc_update_datasets(self):
         return self._datasets.loc[self._datasets.DSBD_UACC=="UPDATE"]
     @property
+    @cachedView('_datasets')
     def uacc_control_datasets(self):
         return self._datasets.loc[self._datasets.DSBD_UACC=="CONTROL"]
     @property
+    @cachedView('_datasets')
     def uacc_alter_datasets(self):
         return self._datasets.loc[self._datasets.DSBD_UACC=="ALTER"]
 
@@ -763,6 +1370,10 @@ class RACF:
     def general(self, resclass=None, profile=None, pattern=None):
         return self._giveMeProfiles(self._generals, (resclass,profile), pattern)
 
+    def generals_many(self, profiles, frame=False):
+        ''' look up many general resource profiles at once, profiles is a list of (class, profile) tuples, see users_many '''
+        return self._profileIndex.get(self._generals).lookup(profiles, frame)
+
     @property
     def generalMembers(self, query=None):
         # retained here due to deprecated property definition
@@ -798,9 +1409,96 @@ class RACF:
         return self._giveMeProfiles(self._generalConditionalAccess, (resclass,profile,id,access), pattern)
 
     @property
+    @cachedView('_generalSSIGNON','_generals')
     def SSIGNON(self): # GRSIGN
         return self._generalSSIGNON.join(self._generals['GRBD_APPL_DATA'])
 
+    # certificates and key rings
+
+    @staticmethod
+    def _parseTimestamps(dates, times):
+        ''' datetime64 array of YYYY-MM-DD dates and HH:MM:SS times, a blank or invalid time counts as 00:00:00 '''
+        codes, uniques = pd.factorize(np.asarray(times, dtype=object))
+        seconds = pd.to_timedelta(pd.Index(uniques, dtype=object), errors='coerce').to_numpy(dtype='timedelta64[ns]')
+        seconds = np.where(np.isnat(seconds), np.timedelta64(0,'ns'), seconds)
+        return RACF._parseDates(dates) + np.where(codes>=0, seconds[codes] if len(seconds) else np.timedelta64(0,'ns'), np.timedelta64(0,'ns'))
+
+    @property
+    @cachedView('_generalCERT','_generalCERTname','_generals')
+    def certificates(self):
+        ''' one row per certificate (GRCERT) with the validity period as START and END timestamps, OWNER (the user ID in the
+        APPLDATA of the DIGTCERT profile, irrcerta for CERTAUTH and irrsitec for SITE certificates), the ISSUER_DN and
+        SUBJECT_DN (CERTN), KEY_TYPE and KEY_SIZE.  Indexed like generals, sorted by END, see certificates_expiring( ) '''
+        columns = ["START","END","OWNER","ISSUER_DN","SUBJECT_DN","KEY_TYPE","KEY_SIZE"]
+        if self.parsed("GRCERT")==0:
+            return pd.DataFrame(columns=columns, index=pd.MultiIndex.from_arrays([[],[]], names=["_CLASS_NAME","_NAME"]))
+        certs = self._generalCERT
+        names = self._generalCERTname.reindex(certs.index) if self.parsed("CERTN")>0 else pd.DataFrame(index=certs.index)
+        profiles = self._generals.loc[self._generals.index.get_level_values(0).isin(certs.index.get_level_values(0).unique()), "GRBD_APPL_DATA"]
+        profiles = profiles.loc[~profiles.index.duplicated()]
+        blanks = np.full(len(certs), ' ', dtype=object)
+        result = pd.DataFrame({
+            "START": RACF._parseTimestamps(certs["GRCERT_START_DATE"], certs["GRCERT_START_TIME"]),
+            "END": RACF._parseTimestamps(certs["GRCERT_END_DATE"], certs["GRCERT_END_TIME"]),
+            "OWNER": profiles.reindex(certs.index).fillna(' ').to_numpy(),
+            "ISSUER_DN": names["CERTN_ISSUER_DN"].fillna(' ').to_numpy() if "CERTN_ISSUER_DN" in names.columns else blanks,
+            "SUBJECT_DN": names["CERTN_SUBJECT_DN"].fillna(' ').to_numpy() if "CERTN_SUBJECT_DN" in names.columns else blanks,
+            "KEY_TYPE": certs["GRCERT_KEY_TYPE"].to_numpy(),
+            "KEY_SIZE": pd.to_numeric(certs["GRCERT_KEY_SIZE"], errors='coerce').to_numpy()},
+            index=certs.index)
+        return result.iloc[np.argsort(result["END"].to_numpy(), kind='stable')]  # NaT sorts last
+
+    @property
+    @cachedView('_generalKEYRING','_generalCERTreferences','_generalSTDATA','_generalCERT','_generalCERTname','_generals')
+    def keyringCertificates(self):
+        ''' one row per certificate on a key ring (KEYR, and CERTR references that are not in KEYR): RING, RING_OWNER (the user ID
+        in front of the ring name), STARTED (the ring owner is the user of a STARTED profile, STDATA), certificate CLASS_NAME and NAME,
+        LABEL, USAGE, DEFAULT, and START, END and OWNER of the certificate.  Sorted by END, see certificates_expiring(rings=True) '''
+        columns = ["RING","RING_OWNER","STARTED","CLASS_NAME","NAME","LABEL","USAGE","DEFAULT","START","END","OWNER"]
+        links = []
+        if self.parsed("KEYR")>0:
+            rings = self._generalKEYRING
+            links.append(pd.DataFrame({"RING": rings["KEYR_NAME"].to_numpy(), "CLASS_NAME": "DIGTCERT", "NAME": rings["KEYR_CERT_NAME"].to_numpy(),
+                                       "LABEL": rings["KEYR_CERT_LABEL"].to_numpy(), "USAGE": rings["KEYR_CERT_USAGE"].to_numpy(),
+                                       "DEFAULT": rings["KEYR_CERT_DEFAULT"].to_numpy()}))
+        if self.parsed("CERTR")>0:
+            refs = self._generalCERTreferences
+            refs = pd.DataFrame({"RING": refs["CERTR_RING_NAME"].to_numpy(), "CLASS_NAME": refs["CERTR_CLASS_NAME"].to_numpy(),
+                                 "NAME": refs["CERTR_NAME"].to_numpy(), "LABEL": ' ', "USAGE": ' ', "DEFAULT": ' '})
+            if links:
+                known = pd.MultiIndex.from_frame(links[0][["RING","NAME"]])
+                refs = refs.loc[~pd.MultiIndex.from_frame(refs[["RING","NAME"]]).isin(known)]
+            links.append(refs)
+        if not links:
+            return pd.DataFrame(columns=columns)
+        links = pd.concat(links, ignore_index=True)
+        links["RING_OWNER"] = links["RING"].str.split('.', n=1).str[0]
+        stcUsers = self._generalSTDATA["GRST_USER_ID"].unique() if self.parsed("GRST")>0 else []
+        links["STARTED"] = links["RING_OWNER"].isin(stcUsers)
+        certs = self.certificates
+        found = certs.index.get_indexer(pd.MultiIndex.from_frame(links[["CLASS_NAME","NAME"]]))
+        for column in ["START","END","OWNER"]:
+            values = certs[column].to_numpy()
+            missing = np.datetime64('NaT','ns') if values.dtype.kind=='M' else ' '
+            links[column] = np.where(found>=0, values[found] if len(values) else missing, missing)
+        return links[columns].iloc[np.argsort(links["END"].to_numpy(), kind='stable')].reset_index(drop=True)
+
+    def certificates_expiring(self, days=30, asof=None, rings=False, started=False, expired=False):
+        ''' certificates that expire within days days after asof (default now), with a binary search on the END order.
+        rings=True: key ring entries (keyringCertificates) instead of certificates, started=True: entries on rings of started task
+        users, expired=True: include certificates that expired before asof.
+        e.g. mysys.certificates_expiring(30, started=True) '''
+        if self._state != self.STATE_READY:
+            raise StoopidException('Not done parsing yet! (PEBKAM/ID-10T error)')
+        asof = pd.Timestamp(asof if asof is not None else datetime.now())
+        frame = self.keyringCertificates if rings or started else self.certificates
+        if started:
+            frame = frame.loc[frame["STARTED"].to_numpy(dtype=bool)]
+        ends = frame["END"].to_numpy(dtype='datetime64[ns]')
+        first = 0 if expired else np.searchsorted(ends, asof.to_datetime64(), side='left')
+        last = np.searchsorted(ends, (asof + pd.Timedelta(days=days)).to_datetime64(), side='right')
+        return frame.iloc[first:last]
+
 
 
     def rankedAccess(args):
@@ -810,7 +1508,10 @@ class RACF:
         accessNum = RACF.accessKeywords.index(access)
         return accessNum+10 if userid==authid else accessNum
 
-    def acl(self, df, permits=True, explode=False, resolve=False, admin=False, access=None, allows=None, sort="profile"):
+    @cachedView('_connectData','_groups','_users','_ownertreeLines','_datasets','_generals',
+                '_datasetAccess','_datasetConditionalAccess','_generalAccess','_generalConditionalAccess')
+    def acl(self, df, permits=True, explode=False, resolve=False, admin=False, access=None, allows=None, sort="profile",
+            user=None, profile=None, chunksize=None, grouping=False):
         ''' transform {dataset,general}[Conditional]Access table:
         permits=True: show normal ACL (with the groups identified in field USER_ID)
         explode=True: replace all groups with the users connected to the groups (in field USER_ID)
@@ -820,6 +1521,15 @@ class RACF:
         access=access level: show entries that are equal to the level specified, access='CONTROL'
         allows=access level: show entries that are higher or equal to the level specified, allows='UPDATE'
         sort=["user","access","id","admin","profile"] sort the resulting output
+        user=user ID: show entries with this USER_ID (or ADMIN_ID), with explode or resolve from user permits and permits of the user's
+            groups, with permits only (USER_ID is the permitted ID, or -group-) from the permits of the user ID itself
+        profile=generic pattern: show these profiles only, profile='SYS1.**' or profile=('FACILITY','BPX.**')
+        chunksize=number of profiles: return an iterator of acl frames for chunksize profiles each, instead of one frame
+        grouping=True: add access through resource grouping classes (GCICSTRN, GTERMINL, ...), field GROUPING names the grouping profile.
+            grouping profiles are shown for each member, member profiles with the permits of the grouping profiles that list them
+
+        access, allows, user and profile are applied to the permits before the connects and groups are merged in,
+        so selective reports on large access frames don't build the complete ACL first.
         '''
         tbName = df.columns[0].split('_')[0]
         tbEntity = tbName[0:2]
@@ -829,6 +1539,10 @@ class RACF:
             tbProfileKeys = ["CLASS_NAME","NAME"]
         else:
             raise StoopidException(f'Table {tbName} not supported for acl( ), except DSBD, DSACC, DSCACC, GRBD, GRACC or GRCACC.')
+        profileLevels = 1 if tbEntity=="DS" else 2  # index levels of df that identify the profile
+
+        if profile:
+            df = RACF.gfilter(df, *(profile if isinstance(profile,tuple) else (profile,) if profileLevels==1 else (None,profile)))
 
         if tbName in ["DSBD","GRBD"]:
             # profiles selected, add corresp. access + cond.access frames
@@ -858,6 +1572,34 @@ class RACF:
         # tbProfiles and tbPermits have column names without the tbName prefix
         
         returnFields = ["USER_ID","AUTH_ID","ACCESS"]
+
+        if grouping and tbEntity=="GR":
+            members = self.groupingMembers.reset_index().rename({"CLASS_NAME":"MEMBER_CLASS","NAME":"MEMBER"},axis=1)
+            def expandGrouping(frame):
+                ''' replace the grouping profiles in frame by a row for each member '''
+                isGrouping = frame["CLASS_NAME"].isin(members["GROUPING_CLASS"]).to_numpy()
+                expanded = pd.merge(frame.loc[isGrouping], members, how="inner",
+                                    left_on=["CLASS_NAME","NAME"], right_on=["GROUPING_CLASS","GROUPING_NAME"])
+                expanded["CLASS_NAME"] = expanded["MEMBER_CLASS"]
+                expanded["NAME"] = expanded["MEMBER"]
+                expanded = expanded.rename({"GROUPING_NAME":"GROUPING"},axis=1).drop(["MEMBER_CLASS","MEMBER","GROUPING_CLASS"],axis=1)
+                return pd.concat([frame.loc[~isGrouping], expanded], ignore_index=True, sort=False)
+            # permits of the grouping profiles that list the member profiles
+            listed = pd.merge(tbProfiles[tbProfileKeys], members, how="inner", left_on=tbProfileKeys, right_on=["MEMBER_CLASS","MEMBER"])\
+                       .drop(["MEMBER_CLASS","MEMBER"],axis=1)
+            groupingPermits = []
+            for tb in ([tbName] if tbName!="GRBD" else ["GRACC","GRCACC"]):
+                if not listed.empty and self.parsed(tb)>0:
+                    listedPermits = pd.merge(listed, getattr(self,self._recordname_df[tb]), how="inner",
+                                             left_on=["GROUPING_CLASS","GROUPING_NAME"], right_on=[tb+"_CLASS_NAME",tb+"_NAME"])
+                    listedPermits = listedPermits.drop([tb+"_CLASS_NAME",tb+"_NAME",tb+"_RECORD_TYPE",tb+"_ACCESS_CNT","GROUPING_CLASS"],axis=1)\
+                                                 .rename({"GROUPING_NAME":"GROUPING"},axis=1)
+                    listedPermits.columns = [c.replace(tb+"_","") for c in listedPermits.columns]
+                    groupingPermits.append(listedPermits)
+            tbPermits = pd.concat([expandGrouping(tbPermits)]+groupingPermits, ignore_index=True, sort=False)\
+                          .fillna(' ').drop_duplicates()
+            tbProfiles = expandGrouping(tbProfiles).fillna(' ')
+            returnFields += ["GROUPING"]
         conditionalFields = ["CATYPE","CANAME","NET_ID","CACRITERIA"]
 
         sortBy = {"user":["USER_ID"]+tbProfileKeys, 
@@ -868,109 +1610,128 @@ class RACF:
         if sort not in sortBy:
             raise StoopidException(f'Sort value {sort} not supported for acl( ), use one of {",".join(sortBy.keys())}.')
         
+        def accessSelected(levels):
+            ''' mask of the access levels that pass the access and allows options '''
+            ranked = levels.where(levels.isin(RACF.accessKeywords),other=' ').map(RACF.accessKeywords.index).to_numpy()  # DIGTCERT UACC may be TRUST
+            selected = np.full(len(ranked), True)
+            if access:
+                selected &= ranked==RACF.accessKeywords.index(access.upper())
+            if allows:
+                selected &= ranked>=RACF.accessKeywords.index(allows.upper())
+            return selected
+
+        # push access and allows down to the permits, the filters at the end still decide, these only drop rows that cannot pass
+        if access or allows:
+            if resolve:
+                # resolve keeps one of the permits for each user, a lower user permit overrides a higher group permit.
+                # so keep all permits of the profiles that have a permit, or UACC, that passes
+                if not admin:  # profile owners pass allows, so admin=True needs all profiles
+                    permitKeys = pd.MultiIndex.from_frame(tbPermits[tbProfileKeys])
+                    profileKeys = pd.MultiIndex.from_frame(tbProfiles[tbProfileKeys])
+                    uaccSelected = tbProfiles["UACC"].ne("NONE").to_numpy() & accessSelected(tbProfiles["UACC"])
+                    selectedKeys = permitKeys[accessSelected(tbPermits["ACCESS"])].union(profileKeys[uaccSelected])
+                    tbPermits = tbPermits.loc[permitKeys.isin(selectedKeys)]
+                    tbProfiles = tbProfiles.loc[profileKeys.isin(selectedKeys)]
+            else:
+                tbPermits = tbPermits.loc[accessSelected(tbPermits["ACCESS"])]
+
         if explode or resolve or admin:  # get view of connectData with only one index level (the group name)
             groupMembers = self._connectData.droplevel(1)
+        if user:
+            userConnects = groupMembers.loc[groupMembers["USCON_NAME"]==user] if explode or resolve else None
+            userIds = [user]+userConnects.index.tolist() if explode or resolve else [user]
+
+        def aclOf(tbPermits, tbProfiles):
+            ''' the acl of the profiles in tbProfiles, with their permits in tbPermits '''
+            # push user down: permits for the user ID and its groups, connects of the user ID, admin still needs all permits
+            adminPermits = tbPermits
+            if user:
+                tbPermits = tbPermits.loc[tbPermits["AUTH_ID"].isin(userIds).to_numpy()]
+
+            if explode or resolve:  # get user IDs connected to groups into field USER_ID
+                acl = pd.merge(tbPermits, (userConnects if user else groupMembers)[["USCON_NAME"]], how="left", left_on="AUTH_ID", right_index=True)
+                acl.insert(3,"USER_ID",acl["USCON_NAME"].where(acl["USCON_NAME"].notna(),acl["AUTH_ID"]))
+            elif permits:  # just the userid+access from RACF, add USER_ID column for consistency
+                acl = tbPermits.copy()
+                acl.insert(3,"USER_ID",acl["AUTH_ID"].where(~ acl["AUTH_ID"].isin(self._groups.index.values),"-group-"))
+            else:
+                acl = tbPermits.head(0)
+                if not admin:  # no option that produces data?
+                    return acl  # give up early, prevent KeyErrors due to empty tables
+
+            if (permits or explode or resolve) and not user:  # add -uacc- pseudo access, it has no user ID
+                uacc = tbProfiles.query("UACC!='NONE'").copy()
+                if access or allows:
+                    uacc = uacc.loc[accessSelected(uacc["UACC"])]
+                if not uacc.empty:
+                    uacc["OWNER_ID"] = "-uacc-" # is renamed to AUTH_ID
+                    uacc["USER_ID"] = "-uacc-"
+                    uacc = uacc.rename({"OWNER_ID":"AUTH_ID","UACC":"ACCESS"},axis=1)
+                    acl = pd.concat([acl,uacc], ignore_index=True, sort=False).fillna(' ') # lose index b/c concat doesn't support us
+
+            if resolve or sort=="access":
+                # map access level to number, add 10 for user permits so they override group permits in sort_values( )
+                acl["RANKED_ACCESS"] = acl["ACCESS"].where(acl["ACCESS"].isin(RACF.accessKeywords),other=' ').map(RACF.accessKeywords.index)
+                acl["RANKED_ACCESS"] = acl["RANKED_ACCESS"].where(acl["USER_ID"]!=acl["AUTH_ID"], acl["RANKED_ACCESS"]+10)
+            if resolve:
+                # keep highest value of RANKED_ACCESS, this is at least twice as fast as using .iloc[].idxmax() 
+                condAcc = ["CATYPE","CANAME"] if "CATYPE" in acl.columns else []
+                acl = acl.sort_values(tbProfileKeys+["USER_ID"]+condAcc+["RANKED_ACCESS"])\
+                         .drop_duplicates(tbProfileKeys+["USER_ID"]+condAcc, keep='last')
+            if sort=="access":
+                acl.RANKED_ACCESS = 10 - (acl.RANKED_ACCESS % 10)  # highest access first
+
+            if admin:
+                # owner of the profile, or group special, or group authority
+                # users who own the profiles
+                profile_userowners = pd.merge(tbProfiles, self._users["USBD_NAME"],
+                                              how="inner", left_on="OWNER_ID", right_index=True)\
+                                       .rename({"OWNER_ID":"ADMIN_ID"},axis=1)\
+                                       .drop(["USBD_NAME","UACC"],axis=1)
+                profile_userowners["AUTHORITY"] = "OWNER"
+                profile_userowners["VIA"] = "-profile-"
+                profile_userowners["ACCESS"] = "-owner-"
+
+                (groupAdmins, ownerSpecials) = self._adminIndex()
+
+                # group special on groups that own the profiles, or on the groups up their owner tree
+                profile_groupowners = pd.merge(tbProfiles.drop("UACC",axis=1), ownerSpecials,
+                                               how="inner", left_on="OWNER_ID", right_index=True)\
+                                        .drop("OWNER_ID",axis=1)
+                profile_groupowners["ACCESS"] = "-owner-"
+
+                # who has administrative authority to modify groups from the ACL?  owner, group special, CONNECT or JOIN authority
+                admin_groups = pd.merge(adminPermits, groupAdmins, how="inner", left_on="AUTH_ID", right_index=True)
+                admin_groups["USER_ID"] = "-group-"
+
+                acl = pd.concat([acl,profile_userowners,profile_groupowners,admin_groups],
+                                ignore_index=True, sort=False).fillna(' ')
+
+            if access or allows:
+                acl = acl.loc[accessSelected(acl["ACCESS"])]
+            if user:
+                acl = acl.loc[(acl["USER_ID"]==user) | (acl["ADMIN_ID"]==user)] if admin else acl.loc[acl["USER_ID"]==user]
+
+            condAcc = conditionalFields if "CATYPE" in acl.columns and any(acl["CATYPE"].gt(' ')) else []
+            fields = returnFields+["ADMIN_ID","AUTHORITY","VIA"] if admin else returnFields
+            return acl.sort_values(by=sortBy[sort])[tbProfileKeys+fields+condAcc].reset_index(drop=True)
+
+        if chunksize:
+            # profiles in order of appearance, chunksize profiles per frame, each frame sorted by itself.
+            # the permits and connects are prepared once, each chunk takes its rows by position
+            chunkKeys = tbProfileKeys[:profileLevels]  # profile key in the index of df
+            profileKeys = pd.MultiIndex.from_frame(tbProfiles[chunkKeys]).unique()
+            chunks = math.ceil(len(profileKeys)/chunksize)
+            (profileParts, permitParts) = [[], []]
+            for (frame, parts) in [(tbProfiles, profileParts), (tbPermits, permitParts)]:
+                chunk = profileKeys.get_indexer(pd.MultiIndex.from_frame(frame[chunkKeys])) // chunksize
+                order = np.argsort(chunk, kind='stable')
+                bounds = np.searchsorted(chunk[order], np.arange(chunks+1))
+                parts.extend(order[bounds[c]:bounds[c+1]] for c in range(chunks))
+            # the iterator is not cached, so the chunks are released after use
+            return (aclOf(tbPermits.iloc[permitParts[c]], tbProfiles.iloc[profileParts[c]]) for c in range(chunks))
+        return aclOf(tbPermits, tbProfiles)
 
-        if explode or resolve:  # get user IDs connected to groups into field USER_ID
-            acl = pd.merge(tbPermits, groupMembers[["USCON_NAME"]], how="left", left_on="AUTH_ID", right_index=True)
-            acl.insert(3,"USER_ID",acl["USCON_NAME"].where(acl["USCON_NAME"].notna(),acl["AUTH_ID"]))
-        elif permits:  # just the userid+access from RACF, add USER_ID column for consistency
-            acl = tbPermits
-            acl.insert(3,"USER_ID",acl["AUTH_ID"].where(~ acl["AUTH_ID"].isin(self._groups.index.values),"-group-"))
-        else:
-            acl = AclFrame(tbPermits.head(0))
-            if not admin:  # no option that produces data?
-                return acl  # give up early, prevent KeyErrors due to empty tables
-
-        if permits or explode or resolve:  # add -uacc- pseudo access
-            uacc = tbProfiles.query("UACC!='NONE'").copy()
-            if not uacc.empty:
-                uacc["OWNER_ID"] = "-uacc-" # is renamed to AUTH_ID
-                uacc["USER_ID"] = "-uacc-"
-                uacc = uacc.rename({"OWNER_ID":"AUTH_ID","UACC":"ACCESS"},axis=1)
-                acl = pd.concat([acl,uacc], ignore_index=True, sort=False).fillna(' ') # lose index b/c concat doesn't support us
-            
-        if resolve or sort=="access":
-            # map access level to number, add 10 for user permits so they override group permits in sort_values( )
-            acl["RANKED_ACCESS"] = acl["ACCESS"].map(RACF.accessKeywords.index)
-            acl["RANKED_ACCESS"] = acl["RANKED_ACCESS"].where(acl["USER_ID"]!=acl["AUTH_ID"], acl["RANKED_ACCESS"]+10)
-        if resolve:
-            # keep highest value of RANKED_ACCESS, this is at least twice as fast as using .iloc[].idxmax() 
-            condAcc = ["CATYPE","CANAME"] if "CATYPE" in acl.columns else []
-            acl = acl.sort_values(tbProfileKeys+["USER_ID"]+condAcc+["RANKED_ACCESS"])\
-                     .drop_duplicates(tbProfileKeys+["USER_ID"]+condAcc, keep='last')
-        if sort=="access":
-            acl.RANKED_ACCESS = 10 - (acl.RANKED_ACCESS % 10)  # highest access first
-        
-        if admin:
-            # owner of the profile, or group special, or group authority
-            # users who own the profiles
-            profile_userowners = pd.merge(tbProfiles, self._users["USBD_NAME"],
-                                          how="inner", left_on="OWNER_ID", right_index=True)\
-                                   .rename({"OWNER_ID":"ADMIN_ID"},axis=1)\
-                                   .drop(["USBD_NAME","UACC"],axis=1)
-            profile_userowners["AUTHORITY"] = "OWNER"
-            profile_userowners["VIA"] = "-profile-"
-            profile_userowners["ACCESS"] = "-owner-"
-
-            # groups that own the profiles
-            profile_groupowner1 = pd.merge(tbProfiles, self._groups[["GPBD_NAME"]],
-                                           how="inner", left_on="OWNER_ID", right_index=True)\
-                                    .drop(["GPBD_NAME","UACC"],axis=1)
-            profile_groupowner1["ACCESS"] = "-owner-"
-            profile_groupowner2 = pd.merge(profile_groupowner1, self._ownertreeLines, how="inner", left_on="OWNER_ID", right_index=True)\
-                                    .drop(["GROUP","OWNER_ID"],axis=1)
-            # identify group special on owner group and on any owning group
-            profile_groupowner1.rename({"OWNER_ID":"OWNER_IDS"},axis=1,inplace=True)
-            # continue with group special processing to find admin users
-
-            # who has administrative authority to modify groups from the ACL?
-            admin_owners = pd.merge(tbPermits, self._groups[["GPBD_NAME","GPBD_OWNER_ID","GPBD_SUPGRP_ID"]],
-                                    how="inner", left_on="AUTH_ID", right_index=True)
-            admin_owners["USER_ID"] = "-group-"
-
-            # users who own those groups
-            admin_gowners = admin_owners.query("GPBD_OWNER_ID != GPBD_SUPGRP_ID")\
-                                        .rename({"GPBD_NAME":"VIA","GPBD_OWNER_ID":"ADMIN_ID"},axis=1)\
-                                        .drop(["GPBD_SUPGRP_ID"],axis=1)
-            admin_gowners["AUTHORITY"] = "OWNER"
-            
-            # find all owner groups + groups up to SYS1 or user ID that breaks ownership
-            admin_grpspec1 = admin_owners.query("GPBD_OWNER_ID == GPBD_SUPGRP_ID")\
-                                         .drop(["GPBD_OWNER_ID","GPBD_SUPGRP_ID"],axis=1)
-            admin_grpspec2 = pd.merge(admin_grpspec1, self._ownertreeLines, how="inner", left_on="AUTH_ID", right_index=True)\
-                               .drop(["GPBD_NAME","GROUP"],axis=1)
-            admin_grpspec1.rename({"GPBD_NAME":"OWNER_IDS"},axis=1,inplace=True)
-            
-            # identify group special on ACL group and on any owning group
-            admin_grpspec = pd.merge(pd.concat([admin_grpspec1,admin_grpspec2,profile_groupowner1,profile_groupowner2], sort=False),\
-                                     groupMembers[["USCON_NAME","USCON_GRP_ID","USCON_GRP_SPECIAL"]]\
-                                             .query('USCON_GRP_SPECIAL == "YES"'),
-                                     how="inner", left_on="OWNER_IDS", right_index=True)\
-                               .rename({"USCON_NAME":"ADMIN_ID","OWNER_IDS":"VIA"},axis=1)\
-                               .drop(["USCON_GRP_ID","USCON_GRP_SPECIAL"],axis=1)
-            admin_grpspec["AUTHORITY"] = "GRPSPECIAL"
-
-            # CONNECT or JOIN authority on an ACL group
-            admin_grpauth = pd.merge(tbPermits, groupMembers[["USCON_NAME","USCON_GRP_ID","GPMEM_AUTH"]]
-                                                 .query('GPMEM_AUTH==["CONNECT","JOIN"]'),
-                                     how="inner", left_on="AUTH_ID", right_index=True)\
-                              .rename({"USCON_NAME":"ADMIN_ID","USCON_GRP_ID":"VIA","GPMEM_AUTH":"AUTHORITY"},axis=1)
-            admin_grpauth["USER_ID"] = "-group-"
-            
-            acl = pd.concat([acl,profile_userowners,admin_gowners,admin_grpspec,admin_grpauth],
-                            ignore_index=True, sort=False).fillna(' ')
-            returnFields += ["ADMIN_ID","AUTHORITY","VIA"]
-            
-        if access:
-            acl = acl.loc[acl["ACCESS"].map(RACF.accessKeywords.index)==RACF.accessKeywords.index(access.upper())]
-        if allows:
-            acl = acl.loc[acl["ACCESS"].map(RACF.accessKeywords.index)>=RACF.accessKeywords.index(allows.upper())]
-
-        condAcc = conditionalFields if "CATYPE" in acl.columns and any(acl["CATYPE"].gt(' ')) else []
-        return acl.sort_values(by=sortBy[sort])[tbProfileKeys+returnFields+condAcc].reset_index(drop=True)
-
-    
     @property
     def orphans(self):
         
@@ -999,6 +1760,10 @@ class RACF:
         if self.parsed("DSACC") + self.parsed("GRACC") == 0:
             raise StoopidException('No dataset/general access records parsed! (PEBKAM/ID-10T error)')
 
+        # No mess with my header lines, Excel support is imported when it is used
+        import pandas.io.formats.excel
+        pandas.io.formats.excel.ExcelFormatter.header_style = None
+
         writer = pd.ExcelWriter(f'{fileName}', engine='xlsxwriter')
         accessLevelFormats = {
                     'N': writer.book.add_format({'bg_color': 'silver'}),
@@ -1115,6 +1880,7 @@ class RACF:
 
 
     @property
+    @cachedView('_groups')
     def ownertree(self):
         ''' 
         create dict with the user IDs that own groups as key, and a list of their owned groups as values.
@@ -1123,6 +1889,7 @@ class RACF:
         return self._ownertree if self._ownertree else GroupStructureTree(self._groups,"GPBD_OWNER_ID")
 
     @property
+    @cachedView('_groups')
     def grouptree(self):
         ''' 
         create dict starting with SYS1, and a list of groups owned by SYS1 as values.
@@ -1132,6 +1899,179 @@ class RACF:
         return self._grouptree if self._grouptree else GroupStructureTree(self._groups,"GPBD_SUPGRP_ID")
 
 
+    @cachedView('_datasets','_generals', shared=True)
+    def _uaccProfiles(self):
+        ''' profiles with a UACC that grants access, in the layout of access_of '''
+        frames = []
+        for tb in ["DSBD","GRBD"]:
+            if self.parsed(tb)>0:
+                df = getattr(self,self._recordname_df[tb])
+                uacc = df.loc[df[tb+"_UACC"].isin(RACF.accessKeywords[2:-1]).to_numpy()]
+                frames.append(pd.DataFrame({"CLASS_NAME": uacc["GRBD_CLASS_NAME"].to_numpy() if tb=="GRBD" else "DATASET",
+                                            "NAME": uacc[tb+"_NAME"].to_numpy(),
+                                            "VOL": uacc["DSBD_VOL"].to_numpy() if tb=="DSBD" else " ",
+                                            "AUTH_ID": "-uacc-",
+                                            "ACCESS": uacc[tb+"_UACC"].to_numpy()}))
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["CLASS_NAME","NAME","VOL","AUTH_ID","ACCESS"])
+
+    @cachedView('_datasetAccess','_datasetConditionalAccess','_generalAccess','_generalConditionalAccess','_datasets','_generals', shared=True)
+    def _accessOrder(self):
+        ''' for access_of: by access table, the position of each permit in the order of access_of_many (CLASS_NAME, NAME, VOL,
+        CATYPE, CANAME) and its ranked access, and the UACC profiles in that order, with their positions and ranked UACC '''
+        tables = [tb for tb in ["DSACC","DSCACC","GRACC","GRCACC"] if self.parsed(tb)>0]
+        keys = {c: [] for c in ["CLASS_NAME","NAME","VOL","CATYPE","CANAME"]}
+        ranks = []
+        for tb in tables:
+            df = getattr(self,self._recordname_df[tb])
+            constant = np.full(len(df), "DATASET" if tb[0:2]=="DS" else " ", dtype=object)
+            keys["CLASS_NAME"].append(df[tb+"_CLASS_NAME"].to_numpy(dtype=object) if tb[0:2]=="GR" else constant)
+            keys["NAME"].append(df[tb+"_NAME"].to_numpy(dtype=object))
+            keys["VOL"].append(df[tb+"_VOL"].to_numpy(dtype=object) if tb[0:2]=="DS" else constant)
+            keys["CATYPE"].append(df[tb+"_CATYPE"].to_numpy(dtype=object) if "CACC" in tb else np.full(len(df), " ", dtype=object))
+            keys["CANAME"].append(df[tb+"_CANAME"].to_numpy(dtype=object) if "CACC" in tb else np.full(len(df), " ", dtype=object))
+            ranks.append(RACF._accessRanks(df[tb+"_ACCESS"]))
+        profiles = self._uaccProfiles()
+        for c in keys:
+            keys[c].append(profiles[c].to_numpy(dtype=object) if c in profiles.columns else np.full(len(profiles), " ", dtype=object))
+        # dense rank of the keys, permits of the same profile and condition get the same position
+        codes = [pd.factorize(np.concatenate(arrays), sort=True)[0] for arrays in keys.values()]
+        order = np.lexsort(codes[::-1])
+        changes = np.ones(len(order), dtype=bool)
+        changes[1:] = np.any([c[order][1:]!=c[order][:-1] for c in codes], axis=0)
+        position = np.empty(len(order), dtype=np.int64)
+        position[order] = np.cumsum(changes)-1
+        bounds = np.cumsum([0]+[len(r) for r in ranks])
+        permits = {tb: (position[lo:hi], r) for (tb, lo, hi, r) in zip(tables, bounds[:-1], bounds[1:], ranks)}
+        uaccPosition = position[bounds[-1]:]
+        sort = np.argsort(uaccPosition, kind="stable")
+        columns = {c: profiles[c].to_numpy(dtype=object)[sort] for c in profiles.columns}
+        columns.update(CATYPE=np.full(len(sort), " ", dtype=object), CANAME=np.full(len(sort), " ", dtype=object))
+        return (permits, (columns, uaccPosition[sort], RACF._accessRanks(columns["ACCESS"])))
+
+    @staticmethod
+    def _accessRanks(access):
+        ''' position of each access level in accessKeywords, 0 for values that are not access levels '''
+        return np.maximum(pd.Index(RACF.accessKeywords).get_indexer(np.asarray(access, dtype=object)), 0)
+
+    def access_of(self, user, resolve=True, uacc=True):
+        ''' data set and general resource profiles that user can access, the same as access_of_many([user]).  The permits of
+        user, its groups and ID(*) come from the inverted indexes, only these rows are sorted and merged into the UACC profiles,
+        which are kept in order. '''
+        connects = self._profileIndex.get(self._connectData, 1)
+        groups = self._connectData.index.get_level_values(0)[connects.positions([user])].tolist()
+        star = ["*"] if user in self._users.index else []  # ID(*) applies to RACF defined users
+        authIds = [user]+groups+star
+        (permitOrder, (profiles, uaccPosition, uaccRanks)) = self._accessOrder()
+
+        columns = ["USER_ID","CLASS_NAME","NAME","VOL","AUTH_ID","ACCESS","CATYPE","CANAME"]
+        found = {c: [] for c in columns[1:]+["POSITION","RANK"]}
+        for (tb, (position, ranks)) in permitOrder.items():
+            df = getattr(self,self._recordname_df[tb])
+            rows = self._profileIndex.get(df, -2).positions(authIds)
+            constant = lambda value: np.full(len(rows), value, dtype=object)
+            found["CLASS_NAME"].append(df[tb+"_CLASS_NAME"].to_numpy(dtype=object)[rows] if tb[0:2]=="GR" else constant("DATASET"))
+            found["NAME"].append(df[tb+"_NAME"].to_numpy(dtype=object)[rows])
+            found["VOL"].append(df[tb+"_VOL"].to_numpy(dtype=object)[rows] if tb[0:2]=="DS" else constant(" "))
+            found["AUTH_ID"].append(df[tb+"_AUTH_ID"].to_numpy(dtype=object)[rows])
+            found["ACCESS"].append(df[tb+"_ACCESS"].to_numpy(dtype=object)[rows])
+            found["CATYPE"].append(df[tb+"_CATYPE"].to_numpy(dtype=object)[rows] if "CACC" in tb else constant(" "))
+            found["CANAME"].append(df[tb+"_CANAME"].to_numpy(dtype=object)[rows] if "CACC" in tb else constant(" "))
+            found["POSITION"].append(position[rows])
+            found["RANK"].append(ranks[rows])
+        permits = {c: np.concatenate(arrays) if arrays else np.empty(0, dtype=object if c in columns else int) for (c, arrays) in found.items()}
+        # in the order of access_of_many: by profile key, precedence and access level, then by ID (user, groups, ID(*))
+        idNumber = pd.Index(authIds).get_indexer(permits["AUTH_ID"])
+        position = permits.pop("POSITION")
+        ranks = permits.pop("RANK") + 10*np.where(idNumber==0, 3, np.where(idNumber<=len(groups), 2, 1))
+        order = np.lexsort((idNumber, ranks, position) if resolve else (idNumber, position))
+        if resolve and len(order):  # the last entry of each profile has the highest precedence and access level
+            order = order[np.append(position[order][1:]!=position[order][:-1], True)]
+        (permits, position, ranks) = ({c: values[order] for (c, values) in permits.items()}, position[order], ranks[order])
+
+        if uacc:
+            # a user or group permit replaces the UACC of the profile, an ID(*) permit only when it is higher
+            keep = np.ones(len(uaccPosition), dtype=bool)
+            if resolve and len(position) and len(uaccPosition):
+                onProfile = np.minimum(np.searchsorted(uaccPosition, position), len(uaccPosition)-1)
+                onUacc = uaccPosition[onProfile]==position
+                uaccWins = (ranks<20) & (uaccRanks[onProfile]>=ranks-10)
+                keep[onProfile[onUacc & ~uaccWins]] = False
+                stays = ~(onUacc & uaccWins)
+                (permits, position) = ({c: values[stays] for (c, values) in permits.items()}, position[stays])
+            # permits go before the UACC of the same profile
+            at = np.searchsorted(uaccPosition[keep], position)
+            permits = {c: np.insert(profiles[c][keep], at, permits[c]) for c in permits}
+        if not len(permits["NAME"]):
+            return pd.DataFrame(columns=columns)
+        permits["USER_ID"] = np.full(len(permits["NAME"]), user, dtype=object)
+        return pd.DataFrame({c: permits[c] for c in columns})
+
+    def access_of_many(self, users, resolve=True, uacc=True):
+        ''' access of each user ID in users through user, group, ID(*) and conditional permits (CATYPE, CANAME) on
+        DSACC, DSCACC, GRACC and GRCACC, and through UACC when uacc=True.  CLASS_NAME is DATASET for data set profiles.
+        resolve=True: the access RACF uses for each profile: the user permit, else the highest group permit, else the higher of ID(*) and UACC
+        resolve=False: all entries that apply, AUTH_ID shows the user, group, * or -uacc-
+        Permits are found through inverted indexes on AUTH_ID and on the user IDs in connectData, not by merging the complete frames.
+        UACC entries are added after the permits are resolved, for the profiles without a user or group permit of the user.
+        '''
+        # IDs that can appear on an access list for each user, with their precedence: user 3, groups 2, ID(*) and UACC 1
+        connects = self._profileIndex.get(self._connectData, 1)
+        connectGroups = self._connectData.index.get_level_values(0)
+        (userIds, authIds, precedence) = ([], [], [])
+        for user in users:
+            groups = connectGroups[connects.positions([user])].tolist()
+            star = ['*'] if user in self._users.index else []  # ID(*) applies to RACF defined users
+            userIds += [user]*(1+len(groups)+len(star))
+            authIds += [user]+groups+star
+            precedence += [3]+[2]*len(groups)+[1]*len(star)
+        ids = pd.DataFrame({"USER_ID":userIds, "AUTH_ID":authIds, "PRECEDENCE":precedence})
+
+        permits = []
+        for tb in ["DSACC","DSCACC","GRACC","GRCACC"]:
+            if self.parsed(tb)>0:
+                df = getattr(self,self._recordname_df[tb])
+                rows = df.iloc[self._profileIndex.get(df, -2).positions(ids["AUTH_ID"].unique())]
+                permits.append(pd.DataFrame({"CLASS_NAME": rows[tb+"_CLASS_NAME"].to_numpy() if tb[0:2]=="GR" else "DATASET",
+                                             "NAME": rows[tb+"_NAME"].to_numpy(),
+                                             "VOL": rows[tb+"_VOL"].to_numpy() if tb[0:2]=="DS" else " ",
+                                             "AUTH_ID": rows[tb+"_AUTH_ID"].to_numpy(),
+                                             "ACCESS": rows[tb+"_ACCESS"].to_numpy(),
+                                             "CATYPE": rows[tb+"_CATYPE"].to_numpy() if "CACC" in tb else " ",
+                                             "CANAME": rows[tb+"_CANAME"].to_numpy() if "CACC" in tb else " "}))
+        columns = ["USER_ID","CLASS_NAME","NAME","VOL","AUTH_ID","ACCESS","CATYPE","CANAME"]
+        keys = ["USER_ID","CLASS_NAME","NAME","VOL","CATYPE","CANAME"]
+        entries = pd.merge(ids, pd.concat(permits, ignore_index=True), how="inner", on="AUTH_ID") if permits else pd.DataFrame(columns=columns+["PRECEDENCE"])
+        ranked = lambda access: access.where(access.isin(RACF.accessKeywords),other=' ').map(RACF.accessKeywords.index).to_numpy()
+        if resolve:
+            # precedence first, then the access level, so a user permit NONE overrides group permits
+            entries["RANKED_ACCESS"] = ranked(entries["ACCESS"]) + 10*entries["PRECEDENCE"].to_numpy()
+            entries = entries.sort_values(keys+["RANKED_ACCESS"], kind="stable").drop_duplicates(keys, keep="last")
+
+        frames = [entries[columns]]
+        if uacc:
+            # UACC applies to every user, for each user (in order) the UACC profiles (in order), without merging them with the permits:
+            # a resolved user or group permit replaces the UACC of the profile, an ID(*) permit only when it is higher
+            profiles = self._uaccProfiles()
+            users = pd.unique(pd.Series(list(users), dtype=object))
+            keep = np.ones(len(users)*len(profiles), dtype=bool)
+            if resolve and len(entries) and len(profiles):
+                standard = entries.loc[entries["CATYPE"].eq(" ").to_numpy() & entries["CANAME"].eq(" ").to_numpy()]
+                userNumber = pd.Index(users).get_indexer(standard["USER_ID"])
+                profileNumber = pd.MultiIndex.from_frame(profiles[["CLASS_NAME","NAME","VOL"]])\
+                                  .get_indexer(pd.MultiIndex.from_frame(standard[["CLASS_NAME","NAME","VOL"]]))
+                onUacc = profileNumber>=0
+                uaccWins = (standard["PRECEDENCE"].to_numpy()==1) & (ranked(profiles["ACCESS"])[profileNumber]>=standard["RANKED_ACCESS"].to_numpy()-10)
+                keep[(userNumber*len(profiles)+profileNumber)[onUacc & ~uaccWins]] = False
+                entries = entries.drop(standard.index[onUacc & uaccWins])
+            position = np.flatnonzero(keep)
+            (userOf, profileOf) = np.divmod(position, len(profiles)) if len(profiles) else (position, position)
+            frames = [entries[columns], pd.DataFrame({"USER_ID": users[userOf], **{c: profiles[c].to_numpy()[profileOf] for c in profiles.columns},
+                                                      "CATYPE": " ", "CANAME": " "})]
+        entries = pd.concat(frames, ignore_index=True)
+        if entries.empty:
+            return pd.DataFrame(columns=columns)
+        return entries.sort_values(keys, kind="stable").reset_index(drop=True)
+
     def getdatasetrisk(self, profile=''):
         '''This will produce a dict as follows:
       
@@ -1150,6 +2090,7 @@ class RACF:
             raise StoopidException(f'Profile {profile} not found...')
         
         owner = d['DSBD_OWNER_ID'].values[0]
+        (groupAdmins, ownerSpecials) = self._adminIndex()
         accesslist = {}
         accessmanagers = {}
         dsacc = self.datasetAccess.groupby('DSACC_NAME')
@@ -1164,29 +2105,13 @@ class RACF:
                         accesslist[access].append(id)
                     else:
                         if id in self.groups.index:
-                            g = self.connect(id)[['USCON_NAME','USCON_GRP_SPECIAL']].values
-                            for user,grp_special in g:
-                                accesslist[access].append(user)
-                                # But suppose this user is group_special here?
-                                if grp_special=='YES':
-                                    accessmanagers[access].append(user)
-                            # And wait a minute... this groups owner, can also add people to the group?
-                            [gowner,gsupgroup] = self.group(id)[['GPBD_OWNER_ID','GPBD_SUPGRP_ID']].values[0]
-                            if gowner in self.users.index:
-                                accessmanagers[access].append(gowner)
-                            else:
-                                # group special propages up
-                                while gowner==gsupgroup:
-                                    g = self.connect(gowner)[['USCON_NAME','USCON_GRP_SPECIAL']].values
-                                    for user,grp_special in g:
-                                        if grp_special=='YES':
-                                            accessmanagers[access].append(user)
-                                    [gowner,gsupgroup] = self.group(gowner)[['GPBD_OWNER_ID','GPBD_SUPGRP_ID']].values[0]
-                            # connect authority CONNECT/JOIN allows modification of member list
-                            g = self.connect(id)[['USCON_NAME','GPMEM_AUTH']].values
-                            for user,grp_auth in g:
-                                if grp_auth in ('CONNECT','JOIN'):
-                                    accessmanagers[access].append(user)
+                            accesslist[access] += self.connect(id)['USCON_NAME'].tolist()
+                            # owner (if a user), group specials here and up the owner tree, CONNECT/JOIN authority
+                            admins = groupAdmins.iloc[self._profileIndex.get(groupAdmins).positions(id)]
+                            accessmanagers[access] += admins.loc[(admins['AUTHORITY']!='OWNER') | admins['ADMIN_ID'].isin(self._users.index),'ADMIN_ID'].tolist()
+                            # group special here also when the group is not owned by its superior group
+                            specials = ownerSpecials.iloc[self._profileIndex.get(ownerSpecials).positions(id)]
+                            accessmanagers[access] += specials.loc[specials['VIA']==id,'ADMIN_ID'].tolist()
                 # clean up doubles...
                 accesslist[access] = list(set(accesslist[access]))
                 accessmanagers[access] = list(set(accessmanagers[access]))
@@ -0,0 +1,184 @@
+''' Memoization of derived views (specials, uacc_read_datasets, gfilter, acl, ...) on the RACF frames.
+
+Results are keyed on the identity of the frames they were derived from, so replacing a frame (orphans, loading
+new pickles, an incremental update) makes the old results unreachable, and they are dropped when the frame is
+collected.  Each RACF object has its own cache, its frames carry it in attrs for gfilter( ) and the other frame
+methods.  Changes made in place to a frame are not detected, use RACF.clear_cache() after modifying a frame
+that way.  Each caller gets its own copy of a cached result, so modifying a result doesn't change the next one. '''
+
+import functools
+import sys
+import threading
+import types
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def _sizeOf(result):
+    ''' bytes held by a result, object columns count their pointers, the str values are shared with the source frame '''
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(index=True, deep=False).sum())
+    if isinstance(result, (pd.Series, pd.Index)):
+        return int(result.memory_usage(deep=False))
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, (tuple, list)):
+        return sum(map(_sizeOf, result))
+    return sys.getsizeof(result)
+
+
+def _fresh(result):
+    ''' copy of a cached result that the caller may modify: new frames with new value arrays, the str values are shared.
+    pandas copy-on-write can only be set for all frames, so the arrays are copied here '''
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.copy(deep=True)
+    if isinstance(result, np.ndarray):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(map(_fresh, result))
+    return result
+
+
+class ViewCache:
+    ''' LRU cache of at most maxsize results and maxbytes bytes, each tied to the frames it was derived from.
+    An entry is only returned when all its frames are still the same objects, and it is dropped when one of them is
+    collected.  Frames and arrays are returned as copies, maxsize=0 disables caching, maxbytes=None doesn't limit the size. '''
+
+    def __init__(self, maxsize=128, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # key -> (tuple of weakrefs to the frames, result, bytes)
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    def get(self, key, frames, compute, shared=False):
+        ''' return cached result for key and frames, or the result of compute().  shared=True returns the cached result
+        itself, for internal results that are not passed on to callers '''
+        if not self.maxsize:
+            return compute()
+        try:
+            key = (key, tuple(id(f) for f in frames))
+            hash(key)
+        except TypeError:  # unhashable selection, such as a list
+            return compute()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and all(ref() is f for (ref, f) in zip(entry[0], frames)):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1] if shared else _fresh(entry[1])
+        self.misses += 1
+        result = compute()
+        if isinstance(result, types.GeneratorType):  # an iterator can be consumed only once
+            return result
+        size = _sizeOf(result)
+        if self.maxbytes is not None and size > self.maxbytes:
+            return result
+        drop = self._dropper(key)
+        kept = result if shared else _fresh(result)  # the caller gets result, a copy is kept (pandas consolidates its blocks once, here)
+        with self._lock:
+            old = self._entries.pop(key, None)  # released after the lock, its frames may drop other entries
+            if old:
+                self._bytes -= old[2]
+            self._entries[key] = (tuple(weakref.ref(f, drop) for f in frames), kept, size)
+            self._bytes += size
+            while len(self._entries) > self.maxsize or (self.maxbytes is not None and self._bytes > self.maxbytes):
+                self._bytes -= self._entries.popitem(last=False)[1][2]
+        return result
+
+    def _dropper(self, key):
+        ''' weakref callback that forgets key when one of its frames is collected, without keeping the cache alive '''
+        cache = weakref.ref(self)
+        def drop(ref):
+            if cache() is not None:
+                cache()._forget(key, ref)
+        return drop
+
+    def _forget(self, key, ref):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and any(r is ref for r in entry[0]):  # not a newer entry under the same key
+                del self._entries[key]
+                self._bytes -= entry[2]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def info(self):
+        return {'entries': len(self._entries), 'maxsize': self.maxsize, 'bytes': self._bytes, 'maxbytes': self.maxbytes,
+                'hits': self.hits, 'misses': self.misses}
+
+
+# results of frame methods (gfilter, rfilter) on frames that don't belong to a RACF object
+frameCache = ViewCache(maxsize=256, maxbytes=2**28)
+
+
+class _Owner:
+    ''' the cache of a RACF object in the attrs of its frames.  pandas deep copies attrs into each frame selected from a frame,
+    the owner is passed on as is.  It refers to the cache weakly and pickles as an empty owner, so a frame kept or saved
+    doesn't keep the cached results of its RACF object. '''
+
+    def __init__(self, cache=None):
+        self._cache = weakref.ref(cache) if cache is not None else None
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (_Owner, ())
+
+    def cache(self):
+        return self._cache() if self._cache is not None else None
+
+
+def bindCache(df, cache):
+    ''' results of frame methods on df, and on the frames selected from df, are kept in cache '''
+    df.attrs['cache'] = _Owner(cache)
+
+
+def cacheOf(df):
+    ''' the cache of the RACF object df was taken from, frameCache for other frames '''
+    owner = getattr(df, 'attrs', {}).get('cache')
+    cache = owner.cache() if owner is not None else None
+    return cache if cache is not None else frameCache
+
+
+def _keyArgs(args):
+    ''' frames in the arguments are represented by their identity, they are part of the frames checked by ViewCache '''
+    return tuple(id(a) if isinstance(a, pd.core.base.PandasObject) else a for a in args)
+
+
+def cachedView(*frameNames, shared=False):
+    ''' decorator for RACF methods and properties that derive a result from the frames named in frameNames.
+    Frames passed as arguments, like the df in acl(df), are added to these frames.  The frames are looked up with
+    self._viewFrame(name), an Overlay gives a token for the frames it changed, so a cache key doesn't build them.
+    shared=True for internal views that are read but not returned to callers, they are not copied on each call. '''
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            frames = [frame for frame in map(self._viewFrame, frameNames) if frame is not None]
+            frames += [a for a in args if isinstance(a, pd.core.base.PandasObject)]
+            key = (func.__name__, _keyArgs(args), tuple(sorted(kwargs.items())))
+            return self._cache.get(key, frames, lambda: func(self, *args, **kwargs), shared=shared)
+        return wrapper
+    return decorator
+
+
+def cachedFilter(func):
+    ''' decorator for frame methods like gfilter(df, *selection), cached in the cache of the RACF object of df.
+    A frame of an overlay (pyracf.overlay) is selected by the overlay, from the cached selection on the base frame. '''
+    @functools.wraps(func)
+    def wrapper(df, *selection, **kwargs):
+        binding = df.attrs.get('overlay') if isinstance(df, pd.DataFrame) else None
+        selected = binding.select(df, wrapper, selection, kwargs) if binding is not None else None
+        if selected is not None:
+            return selected
+        return cacheOf(df).get((func.__name__, selection, tuple(sorted(kwargs.items()))), [df], lambda: func(df, *selection, **kwargs))
+    return wrapper
@@ -0,0 +1,41 @@
+''' Index of conditional access (PERMIT ... WHEN) frames by the condition, so program pathing, terminal and console
+questions select their permits without scanning DSCACC or GRCACC. '''
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from .profile_index import keyPositions
+
+
+class ConditionIndex:
+    ''' (CATYPE, CANAME) -> row positions of a conditional access frame (DSCACC or GRCACC).
+    Permits with a generic CANAME, like TERMINAL(TRM*), are kept apart and matched with generic2regex. '''
+
+    genericCharacters = re.compile(r'[*%]')
+
+    def __init__(self, df, generic2regex):
+        prefix = df.columns[0].split('_')[0]
+        catypes = df[prefix+'_CATYPE'].to_numpy()
+        canames = df[prefix+'_CANAME'].to_numpy()
+        self._positions = keyPositions(pd.MultiIndex.from_arrays([catypes, canames]))
+        self._byType = keyPositions(pd.Index(catypes))
+        self._generic = [(catype, re.compile(generic2regex(caname, lenient='')), np.atleast_1d(positions))
+                         for ((catype, caname), positions) in self._positions.items()
+                         if self.genericCharacters.search(caname)]
+
+    def positions(self, catype=None, caname=None):
+        ''' sorted row positions of the permits for condition catype, caname.  caname may be a list of names,
+        catype=None selects all types, caname=None all permits of catype '''
+        if catype is None:
+            found = [np.atleast_1d(p) for p in self._byType.values()] if caname is None else\
+                    [self.positions(t, caname) for t in self._byType]
+        elif caname is None:
+            found = [np.atleast_1d(self._byType.get(catype, []))]
+        else:
+            names = [caname] if isinstance(caname, str) else caname
+            found = [np.atleast_1d(self._positions.get((catype, n), [])) for n in names]
+            found += [positions for (t, pattern, positions) in self._generic
+                      if t==catype and any(pattern.match(n) for n in names)]
+        return np.unique(np.concatenate(found)).astype(np.intp) if found else np.empty(0, dtype=np.intp)
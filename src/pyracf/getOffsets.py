@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
+''' Build offsets.json from the IRRDBU00 record formats in the IBM documentation, and schema.py from offsets.json.
 
-import re
-import requests
+    python getOffsets.py              # download the record formats, write offsets.json and schema.py
+    python getOffsets.py --schema     # only write schema.py from the existing offsets.json
+'''
+
+import argparse
+import hashlib
 import json
-from bs4 import BeautifulSoup
+import os
+import pprint
+import re
 
 urls = [
 "https://www.ibm.com/docs/en/SSLTBW_3.1.0/com.ibm.zos.v3r1.icha300/format.htm",
@@ -12,41 +19,74 @@ urls = [
 "https://www.ibm.com/docs/en/SSLTBW_3.1.0/com.ibm.zos.v3r1.icha300/grr.htm"
 ]
 
-model = {}
-
-for url in urls:
-  w_html = requests.get(url)
-  w = BeautifulSoup(w_html.text, "html.parser")
-  
-  for wtype in w.find_all(["h2","h3"]):
-    try:
-      [rdesc,rtype,*_] = re.split("[\(\)]",wtype.string)
-    except:
-      print("Funny header:",wtype.string)
-    else:
-      rdesc = re.sub("\s"," ",rdesc)  # newlines in description...
-      print(rtype,":",rdesc)
-      rdesc = rdesc.strip().lower().replace(" ","-")
-      wtable = wtype.find_next_sibling().find("tbody")
-      rfields = []
-      for wrow in wtable.find_all("tr"):
-        wfields = wrow.find_all("td")
-        # some <td>s contain <svg> tags for changes, so the string is not the only descendant of <td> and we have to resort to strings
-        wf = [re.sub("\W","",str(list(wfields[i].strings)[0])) for i in range(4)]  # remove strash that could crash parsing
-        wf.append(re.sub("[\s\u00ae]"," ",str(list(wfields[4].strings)[0])))  # remove newlines and (R) in long description
-        rfields.append({
-            "field-name": wf[0] if wf[0]!="" else "RESERVED",
-            "type": wf[1],
-            "start": wf[2],
-            "end": wf[3],
-            "field-desc": wf[4]
-        })
-      model.update({
-        rdesc: {
-          "record-type": rtype.upper(),  # 05k0 is in fact 05K0
-          "ref-url": url,
-          "offsets": rfields
-      }})
-
-with open('offsets.json', 'w') as f:
-    json.dump(model, f, indent=4)
+here = os.path.dirname(os.path.abspath(__file__))
+
+
+def scrape():
+  import requests
+  from bs4 import BeautifulSoup
+
+  model = {}
+
+  for url in urls:
+    w_html = requests.get(url)
+    w = BeautifulSoup(w_html.text, "html.parser")
+
+    for wtype in w.find_all(["h2","h3"]):
+      try:
+        [rdesc,rtype,*_] = re.split("[\(\)]",wtype.string)
+      except:
+        print("Funny header:",wtype.string)
+      else:
+        rdesc = re.sub("\s"," ",rdesc)  # newlines in description...
+        print(rtype,":",rdesc)
+        rdesc = rdesc.strip().lower().replace(" ","-")
+        wtable = wtype.find_next_sibling().find("tbody")
+        rfields = []
+        for wrow in wtable.find_all("tr"):
+          wfields = wrow.find_all("td")
+          # some <td>s contain <svg> tags for changes, so the string is not the only descendant of <td> and we have to resort to strings
+          wf = [re.sub("\W","",str(list(wfields[i].strings)[0])) for i in range(4)]  # remove strash that could crash parsing
+          wf.append(re.sub("[\s®]"," ",str(list(wfields[4].strings)[0])))  # remove newlines and (R) in long description
+          rfields.append({
+              "field-name": wf[0] if wf[0]!="" else "RESERVED",
+              "type": wf[1],
+              "start": wf[2],
+              "end": wf[3],
+              "field-desc": wf[4]
+          })
+        model.update({
+          rdesc: {
+            "record-type": rtype.upper(),  # 05k0 is in fact 05K0
+            "ref-url": url,
+            "offsets": rfields
+        }})
+  return model
+
+
+def writeSchema(model, fileName):
+  ''' schema.py with {record type: ((field name, start, end), ...)}, imported without parsing JSON '''
+  offsets = {}
+  for rinfo in model.values():
+    offsets[rinfo['record-type']] = tuple((f['field-name'], int(f['start']), int(f['end'])) for f in rinfo['offsets'])
+  version = hashlib.sha1(repr(offsets).encode()).hexdigest()[:12]  # changes when any field changes
+  with open(fileName, 'w') as f:
+    f.write("''' IRRDBU00 field positions per record type, generated by getOffsets.py from offsets.json, do not edit.\n")
+    f.write("(field name, start, end) with the 1-based start and end column of the field. '''\n\n")
+    f.write(f"schemaVersion = '{version}'\n\n")
+    f.write('recordOffsets = ' + pprint.pformat(offsets, width=120, sort_dicts=False) + '\n')
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Build offsets.json and schema.py from the IRRDBU00 record formats.')
+  parser.add_argument('--schema', action='store_true', help='only write schema.py from the existing offsets.json')
+  args = parser.parse_args()
+
+  if args.schema:
+    with open(os.path.join(here, 'offsets.json')) as f:
+      model = json.load(f)
+  else:
+    model = scrape()
+    with open(os.path.join(here, 'offsets.json'), 'w') as f:
+      json.dump(model, f, indent=4)
+  writeSchema(model, os.path.join(here, 'schema.py'))
@@ -0,0 +1,46 @@
+''' Resource grouping classes: members listed in the profiles of a grouping class (GRMEM records) are resources of the
+member class, e.g. transactions in a GCICSTRN profile are protected as TCICSTRN resources. '''
+
+import pandas as pd
+
+# IBM supplied grouping class -> member class, installation classes are added from CDTINFO (GRCDT_MEMBER)
+groupingClasses = {
+    'GCICSTRN': 'TCICSTRN',
+    'BCICSPCT': 'ACICSPCT',
+    'ECICSDCT': 'DCICSDCT',
+    'HCICSFCT': 'FCICSFCT',
+    'KCICSJCT': 'JCICSJCT',
+    'NCICSPPT': 'MCICSPPT',
+    'QCICSPSB': 'PCICSPSB',
+    'UCICSTST': 'SCICSTST',
+    'VCICSCMD': 'CCICSCMD',
+    'WCICSRES': 'RCICSRES',
+    'GCSFKEYS': 'CSFKEYS',
+    'GXCSFKEY': 'XCSFKEY',
+    'GDASDVOL': 'DASDVOL',
+    'GEJBROLE': 'EJBROLE',
+    'GINFOMAN': 'INFOMAN',
+    'GMQADMIN': 'MQADMIN',
+    'GMQCHAN': 'MQCHAN',
+    'GMQNLIST': 'MQNLIST',
+    'GMQPROC': 'MQPROC',
+    'GMQQUEUE': 'MQQUEUE',
+    'GSDSF': 'SDSF',
+    'GTERMINL': 'TERMINAL',
+    'GXFACILI': 'XFACILIT',
+}
+
+
+def memberIndex(generalMembers, cdtinfo=None):
+    ''' frame indexed by member class and member name, with the GROUPING_CLASS and GROUPING_NAME of each grouping profile
+    that lists the member.  cdtinfo is the CDTINFO frame with the installation defined classes. '''
+    classes = dict(groupingClasses)
+    if cdtinfo is not None and not cdtinfo.empty:
+        defined = cdtinfo.loc[cdtinfo['GRCDT_MEMBER'].str.strip().ne('')]
+        classes.update(zip(defined['GRCDT_NAME'], defined['GRCDT_MEMBER']))
+    grouped = generalMembers.loc[generalMembers['GRMEM_CLASS_NAME'].isin(classes.keys()).to_numpy()]
+    members = pd.DataFrame({'CLASS_NAME': grouped['GRMEM_CLASS_NAME'].map(classes).to_numpy(),
+                            'NAME': grouped['GRMEM_MEMBER'].to_numpy(),
+                            'GROUPING_CLASS': grouped['GRMEM_CLASS_NAME'].to_numpy(),
+                            'GROUPING_NAME': grouped['GRMEM_NAME'].to_numpy()})
+    return members.set_index(['CLASS_NAME','NAME']).sort_index(kind='stable')
@@ -0,0 +1,68 @@
+''' Timing, record count and memory instrumentation for the parse, load and correlate phases of RACF objects '''
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+def _rss():
+    ''' current resident set size in bytes, None if the platform does not tell us (no /proc) '''
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError, IndexError):
+        return None
+
+
+class PhaseTimer:
+    ''' Collects elapsed time, record counts and memory growth for named phases, e.g. 'read', 'slice.USBD',
+    'frame.USBD' or 'correlate.grouptreeLines'.  Repeated phases accumulate.
+    callback, when specified, is called as callback(phase, entry) each time a phase completes, entry is
+    a dict with seconds, calls, records and memory (bytes, None when unknown) of the phase so far. '''
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.phases = {}
+        self._lock = threading.Lock()  # parse_t may run on several threads
+
+    def add(self, name, seconds, records=None, memory=None):
+        with self._lock:
+            entry = self.phases.setdefault(name, {'seconds': 0.0, 'calls': 0, 'records': 0, 'memory': None})
+            entry['seconds'] += seconds
+            entry['calls'] += 1
+            if records:
+                entry['records'] += records
+            if memory is not None:
+                entry['memory'] = (entry['memory'] or 0) + memory
+            entry = dict(entry)
+        if self.callback:
+            self.callback(name, entry)
+
+    @contextmanager
+    def phase(self, name, records=None):
+        ''' time the statements in a with block, yields a dict so records can be set when they are known at the end '''
+        counts = {'records': records}
+        rss = _rss()
+        start = time.perf_counter()
+        try:
+            yield counts
+        finally:
+            seconds = time.perf_counter() - start
+            memory = _rss() - rss if rss is not None else None
+            self.add(name, seconds, counts['records'], memory)
+
+    def report(self):
+        ''' dict of phases, in the order they were first seen '''
+        with self._lock:
+            return {name: dict(entry) for (name, entry) in self.phases.items()}
+
+    def to_json(self, path=None):
+        ''' JSON string with all phases, written to path if specified '''
+        info = json.dumps({'created': datetime.now().isoformat(), 'phases': self.report()}, indent=2)
+        if path:
+            with open(path, 'w') as f:
+                f.write(info)
+        return info
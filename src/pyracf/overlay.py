@@ -0,0 +1,341 @@
+''' What-if scenarios: PERMIT, CONNECT, REMOVE and owner changes recorded on top of a RACF object, without changing it.
+
+An Overlay keeps the changes as small dicts.  gfilter, rfilter and pfilter on a frame of the overlay select from the base
+frame, cached, and apply the changes to the selection.  The frames the changes touch (datasetAccess, generalAccess,
+connectData, connects, datasets, generals) are built when they are used as a whole: the rows of a changed key are found by
+binary search and the runs of rows between them are copied once, a new owner replaces only the owner column, and changes
+made later are applied to the frame already built.  All other frames are the frames of the base object.
+RACF methods (acl, connect, access_of, ...) run on the overlay as if it were a RACF object with the changed frames.
+Frames taken from the overlay carry it in attrs, so frame.acl() uses the overlay instead of the last RACF object loaded.
+
+    whatif = mysys.overlay()
+    whatif.permit('SYS1.**', id='PAYROLL', access='UPDATE')
+    whatif.remove_user('SYS1', 'IBMUSER')
+    whatif.datasetAccess.gfilter('SYS1.**').acl(resolve=True)
+    whatif.diff()    # access that changes, with the access before and after
+
+Derived columns of the base frames, like IDSTAR_ACCESS in datasets, and the group and owner trees are not recomputed.
+'''
+
+import inspect
+import types
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from .cache import ViewCache
+from .profile_index import ProfileIndexes
+
+# frame -> (record name, columns with the key of a change, publisher)
+_frames = {
+    '_datasetAccess': ('DSACC', ['DSACC_NAME', 'DSACC_AUTH_ID'], 'datasetAccess'),
+    '_generalAccess': ('GRACC', ['GRACC_CLASS_NAME', 'GRACC_NAME', 'GRACC_AUTH_ID'], 'generalAccess'),
+    '_connectData': ('USCON', ['USCON_GRP_ID', 'USCON_NAME'], 'connectData'),
+    '_connects': ('GPMEM', ['GPMEM_NAME', 'GPMEM_MEMBER_ID'], 'connects'),
+    '_datasets': ('DSBD', ['DSBD_NAME'], 'datasets'),
+    '_generals': ('GRBD', ['GRBD_CLASS_NAME', 'GRBD_NAME'], 'generals'),
+}
+_published = {publisher: frame for (frame, (name, keys, publisher)) in _frames.items()}
+
+
+class _Binding:
+    ''' the Overlay in the attrs of its frames.  pandas deep copies attrs into each frame selected from a frame, the binding is
+    passed on as is, and it pickles as an empty binding, so a pickled frame doesn't take the RACF object along. '''
+
+    def __init__(self, overlay=None):
+        self.overlay = overlay
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (_Binding, ())
+
+    def select(self, df, filter, selection, kwargs):
+        ''' filter(df, *selection, **kwargs) when df is a frame of the overlay, None for other frames '''
+        return self.overlay._select(df, filter, selection, kwargs) if self.overlay is not None else None
+
+
+class _Version:
+    ''' stands in for a changed frame in the keys of the view cache, each change makes a new version '''
+
+
+def racfOf(df, racf):
+    ''' the Overlay df was taken from, or racf '''
+    binding = getattr(df, 'attrs', {}).get('overlay')
+    return binding.overlay if binding is not None and binding.overlay is not None else racf
+
+
+class Overlay:
+    ''' changes to the access lists, connects and profile owners of racf, evaluated without copying its frames.
+    Attributes and methods that are not changed come from racf. '''
+
+    def __init__(self, racf):
+        self._base = racf
+        self._changes = {frame: {} for frame in _frames}  # frame -> {key: new row (dict), or None to remove}
+        self._owners = {'_datasets': {}, '_generals': {}}  # frame -> {profile key: owner}
+        self._built = {}  # frame -> (base frame, frame with the changes)
+        self._pending = {}  # frame -> {key: True} changed after the frame was built
+        self._addedRows = {}  # frame -> frame of the new rows
+        self._boundFrames = {}  # published name -> (frame, frame bound to the overlay)
+        self._versions = {}  # changed frame -> _Version of its changes
+        self._cache = ViewCache(maxsize=racf._cache.maxsize, maxbytes=racf._cache.maxbytes)
+        self._profileIndex = ProfileIndexes()
+
+    def __getattr__(self, name):
+        if name == '_base':  # not initialized yet, e.g. while unpickling
+            raise AttributeError(name)
+        frame = _published.get(name, name)
+        if frame in _frames:
+            value = self._frame(frame)
+        else:
+            attr = inspect.getattr_static(type(self._base), name, None)
+            if isinstance(attr, types.FunctionType):
+                return types.MethodType(attr, self)  # RACF methods see the frames of the overlay
+            value = attr.__get__(self) if isinstance(attr, property) else getattr(self._base, name)
+        # RACF methods use the _ frames, they stay the frames of the base object when they don't change
+        return value if name.startswith('_') else self._bound(name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(dir(self._base)))
+
+    def _changed(self, frame, key):
+        self._pending.setdefault(frame, {})[key] = True
+        self._addedRows.pop(frame, None)
+        self._versions[frame] = _Version()
+
+    def _viewFrame(self, name):
+        ''' frame name for the keys of the view cache, a version of the changes for a changed frame '''
+        return self._versions[name] if name in self._versions else getattr(self, name, None)
+
+    def _newRows(self, frame, base, keys):
+        ''' the new rows for the changes to keys of frame, sorted, with the index of base '''
+        name = _frames[frame][0]
+        changes = self._changes[frame]
+        added = pd.DataFrame([changes[key] for key in keys if changes.get(key) is not None], columns=base.columns)
+        # the index levels are the record name + level name columns, as in RACF._indexFrame
+        return added.set_index([name + level for level in base.index.names], drop=False).rename_axis(base.index.names)\
+                    .sort_index(kind='stable')
+
+    def _apply(self, frame, df, keys, added):
+        ''' frame df with the rows of the changed keys replaced by the rows in added, and the new owners of keys.
+        The keys of a change are the first index levels, so the rows of a key are found by binary search in the sorted
+        index, and the runs of rows between them are copied once, without hashing or sorting the rows that don't change. '''
+        name = _frames[frame][0]
+        bounds = lambda key, side: df.index.get_slice_bound(key, side) if df.index.nlevels > 1 else df.index.searchsorted(key, side)
+        replaced = [key for key in keys if key in self._changes[frame]]
+        owners = {key: self._owners[frame][key] for key in keys if key in self._owners.get(frame, {})}
+        if replaced:
+            # (position, 0, row of added to insert) or (position, 1, end of the rows to leave out), in order
+            events = sorted([(bounds(key, 'left'), 0, row) for (row, key) in enumerate(added.index)] +
+                            [(bounds(key, 'left'), 1, bounds(key, 'right')) for key in replaced])
+            (pieces, position) = ([], 0)
+            for (at, remove, value) in events:
+                pieces.append(df.iloc[position:max(at, position)])
+                if remove:
+                    position = max(value, position)
+                else:
+                    pieces.append(added.iloc[value:value + 1])
+                    position = max(at, position)
+            df = pd.concat(pieces + [df.iloc[position:]])
+            df.attrs['sorted'] = True
+        if owners:
+            df = df.copy(deep=False)  # only the owner column is replaced
+            owner = df[name + '_OWNER_ID'].to_numpy(copy=True)
+            for (key, newOwner) in owners.items():
+                owner[bounds(key, 'left'):bounds(key, 'right')] = newOwner
+            df[name + '_OWNER_ID'] = owner
+        return df
+
+    def _applySelected(self, frame, df, added):
+        ''' rows df, selected from frame, with the rows of all changed keys replaced by the rows in added, and the new owners.
+        A selection is small, the changes are matched on the key of each row and the selection is sorted again. '''
+        (name, keys) = _frames[frame][:2]
+        changes = self._changes[frame]
+        owners = self._owners.get(frame)
+        toIndex = lambda keyValues: pd.MultiIndex.from_tuples(keyValues, names=df.index.names[:len(keys)]) if len(keys) > 1 else pd.Index(keyValues)
+        rowKeys = df.index if df.index.nlevels == len(keys) else df.index.droplevel(list(range(len(keys), df.index.nlevels)))
+        if changes:
+            df = pd.concat([df.loc[~rowKeys.isin(toIndex(list(changes)))], added]).sort_index(kind='stable')
+            rowKeys = df.index if df.index.nlevels == len(keys) else df.index.droplevel(list(range(len(keys), df.index.nlevels)))
+        if owners:
+            df = df.copy(deep=False)
+            newOwners = pd.Series(list(owners.values()), index=toIndex(list(owners)), dtype=object).reindex(rowKeys)
+            df[name + '_OWNER_ID'] = newOwners.fillna(df[name + '_OWNER_ID']).to_numpy()
+        return df
+
+    def _frame(self, frame):
+        ''' frame of the base object with the changes applied, the base frame itself when nothing changed.
+        The frame is kept, the changes made after it was built are applied to it when it is used again. '''
+        base = getattr(self._base, frame)
+        if not self._changes[frame] and not self._owners.get(frame):
+            return base
+        (source, df) = self._built.get(frame, (None, None))
+        if source is not base:  # first use, or the base frame was replaced
+            df = base if base.index.is_monotonic_increasing else base.sort_index(kind='stable')
+            keys = list(dict.fromkeys(list(self._changes[frame]) + list(self._owners.get(frame, {}))))
+        else:
+            keys = list(self._pending.get(frame, {}))
+        if keys:
+            df = self._apply(frame, df, keys, self._newRows(frame, df, keys))
+        self._pending.pop(frame, None)
+        self._built[frame] = (base, df)
+        return df
+
+    def _select(self, df, filter, selection, kwargs):
+        ''' filter(df, *selection, **kwargs) for df published by the overlay: the changes are applied to the selection
+        on the base frame, which is cached, so a query after each change doesn't scan the changed frame again '''
+        name = next((name for (name, (source, bound)) in self._boundFrames.items() if bound is df), None)
+        if name not in _published:
+            return None
+        frame = _published[name]
+        base = getattr(self._base, frame)
+        if not base.index.is_monotonic_increasing:
+            return None
+        selected = filter(base, *selection, **kwargs)
+        if self._changes[frame] or self._owners.get(frame):
+            if frame not in self._addedRows:
+                self._addedRows[frame] = self._newRows(frame, base, list(self._changes[frame]))
+            added = self._addedRows[frame]
+            selected = self._applySelected(frame, selected, filter.__wrapped__(added, *selection, **kwargs) if len(added) else added)
+        selected = selected.copy(deep=False)
+        selected.attrs['overlay'] = _Binding(self)
+        return selected
+
+    def _bound(self, name, df):
+        ''' df, published under name, with the overlay in attrs: df.acl() and the frames selected from df use the overlay '''
+        if not isinstance(df, pd.DataFrame):
+            return df
+        (source, bound) = self._boundFrames.get(name, (None, None))
+        if source is not df:
+            bound = df.copy(deep=False)
+            bound.attrs['overlay'] = _Binding(self)
+            self._boundFrames[name] = (df, bound)
+        return bound
+
+    # changes
+
+    def permit(self, profile, id, access='READ', classname=None, volume='', delete=False):
+        ''' PERMIT profile [CLASS(classname)] ID(id) ACCESS(access), or DELETE with delete=True.
+        Without classname, profile is a data set profile.  A permit for id on the profile replaces the old one. '''
+        if classname:
+            (frame, key, row) = ('_generalAccess', (classname, profile, id),
+                                 {'GRACC_RECORD_TYPE': '0505', 'GRACC_NAME': profile, 'GRACC_CLASS_NAME': classname,
+                                  'GRACC_AUTH_ID': id, 'GRACC_ACCESS': access, 'GRACC_ACCESS_CNT': '0'})
+        else:
+            (frame, key, row) = ('_datasetAccess', (profile, id),
+                                 {'DSACC_RECORD_TYPE': '0404', 'DSACC_NAME': profile, 'DSACC_VOL': volume,
+                                  'DSACC_AUTH_ID': id, 'DSACC_ACCESS': access, 'DSACC_ACCESS_CNT': '0'})
+        self._changes[frame][key] = None if delete else row
+        self._changed(frame, key)
+        return self
+
+    def connect_user(self, group, userid, authority='USE', special=False, operations=False, auditor=False):
+        ''' CONNECT userid GROUP(group) AUTHORITY(authority), with group-SPECIAL, -OPERATIONS or -AUDITOR '''
+        flag = lambda on: 'YES' if on else 'NO'
+        self._changes['_connectData'][(group, userid)] = {
+            **{column: '' for column in self._base._connectData.columns},
+            'USCON_RECORD_TYPE': '0205', 'USCON_NAME': userid, 'USCON_GRP_ID': group,
+            'USCON_CONNECT_DATE': date.today().isoformat(), 'USCON_OWNER_ID': group, 'USCON_UACC': 'NONE', 'USCON_INIT_CNT': '0',
+            'USCON_GRP_ADSP': 'NO', 'USCON_GRP_SPECIAL': flag(special), 'USCON_GRP_OPER': flag(operations), 'USCON_REVOKE': 'NO',
+            'USCON_GRP_ACC': 'NO', 'USCON_NOTERMUACC': 'NO', 'USCON_GRP_AUDIT': flag(auditor), 'GPMEM_AUTH': authority}
+        self._changes['_connects'][(group, userid)] = {
+            'GPMEM_RECORD_TYPE': '0102', 'GPMEM_NAME': group, 'GPMEM_MEMBER_ID': userid, 'GPMEM_AUTH': authority}
+        self._changed('_connectData', (group, userid))
+        self._changed('_connects', (group, userid))
+        return self
+
+    def remove_user(self, group, userid):
+        ''' REMOVE userid GROUP(group) '''
+        for frame in ['_connectData', '_connects']:
+            self._changes[frame][(group, userid)] = None
+            self._changed(frame, (group, userid))
+        return self
+
+    def owner(self, profile, owner, classname=None):
+        ''' ALTDSD profile OWNER(owner), or RALTER classname profile OWNER(owner) '''
+        (frame, key) = ('_generals', (classname, profile)) if classname else ('_datasets', profile)
+        self._owners[frame][key] = owner
+        self._changed(frame, key)
+        return self
+
+    # results
+
+    def _affectedProfiles(self, admin):
+        ''' {entity (DS, GR): profile keys} whose access, or admins with admin=True, may change '''
+        groups = {group for (group, userid) in self._changes['_connectData']}
+        if admin and groups:
+            # group special applies to profiles owned by the group, or by groups it owns, directly or further down
+            lines = self._base._ownertreeLines
+            if lines is not None:
+                groups |= set(lines.index[lines['OWNER_IDS'].isin(groups)])
+        affected = {}
+        for (entity, access, profiles, profileLevels) in [('DS', '_datasetAccess', '_datasets', 1), ('GR', '_generalAccess', '_generals', 2)]:
+            keys = {key[:profileLevels] if profileLevels > 1 else key[0] for key in self._changes[access]}
+            keys |= set(self._owners[profiles])
+            if groups:
+                for df in {id(f): f for f in (getattr(self._base, access), self._frame(access))}.values():
+                    if df is None or df.empty:
+                        continue
+                    onAcl = df.index.get_level_values(-2).isin(groups)
+                    if profileLevels > 1:
+                        keys |= set(zip(df.index.get_level_values(0)[onAcl], df.index.get_level_values(1)[onAcl]))
+                    else:
+                        keys |= set(df.index.get_level_values(0)[onAcl])
+                if admin:
+                    owned = self._frame(profiles)
+                    if not owned.empty:
+                        owned = owned.loc[owned[_frames[profiles][0] + '_OWNER_ID'].isin(groups).to_numpy()]
+                        keys |= set(owned.index)
+            affected[entity] = keys
+        return affected
+
+    def diff(self, admin=False):
+        ''' resolved access that changes on the profiles affected by the changes: CLASS_NAME (DATASET for data set profiles),
+        NAME, VOL, USER_ID, the permit (AUTH_ID) and ACCESS before and after, and CHANGE (added, removed, changed).
+        With admin=True also the users that gain or lose the ability to change the ACL, with AUTHORITY and VIA. '''
+        from . import RACF
+        columns = ['CLASS_NAME', 'NAME', 'VOL', 'USER_ID', 'AUTH_ID_BEFORE', 'ACCESS_BEFORE', 'AUTH_ID_AFTER', 'ACCESS_AFTER', 'CHANGE']
+        results = []
+        for (entity, keys) in self._affectedProfiles(admin).items():
+            profiles = '_datasets' if entity == 'DS' else '_generals'
+            if not keys or self._base.parsed(entity + 'BD') == 0:
+                continue
+            acls = []
+            for (source, frame) in [(self._base, getattr(self._base, profiles)), (self, self._frame(profiles))]:
+                frame = frame.loc[frame.index.isin(list(keys))]
+                acls.append(RACF.acl(source, frame, resolve=True, admin=admin) if len(frame) else pd.DataFrame(columns=['ACCESS']))
+            condition = [c for c in ['CATYPE', 'CANAME'] if any(c in acl.columns for acl in acls)]
+            keyColumns = ['CLASS_NAME', 'NAME', 'VOL', 'USER_ID'] + condition
+            # the same columns before and after, data set profiles have CLASS_NAME DATASET, general resources VOL blank
+            (before, after) = [acl.assign(CLASS_NAME='DATASET') if entity == 'DS' else acl.assign(VOL=' ') for acl in acls]
+            allColumns = list(dict.fromkeys(list(before.columns) + list(after.columns)))
+            (before, after) = [acl.assign(**{c: ' ' for c in allColumns if c not in acl.columns})[allColumns] for acl in (before, after)]
+            # rows that are the same before and after are left out before merging, most rows of a large ACL don't change
+            (hashBefore, hashAfter) = [pd.Index(pd.util.hash_pandas_object(acl, index=False)) for acl in (before, after)]
+            (before, after) = (before.loc[~hashBefore.isin(hashAfter)], after.loc[~hashAfter.isin(hashBefore)])
+            isAdmin = [acl['ADMIN_ID'].gt(' ').to_numpy() if admin else np.zeros(len(acl), dtype=bool) for acl in (before, after)]
+
+            access = pd.merge(before.loc[~isAdmin[0]], after.loc[~isAdmin[1]], how='outer', on=keyColumns, suffixes=('_BEFORE', '_AFTER'))
+            access = access.loc[access['ACCESS_BEFORE'].ne(access['ACCESS_AFTER'])].copy()
+            access['CHANGE'] = np.where(access['ACCESS_BEFORE'].isna(), 'added', np.where(access['ACCESS_AFTER'].isna(), 'removed', 'changed'))
+            results.append(access)
+
+            if admin:
+                adminColumns = ['CLASS_NAME', 'NAME', 'VOL', 'ADMIN_ID', 'AUTHORITY', 'VIA']
+                admins = pd.merge(before.loc[isAdmin[0], adminColumns].drop_duplicates(), after.loc[isAdmin[1], adminColumns].drop_duplicates(),
+                                  how='outer', on=adminColumns, indicator=True)
+                admins = admins.loc[admins['_merge'] != 'both']
+                results.append(pd.DataFrame({**{c: admins[c].to_numpy() for c in adminColumns if c != 'ADMIN_ID'},
+                                             'USER_ID': admins['ADMIN_ID'].to_numpy(),
+                                             'CHANGE': np.where(admins['_merge'] == 'right_only', 'added', 'removed')}))
+        if admin:
+            columns += ['AUTHORITY', 'VIA']
+        if any('CATYPE' in r.columns for r in results):
+            columns[4:4] = ['CATYPE', 'CANAME']
+        results = [r for r in results if len(r)]
+        if not results:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(results, ignore_index=True, sort=False).reindex(columns=columns).fillna(' ')\
+                 .sort_values(['CLASS_NAME', 'NAME', 'VOL', 'USER_ID'], kind='stable').reset_index(drop=True)
@@ -0,0 +1,98 @@
+''' Hash index from the index fields of a frame to row positions, for single profile and batch lookups that do not
+need .loc on a (possibly non-unique, unsorted) index. '''
+
+import threading
+import weakref
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+
+def keyPositions(keys):
+    ''' dict from each key in keys (an Index or MultiIndex) to its row position, an int when the keys are unique,
+    otherwise an array of the positions of the key in frame order '''
+    if keys.is_unique:
+        return dict(zip(keys, range(len(keys))))
+    codes, uniques = pd.factorize(keys, use_na_sentinel=False)
+    order = np.argsort(codes, kind='stable')  # row positions grouped by key, in frame order
+    bounds = np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1]
+    return dict(zip(uniques, np.split(order, bounds)))
+
+
+class ProfileIndex:
+    ''' dict from index key (str, or tuple for multi-level indexes) to row positions in df.
+    Records are returned as namedtuples with the frame columns as attributes. '''
+
+    def __init__(self, df):
+        self.frame = weakref.ref(df)
+        self._positions = keyPositions(df.index)
+        self._arrays = None
+        self._record = None
+
+    def positions(self, key):
+        ''' row positions of key, empty when the key is not in the index '''
+        found = self._positions.get(key)
+        if found is None:
+            return np.empty(0, dtype=np.intp)
+        return np.atleast_1d(found)
+
+    def _columns(self, df):
+        ''' column values as numpy arrays and the record type, built on first use '''
+        if self._arrays is None:
+            self._arrays = [df.iloc[:, c].to_numpy() for c in range(df.shape[1])]
+            self._record = namedtuple('Record', df.columns, rename=True)
+        return (self._arrays, self._record)
+
+    def record(self, key):
+        ''' first row with key as namedtuple, None when the key is not in the index '''
+        found = self._positions.get(key)
+        if found is None:
+            return None
+        (arrays, record) = self._columns(self.frame())
+        position = found if isinstance(found, int) else found[0]
+        return record(*[a[position] for a in arrays])
+
+    def lookup(self, keys, frame=False):
+        ''' records for each key in keys, or one frame with the rows of all keys when frame=True '''
+        if frame:
+            positions = [self.positions(k) for k in keys]
+            return self.frame().iloc[np.concatenate(positions) if positions else []]
+        return [self.record(k) for k in keys]
+
+
+class InvertedIndex:
+    ''' dict from the values of one index level to row positions, e.g. AUTH_ID -> permits in DSACC, or
+    user ID -> connects in connectData '''
+
+    def __init__(self, df, level):
+        self.frame = weakref.ref(df)
+        self._positions = keyPositions(df.index.get_level_values(level))
+
+    def positions(self, keys):
+        ''' sorted row positions of all keys '''
+        found = [np.atleast_1d(self._positions[k]) for k in keys if k in self._positions]
+        return np.sort(np.concatenate(found)) if found else np.empty(0, dtype=np.intp)
+
+
+class ProfileIndexes:
+    ''' ProfileIndex (or InvertedIndex on a level) per frame, rebuilt when the frame was replaced by another object '''
+
+    def __init__(self):
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def get(self, df, level=None):
+        key = (id(df), level)
+        with self._lock:
+            index = self._indexes.get(key)
+        if index is None or index.frame() is not df:
+            index = ProfileIndex(df) if level is None else InvertedIndex(df, level)
+            with self._lock:
+                self._indexes = {k: x for (k, x) in self._indexes.items() if x.frame() is not None}  # forget dropped frames
+                self._indexes[key] = index
+        return index
+
+    def clear(self):
+        with self._lock:
+            self._indexes = {}
@@ -0,0 +1,841 @@
+''' IRRDBU00 field positions per record type, generated by getOffsets.py from offsets.json, do not edit.
+(field name, start, end) with the 1-based start and end column of the field. '''
+
+schemaVersion = 'a48302cf39d2'
+
+recordOffsets = {'0100': (('GPBD_RECORD_TYPE', 1, 4),
+          ('GPBD_NAME', 6, 13),
+          ('GPBD_SUPGRP_ID', 15, 22),
+          ('GPBD_CREATE_DATE', 24, 33),
+          ('GPBD_OWNER_ID', 35, 42),
+          ('GPBD_UACC', 44, 51),
+          ('GPBD_NOTERMUACC', 53, 56),
+          ('GPBD_INSTALL_DATA', 58, 312),
+          ('GPBD_MODEL', 314, 357),
+          ('GPBD_UNIVERSAL', 359, 362)),
+ '0101': (('GPSGRP_RECORD_TYPE', 1, 4), ('GPSGRP_NAME', 6, 13), ('GPSGRP_SUBGRP_ID', 15, 22)),
+ '0102': (('GPMEM_RECORD_TYPE', 1, 4), ('GPMEM_NAME', 6, 13), ('GPMEM_MEMBER_ID', 15, 22), ('GPMEM_AUTH', 24, 31)),
+ '0103': (('GPINSTD_RECORD_TYPE', 1, 4),
+          ('GPINSTD_NAME', 6, 13),
+          ('GPINSTD_USR_NAME', 15, 22),
+          ('GPINSTD_USR_DATA', 24, 278),
+          ('GPINSTD_USR_FLAG', 280, 287)),
+ '0110': (('GPDFP_RECORD_TYPE', 1, 4),
+          ('GPDFP_NAME', 6, 13),
+          ('GPDFP_DATAAPPL', 15, 22),
+          ('GPDFP_DATACLAS', 24, 31),
+          ('GPDFP_MGMTCLAS', 33, 40),
+          ('GPDFP_STORCLAS', 42, 49)),
+ '0120': (('GPOMVS_RECORD_TYPE', 1, 4), ('GPOMVS_NAME', 6, 13), ('GPOMVS_GID', 15, 24)),
+ '0130': (('GPOVM_RECORD_TYPE', 1, 4), ('GPOVM_NAME', 6, 13), ('GPOVM_GID', 15, 24)),
+ '0141': (('GPTME_RECORD_TYPE', 1, 4), ('GPTME_NAME', 6, 13), ('GPTME_ROLE', 15, 260)),
+ '0151': (('GPCSD_RECORD_TYPE', 1, 4),
+          ('GPCSD_NAME', 6, 13),
+          ('GPCSD_TYPE', 15, 18),
+          ('GPCSD_KEY', 20, 51),
+          ('GPCSD_VALUE', 53, 1152)),
+ '0200': (('USBD_RECORD_TYPE', 1, 4),
+          ('USBD_NAME', 6, 13),
+          ('USBD_CREATE_DATE', 15, 24),
+          ('USBD_OWNER_ID', 26, 33),
+          ('USBD_ADSP', 35, 38),
+          ('USBD_SPECIAL', 40, 43),
+          ('USBD_OPER', 45, 48),
+          ('USBD_REVOKE', 50, 53),
+          ('USBD_GRPACC', 55, 58),
+          ('USBD_PWD_INTERVAL', 60, 62),
+          ('USBD_PWD_DATE', 64, 73),
+          ('USBD_PROGRAMMER', 75, 94),
+          ('USBD_DEFGRP_ID', 96, 103),
+          ('USBD_LASTJOB_TIME', 105, 112),
+          ('USBD_LASTJOB_DATE', 114, 123),
+          ('USBD_INSTALL_DATA', 125, 379),
+          ('USBD_UAUDIT', 381, 384),
+          ('USBD_AUDITOR', 386, 389),
+          ('USBD_NOPWD', 391, 394),
+          ('USBD_OIDCARD', 396, 399),
+          ('USBD_PWD_GEN', 401, 403),
+          ('USBD_REVOKE_CNT', 405, 407),
+          ('USBD_MODEL', 409, 452),
+          ('USBD_SECLEVEL', 454, 456),
+          ('USBD_REVOKE_DATE', 458, 467),
+          ('USBD_RESUME_DATE', 469, 478),
+          ('USBD_ACCESS_SUN', 480, 483),
+          ('USBD_ACCESS_MON', 485, 488),
+          ('USBD_ACCESS_TUE', 490, 493),
+          ('USBD_ACCESS_WED', 495, 498),
+          ('USBD_ACCESS_THU', 500, 503),
+          ('USBD_ACCESS_FRI', 505, 508),
+          ('USBD_ACCESS_SAT', 510, 513),
+          ('USBD_START_TIME', 515, 522),
+          ('USBD_END_TIME', 524, 531),
+          ('USBD_SECLABEL', 533, 540),
+          ('USBD_ATTRIBS', 542, 549),
+          ('USBD_PWDENV_EXISTS', 551, 554),
+          ('USBD_PWD_ASIS', 556, 559),
+          ('USBD_PHR_DATE', 561, 570),
+          ('USBD_PHR_GEN', 572, 574),
+          ('USBD_CERT_SEQN', 576, 585),
+          ('USBD_PPHENV_EXISTS', 587, 590),
+          ('USBD_PWD_ALG', 592, 603),
+          ('USBD_LEG_PWDHIST_CT', 605, 607),
+          ('USBD_XPW_PWDHIST_CT', 609, 611),
+          ('USBD_PHR_ALG', 613, 624),
+          ('USBD_LEG_PHRHIST_CT', 626, 628),
+          ('USBD_XPW_PHRHIST_CT', 630, 632),
+          ('USBD_ROAUDIT', 634, 637),
+          ('USBD_MFA_FALLBACK', 639, 641),
+          ('USBD_PHR_INTERVAL', 644, 648)),
+ '0201': (('USCAT_RECORD_TYPE', 1, 4), ('USCAT_NAME', 6, 13), ('USCAT_CATEGORY', 15, 19)),
+ '0202': (('USCLA_RECORD_TYPE', 1, 4), ('USCLA_NAME', 6, 13), ('USCLA_CLASS', 15, 22)),
+ '0203': (('USGCON_RECORD_TYPE', 1, 4), ('USGCON_NAME', 6, 13), ('USGCON_GRP_ID', 15, 22)),
+ '0204': (('USINSTD_RECORD_TYPE', 1, 4),
+          ('USINSTD_NAME', 6, 13),
+          ('USINSTD_USR_NAME', 15, 22),
+          ('USINSTD_USR_DATA', 24, 278),
+          ('USINSTD_USR_FLAG', 280, 287)),
+ '0205': (('USCON_RECORD_TYPE', 1, 4),
+          ('USCON_NAME', 6, 13),
+          ('USCON_GRP_ID', 15, 22),
+          ('USCON_CONNECT_DATE', 24, 33),
+          ('USCON_OWNER_ID', 35, 42),
+          ('USCON_LASTCON_TIME', 44, 51),
+          ('USCON_LASTCON_DATE', 53, 62),
+          ('USCON_UACC', 64, 71),
+          ('USCON_INIT_CNT', 73, 77),
+          ('USCON_GRP_ADSP', 79, 82),
+          ('USCON_GRP_SPECIAL', 84, 87),
+          ('USCON_GRP_OPER', 89, 92),
+          ('USCON_REVOKE', 94, 97),
+          ('USCON_GRP_ACC', 99, 102),
+          ('USCON_NOTERMUACC', 104, 107),
+          ('USCON_GRP_AUDIT', 109, 112),
+          ('USCON_REVOKE_DATE', 114, 123),
+          ('USCON_RESUME_DATE', 125, 134)),
+ '0206': (('USRSF_RECORD_TYPE', 1, 4),
+          ('USRSF_NAME', 6, 13),
+          ('USRSF_TARG_NODE', 15, 22),
+          ('USRSF_TARG_USER_ID', 24, 31),
+          ('USRSF_VERSION', 33, 35),
+          ('USRSF_PEER', 37, 40),
+          ('USRSF_MANAGING', 42, 45),
+          ('USRSF_MANAGED', 47, 50),
+          ('USRSF_REMOTE_PEND', 52, 55),
+          ('USRSF_LOCAL_PEND', 57, 60),
+          ('USRSF_PWD_SYNC', 62, 65),
+          ('USRSF_REM_REFUSAL', 67, 70),
+          ('USRSF_DEFINE_DATE', 72, 81),
+          ('USRSF_DEFINE_TIME', 83, 97),
+          ('USRSF_ACCEPT_DATE', 99, 108),
+          ('USRSF_ACCEPT_TIME', 110, 124),
+          ('USRSF_CREATOR_ID', 126, 133)),
+ '0207': (('USCERT_RECORD_TYPE', 1, 4),
+          ('USCERT_NAME', 6, 13),
+          ('USCERT_CERT_NAME', 15, 260),
+          ('USCERT_CERTLABL', 262, 293)),
+ '0208': (('USNMAP_RECORD_TYPE', 1, 4), ('USNMAP_NAME', 6, 13), ('USNMAP_LABEL', 15, 46), ('USNMAP_MAP_NAME', 48, 293)),
+ '0209': (('USDMAP_RECORD_TYPE', 1, 4), ('USDMAP_NAME', 6, 13), ('USDMAP_LABEL', 15, 46), ('USDMAP_MAP_NAME', 48, 293)),
+ '020A': (('USMFA_RECORD_TYPE', 1, 4),
+          ('USMFA_NAME', 6, 13),
+          ('USMFA_FACTOR_NAME', 15, 34),
+          ('USMFA_FACTOR_ACTIVE', 36, 54)),
+ '020B': (('USMPOL_RECORD_TYPE', 1, 4), ('USMPOL_NAME', 6, 13), ('USMPOL_POLICY_NAME', 15, 34)),
+ '0210': (('USDFP_RECORD_TYPE', 1, 4),
+          ('USDFP_NAME', 6, 13),
+          ('USDFP_DATAAPPL', 15, 22),
+          ('USDFP_DATACLAS', 24, 31),
+          ('USDFP_MGMTCLAS', 33, 40),
+          ('USDFP_STORCLAS', 42, 49)),
+ '0220': (('USTSO_RECORD_TYPE', 1, 4),
+          ('USTSO_NAME', 6, 13),
+          ('USTSO_ACCOUNT', 15, 54),
+          ('USTSO_COMMAND', 56, 135),
+          ('USTSO_DEST', 137, 144),
+          ('USTSO_HOLD_CLASS', 146, 146),
+          ('USTSO_JOB_CLASS', 148, 148),
+          ('USTSO_LOGON_PROC', 150, 157),
+          ('USTSO_LOGON_SIZE', 159, 168),
+          ('USTSO_MSG_CLASS', 170, 170),
+          ('USTSO_LOGON_MAX', 172, 181),
+          ('USTSO_PERF_GROUP', 183, 192),
+          ('USTSO_SYSOUT_CLASS', 194, 194),
+          ('USTSO_USER_DATA', 196, 203),
+          ('USTSO_UNIT_NAME', 205, 212),
+          ('USTSO_SECLABEL', 214, 221)),
+ '0230': (('USCICS_RECORD_TYPE', 1, 4),
+          ('USCICS_NAME', 6, 13),
+          ('USCICS_OPIDENT', 15, 17),
+          ('USCICS_OPPRTY', 19, 23),
+          ('USCICS_NOFORCE', 25, 28),
+          ('USCICS_TIMEOUT', 30, 34)),
+ '0231': (('USCOPC_RECORD_TYPE', 1, 4), ('USCOPC_NAME', 6, 13), ('USCOPC_OPCLASS', 15, 17)),
+ '0232': (('USCRSL_RECORD_TYPE', 1, 4), ('USCRSL_NAME', 6, 13), ('USCRSL_KEY', 15, 19)),
+ '0233': (('USCTSL_RECORD_TYPE', 1, 4), ('USCTSL_NAME', 6, 13), ('USCTSL_KEY', 15, 19)),
+ '0240': (('USLAN_RECORD_TYPE', 1, 4), ('USLAN_NAME', 6, 13), ('USLAN_PRIMARY', 15, 17), ('USLAN_SECONDARY', 19, 21)),
+ '0250': (('USOPR_RECORD_TYPE', 1, 4),
+          ('USOPR_NAME', 6, 13),
+          ('USOPR_STORAGE', 15, 19),
+          ('USOPR_MASTERAUTH', 21, 24),
+          ('USOPR_ALLAUTH', 26, 29),
+          ('USOPR_SYSAUTH', 31, 34),
+          ('USOPR_IOAUTH', 36, 39),
+          ('USOPR_CONSAUTH', 41, 44),
+          ('USOPR_INFOAUTH', 46, 49),
+          ('USOPR_TIMESTAMP', 51, 54),
+          ('USOPR_SYSTEMID', 56, 59),
+          ('USOPR_JOBID', 61, 64),
+          ('USOPR_MSGID', 66, 69),
+          ('USOPR_X', 71, 74),
+          ('USOPR_WTOR', 76, 79),
+          ('USOPR_IMMEDIATE', 81, 84),
+          ('USOPR_CRITICAL', 86, 89),
+          ('USOPR_EVENTUAL', 91, 94),
+          ('USOPR_INFO', 96, 99),
+          ('USOPR_NOBRODCAST', 101, 104),
+          ('USOPR_ALL', 106, 109),
+          ('USOPR_JOBNAMES', 111, 114),
+          ('USOPR_JOBNAMEST', 116, 119),
+          ('USOPR_SESS', 121, 124),
+          ('USOPR_SESST', 126, 129),
+          ('USOPR_STATUS', 131, 134),
+          ('USOPR_ROUTECODE001', 136, 139),
+          ('USOPR_ROUTECODE002', 141, 144),
+          ('USOPR_ROUTECODE003', 146, 149),
+          ('USOPR_ROUTECODE004', 151, 154),
+          ('USOPR_ROUTECODE005', 156, 159),
+          ('USOPR_ROUTECODE006', 161, 164),
+          ('USOPR_ROUTECODE007', 166, 169),
+          ('USOPR_ROUTECODE008', 171, 174),
+          ('USOPR_ROUTECODE009', 176, 179),
+          ('USOPR_ROUTECODE010', 181, 184),
+          ('USOPR_ROUTECODE011', 186, 189),
+          ('USOPR_ROUTECODE012', 191, 194),
+          ('USOPR_ROUTECODE013', 196, 199),
+          ('USOPR_ROUTECODE014', 201, 204),
+          ('USOPR_ROUTECODE015', 206, 209),
+          ('USOPR_ROUTECODE016', 211, 214),
+          ('USOPR_ROUTECODE017', 216, 219),
+          ('USOPR_ROUTECODE018', 221, 224),
+          ('USOPR_ROUTECODE019', 226, 229),
+          ('USOPR_ROUTECODE020', 231, 234),
+          ('USOPR_ROUTECODE021', 236, 239),
+          ('USOPR_ROUTECODE022', 241, 244),
+          ('USOPR_ROUTECODE023', 246, 249),
+          ('USOPR_ROUTECODE024', 251, 254),
+          ('USOPR_ROUTECODE025', 256, 259),
+          ('USOPR_ROUTECODE026', 261, 264),
+          ('USOPR_ROUTECODE027', 266, 269),
+          ('USOPR_ROUTECODE028', 271, 274),
+          ('USOPR_ROUTECODE029', 276, 279),
+          ('USOPR_ROUTECODE030', 281, 284),
+          ('USOPR_ROUTECODE031', 286, 289),
+          ('USOPR_ROUTECODE032', 291, 294),
+          ('USOPR_ROUTECODE033', 296, 299),
+          ('USOPR_ROUTECODE034', 301, 304),
+          ('USOPR_ROUTECODE035', 306, 309),
+          ('USOPR_ROUTECODE036', 311, 314),
+          ('USOPR_ROUTECODE037', 316, 319),
+          ('USOPR_ROUTECODE038', 321, 324),
+          ('USOPR_ROUTECODE039', 326, 329),
+          ('USOPR_ROUTECODE040', 331, 334),
+          ('USOPR_ROUTECODE041', 336, 339),
+          ('USOPR_ROUTECODE042', 341, 344),
+          ('USOPR_ROUTECODE043', 346, 349),
+          ('USOPR_ROUTECODE044', 351, 354),
+          ('USOPR_ROUTECODE045', 356, 359),
+          ('USOPR_ROUTECODE046', 361, 364),
+          ('USOPR_ROUTECODE047', 366, 369),
+          ('USOPR_ROUTECODE048', 371, 374),
+          ('USOPR_ROUTECODE049', 376, 379),
+          ('USOPR_ROUTECODE050', 381, 384),
+          ('USOPR_ROUTECODE051', 386, 389),
+          ('USOPR_ROUTECODE052', 391, 394),
+          ('USOPR_ROUTECODE053', 396, 399),
+          ('USOPR_ROUTECODE054', 401, 404),
+          ('USOPR_ROUTECODE055', 406, 409),
+          ('USOPR_ROUTECODE056', 411, 414),
+          ('USOPR_ROUTECODE057', 416, 419),
+          ('USOPR_ROUTECODE058', 421, 424),
+          ('USOPR_ROUTECODE059', 426, 429),
+          ('USOPR_ROUTECODE060', 431, 434),
+          ('USOPR_ROUTECODE061', 436, 439),
+          ('USOPR_ROUTECODE062', 441, 444),
+          ('USOPR_ROUTECODE063', 446, 449),
+          ('USOPR_ROUTECODE064', 451, 454),
+          ('USOPR_ROUTECODE065', 456, 459),
+          ('USOPR_ROUTECODE066', 461, 464),
+          ('USOPR_ROUTECODE067', 466, 469),
+          ('USOPR_ROUTECODE068', 471, 474),
+          ('USOPR_ROUTECODE069', 476, 479),
+          ('USOPR_ROUTECODE070', 481, 484),
+          ('USOPR_ROUTECODE071', 486, 489),
+          ('USOPR_ROUTECODE072', 491, 494),
+          ('USOPR_ROUTECODE073', 496, 499),
+          ('USOPR_ROUTECODE074', 501, 504),
+          ('USOPR_ROUTECODE075', 506, 509),
+          ('USOPR_ROUTECODE076', 511, 514),
+          ('USOPR_ROUTECODE077', 516, 519),
+          ('USOPR_ROUTECODE078', 521, 524),
+          ('USOPR_ROUTECODE079', 526, 529),
+          ('USOPR_ROUTECODE080', 531, 534),
+          ('USOPR_ROUTECODE081', 536, 539),
+          ('USOPR_ROUTECODE082', 541, 544),
+          ('USOPR_ROUTECODE083', 546, 549),
+          ('USOPR_ROUTECODE084', 551, 554),
+          ('USOPR_ROUTECODE085', 556, 559),
+          ('USOPR_ROUTECODE086', 561, 564),
+          ('USOPR_ROUTECODE087', 566, 569),
+          ('USOPR_ROUTECODE088', 571, 574),
+          ('USOPR_ROUTECODE089', 576, 579),
+          ('USOPR_ROUTECODE090', 581, 584),
+          ('USOPR_ROUTECODE091', 586, 589),
+          ('USOPR_ROUTECODE092', 591, 594),
+          ('USOPR_ROUTECODE093', 596, 599),
+          ('USOPR_ROUTECODE094', 601, 604),
+          ('USOPR_ROUTECODE095', 606, 609),
+          ('USOPR_ROUTECODE096', 611, 614),
+          ('USOPR_ROUTECODE097', 616, 619),
+          ('USOPR_ROUTECODE098', 621, 624),
+          ('USOPR_ROUTECODE099', 626, 629),
+          ('USOPR_ROUTECODE100', 631, 634),
+          ('USOPR_ROUTECODE101', 636, 639),
+          ('USOPR_ROUTECODE102', 641, 644),
+          ('USOPR_ROUTECODE103', 646, 649),
+          ('USOPR_ROUTECODE104', 651, 654),
+          ('USOPR_ROUTECODE105', 656, 659),
+          ('USOPR_ROUTECODE106', 661, 664),
+          ('USOPR_ROUTECODE107', 666, 669),
+          ('USOPR_ROUTECODE108', 671, 674),
+          ('USOPR_ROUTECODE109', 676, 679),
+          ('USOPR_ROUTECODE110', 681, 684),
+          ('USOPR_ROUTECODE111', 686, 689),
+          ('USOPR_ROUTECODE112', 691, 694),
+          ('USOPR_ROUTECODE113', 696, 699),
+          ('USOPR_ROUTECODE114', 701, 704),
+          ('USOPR_ROUTECODE115', 706, 709),
+          ('USOPR_ROUTECODE116', 711, 714),
+          ('USOPR_ROUTECODE117', 716, 719),
+          ('USOPR_ROUTECODE118', 721, 724),
+          ('USOPR_ROUTECODE119', 726, 729),
+          ('USOPR_ROUTECODE120', 731, 734),
+          ('USOPR_ROUTECODE121', 736, 739),
+          ('USOPR_ROUTECODE122', 741, 744),
+          ('USOPR_ROUTECODE123', 746, 749),
+          ('USOPR_ROUTECODE124', 751, 754),
+          ('USOPR_ROUTECODE125', 756, 759),
+          ('USOPR_ROUTECODE126', 761, 764),
+          ('USOPR_ROUTECODE127', 766, 769),
+          ('USOPR_ROUTECODE128', 771, 774),
+          ('USOPR_LOGCMDRESP', 776, 783),
+          ('USOPR_MIGRATIONID', 785, 788),
+          ('USOPR_DELOPERMSG', 790, 797),
+          ('USOPR_RETRIEVE_KEY', 799, 806),
+          ('USOPR_CMDSYS', 808, 815),
+          ('USOPR_UD', 817, 820),
+          ('USOPR_ALTGRP_ID', 822, 829),
+          ('USOPR_AUTO', 831, 834),
+          ('USOPR_HC', 836, 839),
+          ('USOPR_INT', 841, 844),
+          ('USOPR_UNKN', 846, 849)),
+ '0251': (('USOPRP_RECORD_TYPE', 1, 4), ('USOPRP_NAME', 6, 13), ('USOPRP_SYSTEM', 15, 22)),
+ '0260': (('USWRK_RECORD_TYPE', 1, 4),
+          ('USWRK_NAME', 6, 13),
+          ('USWRK_AREA_NAME', 15, 74),
+          ('USWRK_BUILDING', 76, 135),
+          ('USWRK_DEPARTMENT', 137, 196),
+          ('USWRK_ROOM', 198, 257),
+          ('USWRK_ADDR_LINE1', 259, 318),
+          ('USWRK_ADDR_LINE2', 320, 379),
+          ('USWRK_ADDR_LINE3', 381, 440),
+          ('USWRK_ADDR_LINE4', 442, 501),
+          ('USWRK_ACCOUNT', 503, 757),
+          ('USWRK_EMAIL_ADDRESS', 759, 1004)),
+ '0270': (('USOMVS_RECORD_TYPE', 1, 4),
+          ('USOMVS_NAME', 6, 13),
+          ('USOMVS_UID', 15, 24),
+          ('USOMVS_HOME_PATH', 26, 1048),
+          ('USOMVS_PROGRAM', 1050, 2072),
+          ('USOMVS_CPUTIMEMAX', 2074, 2083),
+          ('USOMVS_ASSIZEMAX', 2085, 2094),
+          ('USOMVS_FILEPROCMAX', 2096, 2105),
+          ('USOMVS_PROCUSERMAX', 2107, 2116),
+          ('USOMVS_THREADSMAX', 2118, 2127),
+          ('USOMVS_MMAPAREAMAX', 2129, 2138),
+          ('USOMVS_MEMLIMIT', 2140, 2148),
+          ('USOMVS_SHMEMAX', 2150, 2158)),
+ '0280': (('USNETV_RECORD_TYPE', 1, 4),
+          ('USNETV_NAME', 6, 13),
+          ('USNETV_IC', 15, 269),
+          ('USNETV_CONSNAME', 271, 278),
+          ('USNETV_CTL', 280, 287),
+          ('USNETV_MSGRECVR', 289, 292),
+          ('USNETV_NGMFADMN', 294, 297),
+          ('USNETV_NGMFVSPN', 299, 306)),
+ '0281': (('USNOPC_RECORD_TYPE', 1, 4), ('USNOPC_NAME', 6, 13), ('USNOPC_OPCLASS', 15, 19)),
+ '0282': (('USNDOM_RECORD_TYPE', 1, 4), ('USNDOM_NAME', 6, 13), ('USNDOM_DOMAINS', 15, 19)),
+ '0290': (('USDCE_RECORD_TYPE', 1, 4),
+          ('USDCE_NAME', 6, 13),
+          ('USDCE_UUID', 15, 50),
+          ('USDCE_DCE_NAME', 52, 1074),
+          ('USDCE_HOMECELL', 1076, 2098),
+          ('USDCE_HOMEUUID', 2100, 2135),
+          ('USDCE_AUTOLOGIN', 2137, 2140)),
+ '02A0': (('USOVM_RECORD_TYPE', 1, 4),
+          ('USOVM_NAME', 6, 13),
+          ('USOVM_UID', 15, 24),
+          ('USOVM_HOME_PATH', 26, 1048),
+          ('USOVM_PROGRAM', 1050, 2072),
+          ('USOVM_FSROOT', 2074, 3096)),
+ '02B0': (('USLNOT_RECORD_TYPE', 1, 4), ('USLNOT_NAME', 6, 13), ('USLNOT_SNAME', 15, 78)),
+ '02C0': (('USNDS_RECORD_TYPE', 1, 4), ('USNDS_NAME', 6, 13), ('USNDS_UNAME', 15, 260)),
+ '02D0': (('USKERB_RECORD_TYPE', 1, 4),
+          ('USKERB_NAME', 6, 13),
+          ('USKERB_KERBNAME', 15, 254),
+          ('USKERB_MAX_LIFE', 256, 265),
+          ('USKERB_KEY_VERS', 267, 269),
+          ('USKERB_ENCRYPT_DES', 271, 274),
+          ('USKERB_ENCRYPT_DES3', 276, 279),
+          ('USKERB_ENCRYPT_DESD', 281, 284),
+          ('USKERB_ENCRPT_A128', 286, 289),
+          ('USKERB_ENCRPT_A256', 291, 294),
+          ('USKERB_ENCRPT_A128SHA2', 296, 299),
+          ('USKERB_ENCRPT_A256SHA2', 301, 304),
+          ('USKERB_KEY_FROM', 351, 358)),
+ '02E0': (('USPROXY_RECORD_TYPE', 1, 4),
+          ('USPROXY_NAME', 6, 13),
+          ('USPROXY_LDAP_HOST', 15, 1037),
+          ('USPROXY_BIND_DN', 1039, 2061)),
+ '02F0': (('USEIM_RECORD_TYPE', 1, 4), ('USEIM_NAME', 6, 13), ('USEIM_LDAPPROF', 15, 260)),
+ '02G1': (('USCSD_RECORD_TYPE', 1, 4),
+          ('USCSD_NAME', 6, 13),
+          ('USCSD_TYPE', 15, 18),
+          ('USCSD_KEY', 20, 51),
+          ('USCSD_VALUE', 53, 1152)),
+ '1210': (('USMFAC_RECORD_TYPE', 1, 4),
+          ('USMFAC_NAME', 6, 13),
+          ('USMFAC_FACTOR_NAME', 15, 34),
+          ('USMFAC_TAG_NAME', 36, 55),
+          ('USMFAC_TAG_VALUE', 57, 1080)),
+ '0400': (('DSBD_RECORD_TYPE', 1, 4),
+          ('DSBD_NAME', 6, 49),
+          ('DSBD_VOL', 51, 56),
+          ('DSBD_GENERIC', 58, 61),
+          ('DSBD_CREATE_DATE', 63, 72),
+          ('DSBD_OWNER_ID', 74, 81),
+          ('DSBD_LASTREF_DATE', 83, 92),
+          ('DSBD_LASTCHG_DATE', 94, 103),
+          ('DSBD_ALTER_CNT', 105, 109),
+          ('DSBD_CONTROL_CNT', 111, 115),
+          ('DSBD_UPDATE_CNT', 117, 121),
+          ('DSBD_READ_CNT', 123, 127),
+          ('DSBD_UACC', 129, 136),
+          ('DSBD_GRPDS', 138, 141),
+          ('DSBD_AUDIT_LEVEL', 143, 150),
+          ('DSBD_GRP_ID', 152, 159),
+          ('DSBD_DS_TYPE', 161, 168),
+          ('DSBD_LEVEL', 170, 172),
+          ('DSBD_DEVICE_NAME', 174, 181),
+          ('DSBD_GAUDIT_LEVEL', 183, 190),
+          ('DSBD_INSTALL_DATA', 192, 446),
+          ('DSBD_AUDIT_OKQUAL', 448, 455),
+          ('DSBD_AUDIT_FAQUAL', 457, 464),
+          ('DSBD_GAUDIT_OKQUAL', 466, 473),
+          ('DSBD_GAUDIT_FAQUAL', 475, 482),
+          ('DSBD_WARNING', 484, 487),
+          ('DSBD_SECLEVEL', 489, 491),
+          ('DSBD_NOTIFY_ID', 493, 500),
+          ('DSBD_RETENTION', 502, 506),
+          ('DSBD_ERASE', 508, 511),
+          ('DSBD_SECLABEL', 513, 520),
+          ('DSBD_RESERVED_01', 522, 526),
+          ('DSBD_RESERVED_02', 528, 532)),
+ '0401': (('DSCAT_RECORD_TYPE', 1, 4), ('DSCAT_NAME', 6, 49), ('DSCAT_VOL', 51, 56), ('DSCAT_CATEGORY', 58, 62)),
+ '0402': (('DSCACC_RECORD_TYPE', 1, 4),
+          ('DSCACC_NAME', 6, 49),
+          ('DSCACC_VOL', 51, 56),
+          ('DSCACC_CATYPE', 58, 65),
+          ('DSCACC_CANAME', 67, 74),
+          ('DSCACC_AUTH_ID', 76, 83),
+          ('DSCACC_ACCESS', 85, 92),
+          ('DSCACC_ACCESS_CNT', 94, 98),
+          ('DSCACC_NET_ID', 100, 107),
+          ('DSCACC_CACRITERIA', 109, 352)),
+ '0403': (('DSVOL_RECORD_TYPE', 1, 4), ('DSVOL_NAME', 6, 49), ('DSVOL_VOL', 51, 56), ('DSVOL_VOL_NAME', 58, 63)),
+ '0404': (('DSACC_RECORD_TYPE', 1, 4),
+          ('DSACC_NAME', 6, 49),
+          ('DSACC_VOL', 51, 56),
+          ('DSACC_AUTH_ID', 58, 65),
+          ('DSACC_ACCESS', 67, 74),
+          ('DSACC_ACCESS_CNT', 76, 80)),
+ '0405': (('DSINSTD_RECORD_TYPE', 1, 4),
+          ('DSINSTD_NAME', 6, 49),
+          ('DSINSTD_VOL', 51, 56),
+          ('DSINSTD_USR_NAME', 58, 65),
+          ('DSINSTD_USR_DATA', 67, 321),
+          ('DSINSTD_USR_FLAG', 323, 330)),
+ '0406': (('DSMEM_RECORD_TYPE', 1, 4),
+          ('DSMEM_NAME', 6, 49),
+          ('DSMEM_VOL', 51, 56),
+          ('DSMEM_MEMBER_NAME', 58, 65),
+          ('DSMEM_AUTH_ID', 67, 74),
+          ('DSMEM_ACCESS', 76, 83)),
+ '0410': (('DSDFP_RECORD_TYPE', 1, 4),
+          ('DSDFP_NAME', 6, 49),
+          ('DSDFP_VOL', 51, 56),
+          ('DSDFP_RESOWNER_ID', 58, 65),
+          ('DSDFP_DATAKEY', 67, 130)),
+ '0421': (('DSTME_RECORD_TYPE', 1, 4),
+          ('DSTME_NAME', 6, 49),
+          ('DSTME_VOL', 51, 56),
+          ('DSTME_ROLE_NAME', 58, 303),
+          ('DSTME_ACCESS_AUTH', 305, 312),
+          ('DSTME_COND_CLASS', 314, 321),
+          ('DSTME_COND_PROF', 323, 568)),
+ '0431': (('DSCSD_RECORD_TYPE', 1, 4),
+          ('DSCSD_NAME', 6, 49),
+          ('DSCSD_VOL', 51, 56),
+          ('DSCSD_TYPE', 58, 61),
+          ('DSCSD_KEY', 63, 94),
+          ('DSCSD_VALUE', 96, 1195)),
+ '0500': (('GRBD_RECORD_TYPE', 1, 4),
+          ('GRBD_NAME', 6, 251),
+          ('GRBD_CLASS_NAME', 253, 260),
+          ('GRBD_GENERIC', 262, 265),
+          ('GRBD_CLASS', 267, 269),
+          ('GRBD_CREATE_DATE', 271, 280),
+          ('GRBD_OWNER_ID', 282, 289),
+          ('GRBD_LASTREF_DATE', 291, 300),
+          ('GRBD_LASTCHG_DATE', 302, 311),
+          ('GRBD_ALTER_CNT', 313, 317),
+          ('GRBD_CONTROL_CNT', 319, 323),
+          ('GRBD_UPDATE_CNT', 325, 329),
+          ('GRBD_READ_CNT', 331, 335),
+          ('GRBD_UACC', 337, 344),
+          ('GRBD_AUDIT_LEVEL', 346, 353),
+          ('GRBD_LEVEL', 355, 357),
+          ('GRBD_GAUDIT_LEVEL', 359, 366),
+          ('GRBD_INSTALL_DATA', 368, 622),
+          ('GRBD_AUDIT_OKQUAL', 624, 631),
+          ('GRBD_AUDIT_FAQUAL', 633, 640),
+          ('GRBD_GAUDIT_OKQUAL', 642, 649),
+          ('GRBD_GAUDIT_FAQUAL', 651, 658),
+          ('GRBD_WARNING', 660, 663),
+          ('GRBD_SINGLEDS', 665, 668),
+          ('GRBD_AUTO', 670, 673),
+          ('GRBD_TVTOC', 675, 678),
+          ('GRBD_NOTIFY_ID', 680, 687),
+          ('GRBD_ACCESS_SUN', 689, 692),
+          ('GRBD_ACCESS_MON', 694, 697),
+          ('GRBD_ACCESS_TUE', 699, 702),
+          ('GRBD_ACCESS_WED', 704, 707),
+          ('GRBD_ACCESS_THU', 709, 712),
+          ('GRBD_ACCESS_FRI', 714, 717),
+          ('GRBD_ACCESS_SAT', 719, 722),
+          ('GRBD_START_TIME', 724, 731),
+          ('GRBD_END_TIME', 733, 740),
+          ('GRBD_ZONE_OFFSET', 742, 746),
+          ('GRBD_ZONE_DIRECT', 748, 748),
+          ('GRBD_SECLEVEL', 750, 752),
+          ('GRBD_APPL_DATA', 754, 1008),
+          ('GRBD_SECLABEL', 1010, 1017)),
+ '0501': (('GRTVOL_RECORD_TYPE', 1, 4),
+          ('GRTVOL_NAME', 6, 251),
+          ('GRTVOL_CLASS_NAME', 253, 260),
+          ('GRTVOL_SEQUENCE', 262, 266),
+          ('GRTVOL_CREATE_DATE', 268, 277),
+          ('GRTVOL_DISCRETE', 279, 282),
+          ('GRTVOL_INTERN_NAME', 284, 327),
+          ('GRTVOL_INTERN_VOLS', 329, 583),
+          ('GRTVOL_CREATE_NAME', 585, 628)),
+ '0502': (('GRCAT_RECORD_TYPE', 1, 4),
+          ('GRCAT_NAME', 6, 251),
+          ('GRCAT_CLASS_NAME', 253, 260),
+          ('GRCAT_CATEGORY', 262, 266)),
+ '0503': (('GRMEM_RECORD_TYPE', 1, 4),
+          ('GRMEM_NAME', 6, 251),
+          ('GRMEM_CLASS_NAME', 253, 260),
+          ('GRMEM_MEMBER', 262, 516),
+          ('GRMEM_GLOBAL_ACC', 518, 525),
+          ('GRMEM_PADS_DATA', 527, 534),
+          ('GRMEM_VOL_NAME', 536, 541),
+          ('GRMEM_VMEVENT_DATA', 543, 547),
+          ('GRMEM_SECLEVEL', 549, 553),
+          ('GRMEM_CATEGORY', 555, 559)),
+ '0504': (('GRVOL_RECORD_TYPE', 1, 4),
+          ('GRVOL_NAME', 6, 251),
+          ('GRVOL_CLASS_NAME', 253, 260),
+          ('GRVOL_VOL_NAME', 262, 267)),
+ '0505': (('GRACC_RECORD_TYPE', 1, 4),
+          ('GRACC_NAME', 6, 251),
+          ('GRACC_CLASS_NAME', 253, 260),
+          ('GRACC_AUTH_ID', 262, 269),
+          ('GRACC_ACCESS', 271, 278),
+          ('GRACC_ACCESS_CNT', 280, 284)),
+ '0506': (('GRINSTD_RECORD_TYPE', 1, 4),
+          ('GRINSTD_NAME', 6, 251),
+          ('GRINSTD_CLASS_NAME', 253, 260),
+          ('GRINSTD_USR_NAME', 262, 269),
+          ('GRINSTD_USR_DATA', 271, 525),
+          ('GRINSTD_USR_FLAG', 527, 534)),
+ '0507': (('GRCACC_RECORD_TYPE', 1, 4),
+          ('GRCACC_NAME', 6, 251),
+          ('GRCACC_CLASS_NAME', 253, 260),
+          ('GRCACC_CATYPE', 262, 269),
+          ('GRCACC_CANAME', 271, 278),
+          ('GRCACC_AUTH_ID', 280, 287),
+          ('GRCACC_ACCESS', 289, 296),
+          ('GRCACC_ACCESS_CNT', 298, 302),
+          ('GRCACC_NET_ID', 304, 311),
+          ('GRCACC_CACRITERIA', 313, 556)),
+ '0508': (('GRFLTR_RECORD_TYPE', 1, 4),
+          ('GRFLTR_NAME', 6, 251),
+          ('GRFLTR_CLASS_NAME', 253, 260),
+          ('GRFLTR_LABEL', 262, 293),
+          ('GRFLTR_STATUS', 295, 302),
+          ('GRFLTR_USER', 304, 549),
+          ('GRFLTR_CREATE_NAME', 551, 1061)),
+ '0509': (('GRDMAP_RECORD_TYPE', 1, 4),
+          ('GRDMAP_NAME', 6, 251),
+          ('GRDMAP_CLASS_NAME', 253, 260),
+          ('GRDMAP_LABEL', 262, 293),
+          ('GRDMAP_USER', 295, 302),
+          ('GRDMAP_DIDREG', 304, 558)),
+ '0510': (('GRSES_RECORD_TYPE', 1, 4),
+          ('GRSES_NAME', 6, 251),
+          ('GRSES_CLASS_NAME', 253, 260),
+          ('GRSES_SESSION_KEY', 262, 269),
+          ('GRSES_LOCKED', 271, 274),
+          ('GRSES_KEY_DATE', 276, 285),
+          ('GRSES_KEY_INTERVAL', 287, 291),
+          ('GRSES_SLS_FAIL', 293, 297),
+          ('GRSES_MAX_FAIL', 299, 303),
+          ('GRSES_CONVSEC', 305, 312)),
+ '0511': (('GRSESE_RECORD_TYPE', 1, 4),
+          ('GRSESE_NAME', 6, 251),
+          ('GRSESE_CLASS_NAME', 253, 260),
+          ('GRSESE_ENTITY_NAME', 262, 296),
+          ('GRSESE_FAIL_CNT', 298, 302)),
+ '0520': (('GRDLF_RECORD_TYPE', 1, 4),
+          ('GRDLF_NAME', 6, 251),
+          ('GRDLF_CLASS_NAME', 253, 260),
+          ('GRDLF_RETAIN', 262, 265)),
+ '0521': (('GRDLFJ_RECORD_TYPE', 1, 4),
+          ('GRDLFJ_NAME', 6, 251),
+          ('GRDLFJ_CLASS_NAME', 253, 260),
+          ('GRDLFJ_JOB_NAME', 262, 269)),
+ '0530': (('GRSIGN_RECORD_TYPE', 1, 4),
+          ('GRSIGN_NAME', 6, 251),
+          ('GRSIGN_CLASS_NAME', 253, 260),
+          ('GRSIGN_PROTECTION', 262, 325),
+          ('GRSIGN_KEY_LABEL', 327, 390),
+          ('GRSIGN_TYPE', 392, 403),
+          ('GRSIGN_TIMEOUT', 405, 414),
+          ('GRSIGN_REPLAY', 416, 419)),
+ '0540': (('GRST_RECORD_TYPE', 1, 4),
+          ('GRST_NAME', 6, 251),
+          ('GRST_CLASS_NAME', 253, 260),
+          ('GRST_USER_ID', 262, 269),
+          ('GRST_GROUP_ID', 271, 278),
+          ('GRST_TRUSTED', 280, 283),
+          ('GRST_PRIVILEGED', 285, 288),
+          ('GRST_TRACE', 290, 293)),
+ '0550': (('GRSV_RECORD_TYPE', 1, 4),
+          ('GRSV_NAME', 6, 251),
+          ('GRSV_CLASS_NAME', 253, 260),
+          ('GRSV_SCRIPT_NAME', 262, 269),
+          ('GRSV_PARM_NAME', 271, 278)),
+ '0560': (('GRCERT_RECORD_TYPE', 1, 4),
+          ('GRCERT_NAME', 6, 251),
+          ('GRCERT_CLASS_NAME', 253, 260),
+          ('GRCERT_START_DATE', 262, 271),
+          ('GRCERT_START_TIME', 273, 280),
+          ('GRCERT_END_DATE', 282, 291),
+          ('GRCERT_END_TIME', 293, 300),
+          ('GRCERT_KEY_TYPE', 302, 309),
+          ('GRCERT_KEY_SIZE', 311, 320),
+          ('GRCERT_LAST_SERIAL', 322, 337),
+          ('GRCERT_RING_SEQN', 339, 348),
+          ('GRCERT_GEN_REQ', 350, 353)),
+ '0561': (('CERTR_RECORD_TYPE', 1, 4),
+          ('CERTR_NAME', 6, 251),
+          ('CERTR_CLASS_NAME', 253, 260),
+          ('CERTR_RING_NAME', 262, 507)),
+ '0562': (('KEYR_RECORD_TYPE', 1, 4),
+          ('KEYR_NAME', 6, 251),
+          ('KEYR_CLASS_NAME', 253, 260),
+          ('KEYR_CERT_NAME', 262, 507),
+          ('KEYR_CERT_USAGE', 509, 516),
+          ('KEYR_CERT_DEFAULT', 518, 521),
+          ('KEYR_CERT_LABEL', 523, 554)),
+ '0570': (('GRTME_RECORD_TYPE', 1, 4),
+          ('GRTME_NAME', 6, 251),
+          ('GRTME_CLASS_NAME', 253, 260),
+          ('GRTME_PARENT', 262, 507)),
+ '0571': (('GRTMEC_RECORD_TYPE', 1, 4),
+          ('GRTMEC_NAME', 6, 251),
+          ('GRTMEC_CLASS_NAME', 253, 260),
+          ('GRTMEC_CHILD', 262, 507)),
+ '0572': (('GRTMER_RECORD_TYPE', 1, 4),
+          ('GRTMER_NAME', 6, 251),
+          ('GRTMER_CLASS_NAME', 253, 260),
+          ('GRTMER_ORIGIN_ROLE', 262, 507),
+          ('GRTMER_PROF_CLASS', 509, 516),
+          ('GRTMER_PROF_NAME', 518, 763),
+          ('GRTMER_ACCESS_AUTH', 765, 772),
+          ('GRTMER_COND_CLASS', 774, 781),
+          ('GRTMER_COND_PROF', 783, 1028)),
+ '0573': (('GRTMEG_RECORD_TYPE', 1, 4),
+          ('GRTMEG_NAME', 6, 251),
+          ('GRTMEG_CLASS_NAME', 253, 260),
+          ('GRTMEG_GROUP', 262, 269)),
+ '0574': (('GRTMEE_RECORD_TYPE', 1, 4),
+          ('GRTMEE_NAME', 6, 251),
+          ('GRTMEE_CLASS_NAME', 253, 260),
+          ('GRTMEE_ROLE_NAME', 262, 507),
+          ('GRTMEE_ACCESS_AUTH', 509, 516),
+          ('GRTMEE_COND_CLASS', 518, 525),
+          ('GRTMEE_COND_PROF', 527, 772)),
+ '0580': (('GRKERB_RECORD_TYPE', 1, 4),
+          ('GRKERB_NAME', 6, 251),
+          ('GRKERB_CLASS_NAME', 253, 260),
+          ('GRKERB_KERBNAME', 262, 501),
+          ('GRKERB_MIN_LIFE', 503, 512),
+          ('GRKERB_MAX_LIFE', 514, 523),
+          ('GRKERB_DEF_LIFE', 525, 534),
+          ('GRKERB_KEY_VERS', 536, 538),
+          ('GRKERB_ENCRYPT_DES', 540, 543),
+          ('GRKERB_ENCRYPT_DES3', 545, 548),
+          ('GRKERB_ENCRYPT_DESD', 550, 553),
+          ('GRKERB_ENCRPT_A128', 555, 558),
+          ('GRKERB_ENCRPT_A256', 560, 563),
+          ('GRKERB_ENCRPT_A128SHA2', 565, 568),
+          ('GRKERB_ENCRPT_A256SHA2', 570, 573),
+          ('GRKERB_CHKADDRS', 620, 623)),
+ '0590': (('GRPROXY_RECORD_TYPE', 1, 4),
+          ('GRPROXY_NAME', 6, 251),
+          ('GRPROXY_CLASS_NAME', 253, 260),
+          ('GRPROXY_LDAP_HOST', 262, 1284),
+          ('GRPROXY_BIND_DN', 1286, 2308)),
+ '05A0': (('GREIM_RECORD_TYPE', 1, 4),
+          ('GREIM_NAME', 6, 251),
+          ('GREIM_CLASS_NAME', 253, 260),
+          ('GREIM_DOMAIN_DN', 262, 1284),
+          ('GREIM_ENABLE', 1286, 1289),
+          ('RESERVED', 1291, 1364),
+          ('GREIM_LOCAL_REG', 1366, 1620),
+          ('GREIM_KERBREG', 1622, 1876),
+          ('GREIM_X509REG', 1878, 2132)),
+ '05B0': (('GRALIAS_RECORD_TYPE', 1, 4),
+          ('GRALIAS_NAME', 6, 251),
+          ('GRALIAS_CLASS_NAME', 253, 260),
+          ('GRALIAS_IPLOOK', 262, 293)),
+ '05C0': (('GRCDT_RECORD_TYPE', 1, 4),
+          ('GRCDT_NAME', 6, 251),
+          ('GRCDT_CLASS_NAME', 253, 260),
+          ('GRCDT_POSIT', 262, 271),
+          ('GRCDT_MAXLENGTH', 273, 275),
+          ('GRCDT_MAXLENX', 277, 286),
+          ('GRCDT_DEFAULTRC', 288, 290),
+          ('GRCDT_KEYQUALIFIER', 292, 301),
+          ('GRCDT_GROUP', 303, 310),
+          ('GRCDT_MEMBER', 312, 319),
+          ('GRCDT_FIRST_ALPHA', 321, 324),
+          ('GRCDT_FIRST_NATL', 326, 329),
+          ('GRCDT_FIRST_NUM', 331, 334),
+          ('GRCDT_FIRST_SPEC', 336, 339),
+          ('GRCDT_OTHER_ALPHA', 341, 344),
+          ('GRCDT_OTHER_NATL', 346, 349),
+          ('GRCDT_OTHER_NUM', 351, 354),
+          ('GRCDT_OTHER_SPEC', 356, 359),
+          ('GRCDT_OPER', 361, 364),
+          ('GRCDT_DEFAULTUACC', 366, 373),
+          ('GRCDT_RACLIST', 375, 384),
+          ('GRCDT_GENLIST', 386, 395),
+          ('GRCDT_PROF_ALLOW', 397, 400),
+          ('GRCDT_SECL_REQ', 402, 405),
+          ('GRCDT_MACPROCESS', 407, 414),
+          ('GRCDT_SIGNAL', 416, 419),
+          ('GRCDT_CASE', 421, 428),
+          ('GRCDT_GENERIC', 430, 439)),
+ '05D0': (('GRICTX_RECORD_TYPE', 1, 4),
+          ('GRICTX_NAME', 6, 251),
+          ('GRICTX_CLASS_NAME', 253, 260),
+          ('GRICTX_USEMAP', 262, 265),
+          ('GRICTX_DOMAP', 267, 270),
+          ('GRICTX_MAPREQ', 272, 275),
+          ('GRICTX_MAP_TIMEOUT', 277, 281)),
+ '05E0': (('GRCFDEF_RECORD_TYPE', 1, 4),
+          ('GRCFDEF_NAME', 6, 251),
+          ('GRCFDEF_CLASS', 253, 260),
+          ('GRCFDEF_TYPE', 262, 265),
+          ('GRCFDEF_MAXLEN', 267, 276),
+          ('GRCFDEF_MAXVAL', 278, 287),
+          ('GRCFDEF_MINVAL', 289, 298),
+          ('GRCFDEF_FIRST', 300, 307),
+          ('GRCFDEF_OTHER', 309, 316),
+          ('GRCFDEF_MIXED', 318, 321),
+          ('GRCFDEF_HELP', 323, 577),
+          ('GRCFDEF_LISTHEAD', 579, 618),
+          ('GRCFDEF_VALREXX', 620, 627),
+          ('GRCFDEF_ACEE', 629, 632)),
+ '05F0': (('GRSIG_RECORD_TYPE', 1, 4),
+          ('GRSIG_NAME', 6, 251),
+          ('GRSIG_CLASS_NAME', 253, 260),
+          ('GRSIG_SIGREQUIRED', 262, 265),
+          ('GRSIG_FAILLOAD', 267, 276),
+          ('GRSIG_AUDIT', 278, 287)),
+ '05G0': (('GRCSF_RECORD_TYPE', 1, 4),
+          ('GRCSF_NAME', 6, 251),
+          ('GRCSF_CLASS_NAME', 253, 260),
+          ('GRCSF_EXPORTABLE', 262, 273),
+          ('GRCSF_USAGE', 275, 529),
+          ('GRCSF_CPACF_WRAP', 531, 533),
+          ('GRCSF_CPACF_RET', 535, 537)),
+ '05G1': (('GRCSFK_RECORD_TYPE', 1, 4),
+          ('GRCSFK_NAME', 6, 251),
+          ('GRCSFK_CLASS_NAME', 253, 260),
+          ('GRCSFK_LABEL', 262, 325)),
+ '05G2': (('GRCSFC_RECORD_TYPE', 1, 4),
+          ('GRCSFC_NAME', 6, 251),
+          ('GRCSFC_CLASS_NAME', 253, 260),
+          ('GRCSFC_LABEL', 262, 358)),
+ '05H0': (('GRMFA_RECORD_TYPE', 1, 4),
+          ('GRMFA_NAME', 6, 251),
+          ('GRMFA_CLASS_NAME', 253, 260),
+          ('GRMFA_FACTOR_DATA_LEN', 262, 266)),
+ '05I0': (('GRMFP_RECORD_TYPE', 1, 4),
+          ('GRMFP_NAME', 6, 251),
+          ('GRMFP_CLASS_NAME', 253, 260),
+          ('GRMFP_TOKEN_TIMEOUT', 262, 271),
+          ('GRMFP_REUSE', 273, 275)),
+ '05I1': (('GRMPF_RECORD_TYPE', 1, 4),
+          ('GRMPF_NAME', 6, 251),
+          ('GRMPF_CLASS_NAME', 253, 260),
+          ('GRMPF_POL_FACTOR', 262, 281)),
+ '05J1': (('GRCSD_RECORD_TYPE', 1, 4),
+          ('GRCSD_NAME', 6, 251),
+          ('GRCSD_CLASS_NAME', 253, 260),
+          ('GRCSD_TYPE', 262, 265),
+          ('GRCSD_KEY', 267, 298),
+          ('GRCSD_VALUE', 300, 1399)),
+ '05K0': (('GRIDTP_RECORD_TYPE', 1, 4),
+          ('GRIDTP_NAME', 6, 251),
+          ('GRIDTP_CLASS_NAME', 253, 260),
+          ('GRIDTP_SIG_TOKEN_NAME', 262, 293),
+          ('GRIDTP_SIG_SEQ_NUM', 295, 302),
+          ('GRIDTP_SIG_CAT', 304, 307),
+          ('GRIDTP_SIG_ALG', 309, 340),
+          ('GRIDTP_TIMEOUT', 342, 351),
+          ('GRIDTP_ANYAPPL', 353, 355),
+          ('GRIDTP_PROTALLOWED', 358, 361)),
+ '05L0': (('GRJES_RECORD_TYPE', 1, 4),
+          ('GRJES_NAME', 6, 251),
+          ('GRJES_CLASS_NAME', 253, 260),
+          ('GRJES_KEYLABEL', 262, 325)),
+ '1560': (('CERTN_RECORD_TYPE', 1, 4),
+          ('CERTN_NAME', 6, 251),
+          ('CERTN_CLASS_NAME', 253, 260),
+          ('CERTN_ISSUER_DN', 262, 1285),
+          ('CERTN_SUBJECT_DN', 1287, 2310),
+          ('CERTN_SIG_ALG', 2312, 2327),
+          ('CERTN_CERT_FGRPRNT', 2329, 2392))}
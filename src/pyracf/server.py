@@ -0,0 +1,288 @@
+''' Query server: loads a RACF snapshot once and answers requests from other processes, on localhost HTTP or a Unix socket.
+
+    python -m pyracf.server --pickles /data/pickles --prefix PROD- --port 8765
+    curl -s localhost:8765/call -d '{"method":"user","args":["IBMUSER"]}'
+    curl -s localhost:8765/frame -d '{"frame":"datasets","gfilter":["SYS1.**"],"acl":{"resolve":true}}'
+    curl -s localhost:8765/reload -d '{}'
+
+Requests run concurrently on threads.  reload loads the source given at startup again, next to the old snapshot, and then
+replaces it in one assignment, requests that already started finish on the snapshot they began with.  Clients cannot
+choose another source: loading pickles from a path a client sends would run code from those pickles.
+Python clients can use Client.
+'''
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+
+import pandas as pd
+
+from . import RACF, StoopidException
+
+# methods and properties that clients may use, none of them change the frames of the snapshot
+queryMethods = ['user', 'group', 'connect', 'dataset', 'datasetPermit', 'datasetConditionalPermit', 'general', 'generalPermit',
+                'generalConditionalPermit', 'access_of', 'access_of_many', 'getdatasetrisk', 'sql']
+queryFrames = ['users', 'groups', 'connectData', 'datasets', 'datasetAccess', 'datasetConditionalAccess', 'generals',
+               'generalAccess', 'generalConditionalAccess', 'generalMembers', 'specials', 'operations', 'auditors', 'revoked',
+               'groupsWithoutUsers', 'uacc_read_datasets', 'uacc_update_datasets', 'uacc_control_datasets', 'uacc_alter_datasets',
+               'groupAdmins', 'groupingMembers']
+frameFilters = ['gfilter', 'rfilter', 'pfilter', 'when']
+
+
+class NotFound(Exception):
+    ''' request for a path the server does not answer '''
+
+
+def load(irrdbu00=None, pickles=None, prefix=''):
+    ''' a RACF object ready for queries, from an unload or from pickles '''
+    if irrdbu00:
+        racf = RACF(irrdbu00)
+        racf.parse_t()
+    else:
+        racf = RACF(pickles=pickles, prefix=prefix)
+    if racf._state != RACF.STATE_READY:
+        raise StoopidException(f'Cannot load snapshot from {irrdbu00 or pickles}')
+    return racf
+
+
+class Snapshot:
+    ''' a loaded RACF object with the source it came from '''
+
+    def __init__(self, source, racf=None):
+        self.source = source
+        self.racf = racf or load(**source)
+        self.loaded = datetime.now()
+
+    def info(self):
+        return {'source': self.source, 'loaded': self.loaded.isoformat(), 'input-lines': self.racf.status['input-lines']}
+
+
+def _encode(result):
+    ''' JSON text for a query result, frames and series are sent with orient='split' '''
+    if isinstance(result, pd.DataFrame):
+        return '{"type":"frame","result":' + result.reset_index(drop=True).to_json(orient='split', index=False) + '}'
+    if isinstance(result, pd.Series):
+        return '{"type":"series","result":' + result.to_json(orient='split') + '}'
+    return json.dumps({'type': 'value', 'result': result}, default=str)
+
+
+class QueryServer:
+    ''' keeps the current Snapshot, answers /status, /call, /frame and /reload.
+    address is (host, port) for HTTP, or the path of a Unix socket, racf an already loaded RACF object for source. '''
+
+    def __init__(self, source, address=('127.0.0.1', 8765), racf=None):
+        self.snapshot = Snapshot(source, racf)
+        self.address = address
+        self._reloading = threading.Lock()
+        self._httpd = None
+
+    def reload(self, source=None):
+        ''' load a new snapshot, the same source when None, and switch to it when it is complete '''
+        with self._reloading:
+            snapshot = Snapshot(source or self.snapshot.source)
+            self.snapshot = snapshot
+        return snapshot.info()
+
+    def status(self):
+        return self.snapshot.info()
+
+    def call(self, racf, method, args=(), kwargs=None):
+        if method not in queryMethods:
+            raise KeyError(f'method {method} not supported, use one of {",".join(queryMethods)}')
+        return getattr(racf, method)(*args, **(kwargs or {}))
+
+    def frame(self, racf, frame, acl=None, **filters):
+        ''' frame, selected by one of the frameFilters, optionally transformed by acl with the options in acl '''
+        if frame not in queryFrames:
+            raise KeyError(f'frame {frame} not supported, use one of {",".join(queryFrames)}')
+        df = getattr(racf, frame)
+        for (name, selection) in filters.items():
+            if name not in frameFilters:
+                raise KeyError(f'filter {name} not supported, use one of {",".join(frameFilters)}')
+            df = getattr(RACF, name)(df, *selection)
+        # RACF.acl with this snapshot, df.acl( ) would use the RACF object that was created last
+        return RACF.acl(racf, df, **acl) if acl is not None else df
+
+    def handle(self, path, request):
+        ''' result of a request, path is /status, /call, /frame or /reload, request the decoded JSON body.
+        /reload only reloads the configured source, a request with another source is refused. '''
+        if path == '/reload':
+            if request:
+                raise PermissionError('reload loads the source the server was started with, it does not accept a source')
+            return self.reload()
+        racf = self.snapshot.racf  # one snapshot for the whole request, even when a reload completes meanwhile
+        if path == '/status':
+            return self.status()
+        if path == '/call':
+            return self.call(racf, **request)
+        if path == '/frame':
+            return self.frame(racf, **request)
+        raise NotFound(path)
+
+    def serve_forever(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def address_string(self):
+                return self.client_address[0] if self.client_address else 'unix'
+
+            def log_message(self, format, *args):
+                pass  # no log line per request
+
+            def respond(self, code, text):
+                body = text.encode('utf-8')
+                self.send_response(code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def run(self, request):
+                try:
+                    self.respond(200, _encode(server.handle(self.path, request)))
+                except NotFound:
+                    self.respond(404, json.dumps({'error': f'{self.path} not found'}))
+                except PermissionError as e:
+                    self.respond(403, json.dumps({'error': f'{e.__class__.__name__}: {e}'}))
+                except (StoopidException, KeyError, TypeError, ValueError, IndexError) as e:
+                    # bad arguments of a query, a failed reload is an error of the server
+                    self.respond(500 if self.path == '/reload' else 400, json.dumps({'error': f'{e.__class__.__name__}: {e}'}))
+                except Exception as e:
+                    self.respond(500, json.dumps({'error': f'{e.__class__.__name__}: {e}'}))
+
+            def do_GET(self):
+                self.run({})
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                try:
+                    request = json.loads(self.rfile.read(length) or b'{}')
+                except json.JSONDecodeError as e:
+                    return self.respond(400, json.dumps({'error': f'JSONDecodeError: {e}'}))
+                self.run(request)
+
+        if isinstance(self.address, str):
+            class UnixServer(ThreadingHTTPServer):
+                address_family = socket.AF_UNIX
+
+                def server_bind(self):
+                    if os.path.exists(self.server_address):
+                        os.remove(self.server_address)
+                    self.socket.bind(self.server_address)
+                    self.server_name, self.server_port = ('localhost', 0)
+            self._httpd = UnixServer(self.address, Handler)
+        else:
+            self._httpd = ThreadingHTTPServer(self.address, Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.serve_forever()
+
+    def start(self):
+        ''' serve on a daemon thread, returns when the server accepts requests '''
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        while self._httpd is None:
+            time.sleep(0.01)
+        return thread
+
+    def shutdown(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            if isinstance(self.address, str) and os.path.exists(self.address):
+                os.remove(self.address)
+
+    def watch(self, path, interval=60):
+        ''' reload whenever the modification time of path (the unload, or the pickle directory) changes '''
+        def poll():
+            seen = os.path.getmtime(path)
+            while True:
+                time.sleep(interval)
+                modified = os.path.getmtime(path)
+                if modified != seen:
+                    seen = modified
+                    self.reload()
+        threading.Thread(target=poll, daemon=True).start()
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=None):
+        super().__init__('localhost', timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+class Client:
+    ''' requests to a QueryServer, address is (host, port) or the path of the Unix socket.  Frames are returned as DataFrames.
+
+        c = Client(('127.0.0.1', 8765))
+        c.call('connect', 'SYS1')
+        c.frame('datasets', gfilter=['SYS1.**'], acl={'resolve': True})
+    '''
+
+    def __init__(self, address=('127.0.0.1', 8765), timeout=None):
+        self.address = address
+        self.timeout = timeout
+
+    def request(self, path, body=None):
+        connection = _UnixConnection(self.address, self.timeout) if isinstance(self.address, str)\
+                     else http.client.HTTPConnection(*self.address, timeout=self.timeout)
+        try:
+            connection.request('POST', path, json.dumps(body or {}), {'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            reply = json.loads(response.read())
+        finally:
+            connection.close()
+        if response.status != 200:
+            raise StoopidException(reply.get('error', f'HTTP {response.status}'))
+        if reply['type'] == 'frame':
+            return pd.read_json(StringIO(json.dumps(reply['result'])), orient='split', dtype=False)
+        if reply['type'] == 'series':
+            return pd.read_json(StringIO(json.dumps(reply['result'])), orient='split', typ='series', dtype=False)
+        return reply['result']
+
+    def status(self):
+        return self.request('/status')
+
+    def call(self, method, *args, **kwargs):
+        return self.request('/call', {'method': method, 'args': args, 'kwargs': kwargs})
+
+    def frame(self, frame, acl=None, **filters):
+        return self.request('/frame', {'frame': frame, 'acl': acl, **filters})
+
+    def reload(self):
+        ''' reload the source the server was started with '''
+        return self.request('/reload')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Answer pyracf queries on a snapshot that is loaded once.')
+    parser.add_argument('--unload', help='IRRDBU00 unload to parse')
+    parser.add_argument('--pickles', help='directory with pickles from save_pickles')
+    parser.add_argument('--prefix', default='', help='prefix of the pickles')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--socket', help='listen on this Unix socket instead of HTTP on host:port')
+    parser.add_argument('--watch', type=int, default=0, help='reload when the unload or pickle directory changes, check every WATCH seconds')
+    args = parser.parse_args()
+    if not args.unload and not args.pickles:
+        parser.error('specify --unload or --pickles')
+
+    server = QueryServer({'irrdbu00': args.unload} if args.unload else {'pickles': args.pickles, 'prefix': args.prefix},
+                         address=args.socket or (args.host, args.port))
+    if args.watch:
+        server.watch(args.unload or args.pickles, args.watch)
+    print(f'serving {server.status()} on {args.socket or f"{args.host}:{args.port}"}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
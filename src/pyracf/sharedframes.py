@@ -0,0 +1,175 @@
+''' Frames in shared memory, so worker processes can read _datasetAccess, _connectData etc. without a copy per worker.
+
+Each frame is stored in one multiprocessing.shared_memory block.  Numeric columns are stored as they are, object (str)
+columns as int32 codes into their distinct values, the distinct values are stored once as a pickle.  attach() in a
+worker maps the block and returns frames whose columns are views on it: numeric columns with their dtype, str columns
+and index levels as categoricals.
+
+Only the numeric columns and the codes are shared without a copy.  pandas needs Python str objects for the categories,
+so attach() unpickles the distinct values of each str column in each worker, once per process: a worker holds its own
+copy of the distinct values (user IDs, group names, profile names, ...), not of the rows.  For a frame of 72k permits
+that is 1.3 MB per worker, the codes are 2.6 MB and the frame itself 34 MB.
+
+    shared = SharedFrames({'_datasetAccess': r._datasetAccess, '_connectData': r._connectData})
+    ...  # pass shared.handle to the workers, frames = attach(shared.handle), detach(shared.handle) when done
+    shared.close()
+
+RACF.map_partitions() does this for a process pool.
+'''
+
+import multiprocessing
+import os
+import pickle
+import sys
+import uuid
+import weakref
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+_align = 8
+
+
+def _untracked(name=None, size=0):
+    ''' SharedMemory block that is not unlinked by the resource tracker when a process ends, the owner unlinks it '''
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, create=name is None, size=size, track=False)
+    shm = SharedMemory(name, create=name is None, size=size)
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+def _layout(df):
+    ''' (array, description) of each index level and column to store, str values replaced by codes '''
+    parts = []
+    for (kind, names, values) in [('index', df.index.names, [df.index.get_level_values(i) for i in range(df.index.nlevels)]),
+                                  ('column', df.columns, [df.iloc[:, c] for c in range(df.shape[1])])]:
+        for (name, series) in zip(names, values):
+            if series.dtype.kind in 'biufcmM':
+                parts.append((series.to_numpy(), {'kind': kind, 'name': name, 'dtype': series.dtype.str}))
+            else:
+                codes, uniques = pd.factorize(series)
+                parts.append((codes.astype(np.int32), {'kind': kind, 'name': name, 'dtype': np.dtype(np.int32).str,
+                                                       'values': pickle.dumps(list(uniques), protocol=pickle.HIGHEST_PROTOCOL)}))
+    return parts
+
+
+class SharedFrames:
+    ''' frames published in shared memory, handle is what attach() needs in another process.
+    The blocks remain until close() is called or this object is garbage collected. '''
+
+    def __init__(self, frames):
+        self.handle = {}
+        self._blocks = []
+        for (frameName, df) in frames.items():
+            parts = _layout(df)
+            offset = 0
+            for (array, description) in parts:
+                description.update(offset=offset, rows=len(array))
+                size = len(description.get('values', b''))
+                offset += -(-(array.nbytes + size) // _align) * _align
+            shm = _untracked(size=max(offset, 1))
+            for (array, description) in parts:
+                start = description['offset']
+                np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf, offset=start)[:] = array
+                if 'values' in description:
+                    values = description.pop('values')
+                    description['values'] = (start + array.nbytes, len(values))
+                    shm.buf[start + array.nbytes:start + array.nbytes + len(values)] = values
+            self._blocks.append(shm)
+            self.handle[frameName] = {'block': shm.name, 'token': uuid.uuid4().hex, 'parts': [d for (a, d) in parts]}
+        self._finalizer = weakref.finalize(self, SharedFrames._release, self.handle, self._blocks)
+
+    @staticmethod
+    def _release(handle, blocks):
+        detach(handle)
+        for shm in blocks:
+            try:
+                shm.close()
+            except BufferError:  # an array still uses the block, the mapping ends with it
+                pass
+            try:
+                if sys.version_info < (3, 13):
+                    resource_tracker.register(shm._name, 'shared_memory')  # unlink( ) unregisters it again
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def close(self):
+        ''' remove the shared memory blocks and detach them in this process, frames attached earlier remain usable in the
+        processes that have them '''
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def nbytes(self):
+        return sum(shm.size for shm in self._blocks)
+
+
+# blocks attached in this process by token, with a weak reference to their frame, so a pool worker maps each block once
+_attached = {}
+
+
+def _attachFrame(entry):
+    (shm, frame) = _attached.get(entry['token'], (None, lambda: None))
+    if frame() is not None:
+        return frame()
+    shm = shm or _untracked(entry['block'])
+    index, columns = [], {}
+    for description in entry['parts']:
+        array = np.ndarray(description['rows'], dtype=np.dtype(description['dtype']), buffer=shm.buf, offset=description['offset'])
+        if 'values' in description:
+            (start, size) = description['values']
+            array = pd.Categorical.from_codes(array, pickle.loads(shm.buf[start:start + size]), validate=False)
+        if description['kind'] == 'index':
+            index.append(pd.Index(array, name=description['name']))
+        else:
+            columns[description['name']] = array
+    df = pd.DataFrame(columns, index=pd.MultiIndex.from_arrays(index) if len(index) > 1 else index[0], copy=False)
+    _attached[entry['token']] = (shm, weakref.ref(df))
+    return df
+
+
+def attach(handle):
+    ''' dict of frames published in the SharedFrames that handle belongs to, the distinct str values are copied into this process '''
+    return {frameName: _attachFrame(entry) for (frameName, entry) in handle.items()}
+
+
+def detach(handle):
+    ''' forget the blocks of handle that were attached in this process.  The arrays of the frames refer to the mapping through
+    a memoryview of it, so the mapping ends when the last frame or array taken from it is collected, not before '''
+    for entry in handle.values():
+        if entry['token'] in _attached:
+            shm = _attached.pop(entry['token'])[0]
+            (shm._buf, shm._mmap) = (None, None)  # close( ) would unmap the block under the arrays that still use it
+            shm.close()
+
+
+def _runPartition(args):
+    (func, handle, frameName, positions) = args
+    frames = attach(handle)
+    return func(frames[frameName].iloc[positions], frames)
+
+
+def partitions(df, n):
+    ''' n arrays of row positions in df, rows of the same profile (first index level) are in the same partition '''
+    codes, uniques = pd.factorize(df.index.get_level_values(0))
+    bounds = np.linspace(0, len(uniques), n + 1).astype(int)
+    return [np.flatnonzero((codes >= lo) & (codes < hi)) for (lo, hi) in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+
+def mapPartitions(func, frames, frameName, n=None, processes=None, context=None):
+    ''' list with func(partition, frames) for n partitions by profile of frames[frameName], run in a process pool.
+    frames are published in shared memory for the duration of the call, func must be picklable (a module level function). '''
+    processes = processes or os.cpu_count()
+    parts = partitions(frames[frameName], n or processes)
+    with SharedFrames(frames) as shared:
+        with multiprocessing.get_context(context).Pool(processes) as pool:
+            return pool.map(_runPartition, [(func, shared.handle, frameName, p) for p in parts])
@@ -0,0 +1,314 @@
+''' Pickle snapshots of the RACF frames: saved and loaded on a thread pool, optionally compressed, with a manifest.
+
+The manifest ({prefix}manifest.json) lists the pickle file, record count, index levels and sort flag of each frame,
+with the schema version of the field definitions.  Each save writes its pickles under new names, with a generation
+({prefix}{record name}.{generation}.pickle), then replaces the manifest in one rename, and only then removes the
+pickles of the previous save.  A reader of the manifest sees either the previous snapshot or the complete new one,
+an interrupted save leaves the previous snapshot intact.  Loading reads only the files in the manifest, so pickles
+of record types that are no longer saved are not mixed in.
+
+SnapshotStore keeps a history of snapshots as deltas: the rows added and removed since the previous snapshot.
+'''
+
+import glob
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .schema import schemaVersion
+
+manifestFormat = 1
+compressionSuffix = {None: '', 'gzip': '.gz', 'bz2': '.bz2', 'xz': '.xz', 'zstd': '.zst'}
+compressionLevel = {'gzip': {'compresslevel': 1}, 'bz2': {'compresslevel': 1}, 'xz': {'preset': 1}}  # level 9 takes 10x longer for 15% less
+
+
+def manifestFile(path, prefix=''):
+    return os.path.join(path, f'{prefix}manifest.json')
+
+
+def readManifest(path, prefix=''):
+    ''' the manifest dict of the snapshot, None for pickles saved without a manifest '''
+    try:
+        with open(manifestFile(path, prefix)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _pickles(path, prefix, names):
+    ''' (record name, file) of each pickle in path, compressed or not '''
+    for fileName in sorted(glob.glob(os.path.join(glob.escape(path), f'{glob.escape(prefix)}*.pickle*'))):
+        name = os.path.basename(fileName)[len(prefix):].split('.')[0]
+        if name in names and not fileName.endswith('.tmp'):
+            yield (name, fileName)
+
+
+def pickleFiles(path, prefix, names):
+    ''' {record name: file} of the pickles in path, for snapshots without a manifest '''
+    return dict(_pickles(path, prefix, names))
+
+
+def _map(func, items, threads):
+    if threads <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='pyracf-io') as pool:
+        return list(pool.map(func, items))
+
+
+def saveFrames(frames, path, prefix='', compression=None, threads=1, names=(), timer=None, **info):
+    ''' write frames ({record name: frame}) as pickles in path, then the manifest, returns the manifest.
+    The pickles of earlier saves of the record names in names and in frames are removed after the manifest is replaced.
+    info is added to the manifest. '''
+    if compression not in compressionSuffix:
+        raise ValueError(f'compression must be one of {", ".join(str(c) for c in compressionSuffix)}')
+    os.makedirs(path, exist_ok=True)
+
+    options = {'method': compression, **compressionLevel.get(compression, {})} if compression else None
+    generation = uuid.uuid4().hex[:12]  # new file names, the files of the current manifest are not touched
+
+    def save(item):
+        (name, df) = item
+        fileName = f'{prefix}{name}.{generation}.pickle{compressionSuffix[compression]}'
+        target = os.path.join(path, fileName)
+        if timer:
+            with timer.phase(f'save.{name}', len(df)):
+                df.to_pickle(target + '.tmp', compression=options)
+        else:
+            df.to_pickle(target + '.tmp', compression=options)
+        return (name, target, {'file': fileName, 'records': len(df), 'index': list(df.index.names),
+                               'sorted': bool(df.attrs.get('sorted'))})
+
+    saved = _map(save, list(frames.items()), threads)
+    for (name, target, entry) in saved:
+        os.replace(target + '.tmp', target)
+    manifest = {'format': manifestFormat, 'schema': schemaVersion, 'created': datetime.now().isoformat(),
+                'compression': compression, 'generation': generation, **info,
+                'frames': {name: entry for (name, target, entry) in saved}}
+    with open(manifestFile(path, prefix) + '.tmp', 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifestFile(path, prefix) + '.tmp', manifestFile(path, prefix))
+    current = {target for (name, target, entry) in saved}
+    for (name, fileName) in _pickles(path, prefix, set(names) | set(frames)):
+        if fileName not in current:
+            os.remove(fileName)  # pickle of an earlier save, or of a record type that has no records now
+    return manifest
+
+
+def loadFrames(files, threads=1, timer=None, manifest=None):
+    ''' {record name: frame} read from files ({record name: file}), on threads threads.
+    With the manifest, the record count and index levels of each frame are checked.
+    Missing, truncated or corrupt pickles raise ValueError. '''
+    def read(fileName):
+        try:
+            return pd.read_pickle(fileName)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            raise ValueError(f'cannot read {fileName}: {e.__class__.__name__}: {e}') from e
+
+    def load(item):
+        (name, fileName) = item
+        if timer:
+            with timer.phase(f'load.{name}') as phase:
+                df = read(fileName)
+                phase['records'] = len(df)
+        else:
+            df = read(fileName)
+        if manifest:
+            entry = manifest['frames'][name]
+            if len(df) != entry['records'] or list(df.index.names) != entry['index']:
+                raise ValueError(f'{fileName} has {len(df)} records and index {list(df.index.names)}, '
+                                 f'the manifest says {entry["records"]} and {entry["index"]}')
+        return (name, df)
+
+    return dict(_map(load, list(files.items()), threads))
+
+
+
+class SnapshotStore:
+    ''' append-only store of snapshots, each saved as the rows that were added and removed since the previous one.
+
+    A row is identified by a hash of all its values, including the index, and a count of identical rows before it.  Each version
+    is a directory with pickles (written by saveFrames) of the added and removed rows of each frame, with a column _op
+    that is add or del.  The frames of a version are rebuilt from the deltas up to that version: a row is present when
+    the last operation on it is add.  When the columns or index of a frame change, its delta has all rows and replays
+    start there.  head holds the frames of the last version, to compute the next delta without a replay.
+
+        store = SnapshotStore('/data/racf-history')
+        store.append(mysys, date='2026-03-15')
+        store.frames(date='2026-03-31', names=['DSACC'])['DSACC']   # the permits as of 15 March
+        store.history('DSACC', 'SYS1.**')                          # changes to the permits of SYS1.**
+    '''
+
+    def __init__(self, path, compression='gzip', threads=1):
+        self.path = path
+        self.compression = compression
+        self.threads = threads
+        os.makedirs(path, exist_ok=True)
+        try:
+            with open(os.path.join(path, 'store.json')) as f:
+                self._catalog = json.load(f)
+        except FileNotFoundError:
+            self._catalog = {'format': manifestFormat, 'versions': []}
+
+    def _versionPath(self, version):
+        return os.path.join(self.path, f'v{version:06d}')
+
+    @property
+    def versions(self):
+        ''' DataFrame with the version, date, source, number of added and removed rows, and frames that were reset '''
+        return pd.DataFrame(self._catalog['versions'], columns=['version', 'date', 'source', 'added', 'removed', 'reset'])
+
+    def version(self, date=None):
+        ''' the last version saved on or before date (datetime or ISO string), the last version when date is None '''
+        versions = self._catalog['versions']
+        if date is not None:
+            versions = [v for v in versions if pd.Timestamp(v['date']) <= pd.Timestamp(date)]
+        if not versions:
+            raise ValueError(f'no snapshot in {self.path}' + (f' on or before {date}' if date is not None else ''))
+        return versions[-1]['version']
+
+    @staticmethod
+    def _rows(df, op):
+        ''' (df with _n numbering identical rows, so each row is unique, and _op; 64 bit hash of each row) '''
+        rows = df.reset_index()
+        hashes = pd.util.hash_pandas_object(rows, index=False).to_numpy()
+        rows['_n'] = pd.Series(hashes).groupby(hashes).cumcount().to_numpy()
+        rows['_op'] = op
+        return (rows.set_index(list(df.index.names)), hashes)
+
+    @staticmethod
+    def _delta(old, new):
+        ''' rows of new that are not in old with _op add, and rows of old that are not in new with _op del '''
+        ((oldRows, oldHashes), (newRows, newHashes)) = (SnapshotStore._rows(old, 'del'), SnapshotStore._rows(new, 'add'))
+        oldKeys = pd.MultiIndex.from_arrays([oldHashes, oldRows['_n'].to_numpy()])
+        newKeys = pd.MultiIndex.from_arrays([newHashes, newRows['_n'].to_numpy()])
+        delta = pd.concat([newRows.loc[~newKeys.isin(oldKeys)], oldRows.loc[~oldKeys.isin(newKeys)]])
+        if isinstance(delta.index, pd.MultiIndex):
+            delta.index = delta.index.remove_unused_levels()  # or the pickle has the values of all rows
+        return delta
+
+    def _head(self):
+        ''' frames of the last version '''
+        if not self._catalog['versions']:
+            return {}
+        last = self._catalog['versions'][-1]['version']
+        headPath = os.path.join(self.path, 'head')
+        manifest = readManifest(headPath)
+        if not manifest or manifest.get('version') != last:  # an append was interrupted
+            return self.frames(version=last, head=False)
+        files = {name: os.path.join(headPath, entry['file']) for (name, entry) in manifest['frames'].items()}
+        try:
+            return loadFrames(files, threads=self.threads, manifest=manifest)
+        except ValueError:  # head files that don't match its manifest, never use them as the base of a delta
+            return self.frames(version=last, head=False)
+
+    def append(self, frames, date=None, source=None):
+        ''' save frames ({record name: frame} or a RACF object) as the next version, dated date (default now).
+        Returns the version number. '''
+        if hasattr(frames, '_snapshotFrames'):
+            source = source or getattr(frames, '_irrdbu00', None)
+            frames = frames._snapshotFrames()
+        date = pd.Timestamp(date if date is not None else datetime.now())
+        versions = self._catalog['versions']
+        if versions and date < pd.Timestamp(versions[-1]['date']):
+            raise ValueError(f'{date} is before the last snapshot in {self.path} ({versions[-1]["date"]}), the store is append-only')
+        version = versions[-1]['version'] + 1 if versions else 1
+        head = self._head()
+
+        deltas = {}
+        reset = []
+        for name in sorted(set(head) | set(frames)):
+            (old, new) = (head.get(name), frames.get(name))
+            if new is None:
+                deltas[name] = self._rows(old, 'del')[0]
+            elif old is None or list(old.index.names) != list(new.index.names) or list(old.columns) != list(new.columns):
+                deltas[name] = self._rows(new, 'add')[0]
+                reset.append(name)
+            elif not old.equals(new):
+                deltas[name] = self._delta(old, new)
+        deltas = {name: delta for (name, delta) in deltas.items() if len(delta) or name in reset}
+
+        # the delta is complete when its directory has the final name, the catalog entry makes it visible
+        target = self._versionPath(version)
+        shutil.rmtree(target, ignore_errors=True)
+        shutil.rmtree(target + '.tmp', ignore_errors=True)
+        saveFrames(deltas, target + '.tmp', compression=self.compression, threads=self.threads, version=version, date=date.isoformat())
+        os.replace(target + '.tmp', target)
+        saveFrames(frames, os.path.join(self.path, 'head'), compression=self.compression, threads=self.threads,
+                   names=set(head) | set(frames), version=version)
+        versions.append({'version': version, 'date': date.isoformat(), 'source': source,
+                         'added': int(sum((d['_op'] == 'add').sum() for d in deltas.values())),
+                         'removed': int(sum((d['_op'] == 'del').sum() for d in deltas.values())), 'reset': reset})
+        catalogFile = os.path.join(self.path, 'store.json')
+        with open(catalogFile + '.tmp', 'w') as f:
+            json.dump(self._catalog, f, indent=2)
+        os.replace(catalogFile + '.tmp', catalogFile)
+        return version
+
+    def _deltas(self, name, first, last):
+        ''' the deltas of frame name in versions first..last, with the _version they belong to '''
+        files = {}
+        for version in range(first, last + 1):
+            manifest = readManifest(self._versionPath(version))
+            if manifest and name in manifest['frames']:
+                files[version] = os.path.join(self._versionPath(version), manifest['frames'][name]['file'])
+        frames = loadFrames(files, threads=self.threads)
+        return pd.concat([frames[v].assign(_version=v) for v in sorted(frames)]) if frames else None
+
+    def frames(self, date=None, version=None, names=None, head=True):
+        ''' {record name: frame} as saved in version, or in the last version on or before date.
+        Rows are in index order, rows with the same index in the order they were added. '''
+        version = version or self.version(date)
+        if head and version == self.version():
+            frames = self._head()
+            return {name: df for (name, df) in frames.items() if names is None or name in names}
+        versions = [v for v in self._catalog['versions'] if v['version'] <= version]
+        if names is None:
+            names = {name for v in versions for name in (readManifest(self._versionPath(v['version'])) or {'frames': {}})['frames']}
+        result = {}
+        for name in sorted(names):
+            first = max([v['version'] for v in versions if name in v['reset']], default=1)
+            rows = self._deltas(name, first, version)
+            if rows is None:
+                continue
+            indexNames = list(rows.index.names)
+            rows = rows.reset_index().drop(columns='_version')
+            rows = rows.drop_duplicates(subset=[c for c in rows.columns if c != '_op'], keep='last')
+            df = rows.loc[rows['_op'] == 'add'].drop(columns=['_op', '_n']).set_index(indexNames)
+            if len(df):
+                df.sort_index(kind='stable', inplace=True)
+                df.attrs['sorted'] = True
+                result[name] = df
+        return result
+
+    def history(self, name, key, since=None):
+        ''' rows of frame name (a record name like DSACC) that were added or removed, for the profile, user or group
+        key: a value of the first index level, or a tuple of the first levels, e.g. ('FACILITY', 'BPX.SUPERUSER').
+        Columns _version, _date and _op (add or del) tell when and what changed. '''
+        versions = self._catalog['versions']
+        first = self.version(since) if since is not None else 1
+        rows = self._deltas(name, first, versions[-1]['version'] if versions else 0)
+        if rows is None:
+            return pd.DataFrame()
+        key = key if isinstance(key, tuple) else (key,)
+        selected = np.ones(len(rows), dtype=bool)
+        for (level, value) in enumerate(key):
+            selected &= rows.index.get_level_values(level) == value
+        rows = rows.loc[selected].drop(columns='_n')
+        dates = {v['version']: pd.Timestamp(v['date']) for v in versions}
+        return rows.assign(_date=rows['_version'].map(dates))
+
+    def racf(self, date=None, version=None):
+        ''' RACF object with the frames of the last version on or before date, correlated as when loaded from pickles '''
+        from . import RACF
+        frames = self.frames(date=date, version=version)
+        with tempfile.TemporaryDirectory(prefix='pyracf-') as path:
+            saveFrames(frames, path, threads=self.threads)
+            return RACF(pickles=path)
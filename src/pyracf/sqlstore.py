@@ -0,0 +1,62 @@
+''' Export of the RACF frames to an SQLite database, so SQL queries and large joins run on disk instead of on frames in memory. '''
+
+import os
+import pathlib
+import sqlite3
+from contextlib import closing
+
+import pandas as pd
+
+
+def _sqlType(dtype):
+    if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'REAL'
+    return 'TEXT'
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def writeTable(connection, table, df, indexColumns=(), batch=10000):
+    ''' (re)create table with the columns of df, insert the rows in batches of executemany, then create the indexes:
+    one on indexColumns, and one on each of the other index columns by itself, e.g. DSACC_AUTH_ID '''
+    columns = list(df.columns)
+    connection.execute(f'DROP TABLE IF EXISTS {_quote(table)}')
+    connection.execute(f'CREATE TABLE {_quote(table)} ({", ".join(_quote(c)+" "+_sqlType(df[c].dtype) for c in columns)})')
+    insert = f'INSERT INTO {_quote(table)} VALUES ({",".join("?"*len(columns))})'
+    for start in range(0, len(df), batch):
+        part = df.iloc[start:start+batch]
+        # tolist() gives Python int/float/str that sqlite3 can bind, NaN is stored as NULL
+        values = [part[c].astype(str).tolist() if pd.api.types.is_datetime64_any_dtype(part[c].dtype) else part[c].tolist()
+                  for c in columns]
+        connection.executemany(insert, zip(*values))
+    indexColumns = [c for c in indexColumns if c in columns]
+    if indexColumns:
+        connection.execute(f'CREATE INDEX {_quote("ix_"+table)} ON {_quote(table)} ({",".join(_quote(c) for c in indexColumns)})')
+        for c in indexColumns[1:]:
+            connection.execute(f'CREATE INDEX {_quote("ix_"+c)} ON {_quote(table)} ({_quote(c)})')
+
+
+def export(frames, path, batch=10000):
+    ''' write frames, a dict of table name -> (df, index columns), to a new SQLite database in path.
+    The database is built in path.tmp and renamed when complete, so readers never see a partial database. '''
+    work = path + '.tmp'
+    if os.path.exists(work):
+        os.remove(work)
+    with closing(sqlite3.connect(work)) as connection:
+        connection.execute('PRAGMA journal_mode=OFF')  # a new file, no rollback needed
+        connection.execute('PRAGMA synchronous=OFF')
+        for (table, (df, indexColumns)) in frames.items():
+            writeTable(connection, table, df, indexColumns, batch)
+        connection.commit()
+    os.replace(work, path)
+    return path
+
+
+def query(path, sql, params=None):
+    ''' result of sql on the database in path as a DataFrame, the database is opened read-only '''
+    with closing(sqlite3.connect(pathlib.Path(path).absolute().as_uri()+'?mode=ro', uri=True)) as connection:
+        return pd.read_sql_query(sql, connection, params=params)
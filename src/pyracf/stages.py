@@ -0,0 +1,64 @@
+''' Named stages with dependencies, run concurrently on a thread pool, as used by RACF._correlate.
+
+A stage starts when all stages it runs after are done, stages without a path between them run at the same time.
+Each stage is timed as a phase of the PhaseTimer, unless it times itself. '''
+
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+Stage = namedtuple('Stage', ['name', 'func', 'after', 'timed'])
+
+
+class StageGraph:
+    ''' stages in the order they were added, a stage may only run after stages that were added before it.
+    Dependencies on stages that were not added (e.g. no records for the frame) are ignored. '''
+
+    def __init__(self, timer=None, prefix=''):
+        self.timer = timer
+        self.prefix = prefix
+        self.stages = {}
+
+    def add(self, name, func, after=(), timed=True):
+        self.stages[name] = Stage(name, func, tuple(a for a in after if a in self.stages), timed)
+
+    def needed(self, wanted=None):
+        ''' names of the wanted stages and the stages they run after, all stages when wanted is None '''
+        if wanted is None:
+            return list(self.stages)
+        needed = set()
+        todo = [w for w in wanted if w in self.stages]
+        while todo:
+            name = todo.pop()
+            if name not in needed:
+                needed.add(name)
+                todo.extend(self.stages[name].after)
+        return [name for name in self.stages if name in needed]
+
+    def _run(self, stage):
+        if stage.timed and self.timer:
+            with self.timer.phase(self.prefix + stage.name):
+                stage.func()
+        else:
+            stage.func()
+
+    def run(self, wanted=None, threads=4):
+        ''' run the wanted stages and their dependencies, on threads threads, or one after another when threads<=1 '''
+        names = self.needed(wanted)
+        if threads <= 1:
+            for name in names:
+                self._run(self.stages[name])
+            return names
+        done = set()
+        pending = list(names)
+        running = {}
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='pyracf-stage') as pool:
+            while pending or running:
+                for name in [n for n in pending if all(a in done for a in self.stages[n].after)]:
+                    pending.remove(name)
+                    running[pool.submit(self._run, self.stages[name])] = name
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    future.result()  # raise the exception of a failed stage, the pool waits for running stages
+                    done.add(name)
+        return names
@@ -0,0 +1,333 @@
+''' Synthetic IRRDBU00 unload generator.
+
+Builds a fixed-width unload file, using the field positions from schema.py, with a realistic mix of
+groups, users, connects, data set and general resource profiles and their permits.  The output is
+reproducible for a given seed and scale, so it can be used for tests and for comparing benchmark runs.
+
+    >>> from pyracf.synthetic import generate
+    >>> generate('/tmp/synthetic.unload', lines=100000, seed=42)
+
+or from the command line: python -m pyracf.synthetic /tmp/synthetic.unload --lines 100000
+'''
+
+import argparse
+import random
+from datetime import date, timedelta
+
+from .schema import recordOffsets
+
+_layouts = None
+
+def _layout():
+    ''' {record type: (line length, {field name: (start, end)})} from the schema, built once '''
+    global _layouts
+    if _layouts is None:
+        _layouts = {}
+        for (rtype, offsets) in recordOffsets.items():
+            fields = {name: (start, end) for (name, start, end) in offsets}
+            _layouts[rtype] = (max(end for (start, end) in fields.values()), fields)
+    return _layouts
+
+
+class UnloadWriter:
+    ''' write records as fixed-width lines, fields not specified are left blank '''
+    def __init__(self, file):
+        self.file = file
+        self.lines = 0
+        self.counts = {}
+
+    def write(self, rtype, **values):
+        (length, fields) = _layout()[rtype]
+        parts = [rtype]
+        pos = 4
+        for (start, end, value) in sorted((*fields[name], str(value)) for (name, value) in values.items()):
+            value = value[:end-start+1]
+            parts.append(' ' * (start-1-pos))
+            parts.append(value)
+            pos = start-1+len(value)
+        parts.append('\n')
+        self.file.write(''.join(parts))
+        self.lines += 1
+        self.counts[rtype] = self.counts.get(rtype, 0) + 1
+
+
+class SyntheticRACF:
+    ''' generate a RACF database of roughly `lines` unload records.
+    Fixed system profiles (SYS1, IBMUSER, SYS1.**, BPX.SUPERUSER, ...) are always present, the remaining
+    users, groups and profiles are scaled to the requested size. '''
+
+    accessLevels = ['NONE','EXECUTE','READ','UPDATE','CONTROL','ALTER']
+
+    def __init__(self, lines=10000, seed=0, today=date(2024,1,1)):
+        self.random = random.Random(seed)
+        self.today = today
+        self.lines = lines
+        self.nusers = max(40, lines // 13)
+        self.ngroups = max(12, self.nusers // 12)
+        self.ndatasets = max(30, lines // 11)
+        self.ngenerals = max(30, lines // 16)
+        self.dates = [(today - timedelta(days=d)).isoformat() for d in range(3651)]
+
+    # helpers
+    def date(self, maxdays=3650, mindays=0):
+        return self.dates[self.random.randint(mindays, maxdays)]
+
+    def pick(self, values, weights=None):
+        return self.random.choices(values, weights)[0]
+
+    def access(self):
+        return self.pick(self.accessLevels, [5, 3, 50, 25, 5, 12])
+
+    def generate(self, file):
+        w = UnloadWriter(file)
+        self.groups(w)
+        self.users(w)
+        self.datasets(w)
+        self.generals(w)
+        return w
+
+    # groups: SYS1 at the top, departments owned by SYS1 (group special propagates), teams below departments
+    def groups(self, w):
+        self.groupNames = ['SYS1','SYSCTLG','OMVSGRP','STCGRP','SECADM']
+        self.departments = [f'DEPT{d:04d}' for d in range(max(4, self.ngroups // 10))]
+        self.teams = [f'T{t:07d}' for t in range(self.ngroups - len(self.groupNames) - len(self.departments))]
+        self.supgrp = {'SYS1': ''}
+        self.owner = {'SYS1': 'IBMUSER'}
+        for g in self.groupNames[1:] + self.departments:
+            self.supgrp[g] = 'SYS1'
+            self.owner[g] = 'SYS1'
+        for t in self.teams:
+            dept = self.pick(self.departments)
+            self.supgrp[t] = dept
+            self.owner[t] = dept if self.random.random() < 0.7 else 'IBMUSER'
+        self.groupNames += self.departments + self.teams
+        subgroups = {}
+        for g in self.groupNames:
+            subgroups.setdefault(self.supgrp[g], []).append(g)
+        for g in self.groupNames:
+            w.write('0100', GPBD_NAME=g, GPBD_SUPGRP_ID=self.supgrp[g], GPBD_CREATE_DATE=self.date(),
+                    GPBD_OWNER_ID=self.owner[g], GPBD_UACC='NONE', GPBD_NOTERMUACC='NO', GPBD_UNIVERSAL='NO')
+            for sub in subgroups.get(g, []):
+                w.write('0101', GPSGRP_NAME=g, GPSGRP_SUBGRP_ID=sub)
+        for (i, g) in enumerate(self.groupNames):
+            if self.random.random() < 0.5:
+                gid = i if self.random.random() < 0.98 else self.random.randint(0, len(self.groupNames))
+                w.write('0120', GPOMVS_NAME=g, GPOMVS_GID=gid)
+
+    # users: fixed administrators, started task users and a scaled number of regular users
+    def users(self, w):
+        fixed = {'IBMUSER': ['SYS1','SYSCTLG','SECADM','OMVSGRP'],
+                 'SECADM1': ['SYS1','SECADM'],
+                 'SECADM2': ['SYS1','SECADM'],
+                 'SYSPROG1': ['SYS1','OMVSGRP'],
+                 'SYSPROG2': ['SYS1','OMVSGRP'],
+                 'OMVSKERN': ['OMVSGRP','STCGRP'],
+                 'STCUSER': ['STCGRP'],
+                 'CICSUSR': ['STCGRP'],
+                 'WEBSRV': ['STCGRP','OMVSGRP']}
+        self.userNames = list(fixed)
+        self.stcUsers = ['OMVSKERN','STCUSER','CICSUSR','WEBSRV']
+        connects = dict(fixed)
+        for u in range(self.nusers - len(fixed)):
+            userid = f'U{u:07d}'
+            self.userNames.append(userid)
+            groups = [self.pick(self.teams or self.departments)]
+            groups += self.random.sample(self.groupNames[5:], k=self.pick([0,1,2,3],[40,35,15,10]))
+            connects[userid] = list(dict.fromkeys(groups))
+        self.connects = connects
+        uid = 1
+        for userid in self.userNames:
+            special = 'YES' if userid in ('IBMUSER','SECADM1','SECADM2') or self.random.random() < 0.002 else 'NO'
+            oper = 'YES' if userid in ('IBMUSER','SYSPROG1') or self.random.random() < 0.002 else 'NO'
+            revoke = 'YES' if self.random.random() < 0.08 else 'NO'
+            lastuse = self.date(1500) if self.random.random() < 0.9 else ''
+            protected = userid in self.stcUsers
+            w.write('0200', USBD_NAME=userid, USBD_CREATE_DATE=self.date(), USBD_OWNER_ID=self.pick(['SYS1','SECADM',connects[userid][0]]),
+                    USBD_ADSP='NO', USBD_SPECIAL=special, USBD_OPER=oper, USBD_REVOKE=revoke, USBD_GRPACC='NO',
+                    USBD_PWD_INTERVAL='' if protected else 90, USBD_PWD_DATE='' if protected else self.date(1000),
+                    USBD_PROGRAMMER=f'NAME OF {userid}', USBD_DEFGRP_ID=connects[userid][0],
+                    USBD_LASTJOB_TIME='12:00:00' if lastuse else '', USBD_LASTJOB_DATE=lastuse,
+                    USBD_UAUDIT='NO', USBD_AUDITOR='YES' if userid=='SECADM2' else 'NO', USBD_NOPWD='YES' if protected else 'NO',
+                    USBD_OIDCARD='NO', USBD_PWD_GEN=self.random.randint(0,40), USBD_REVOKE_CNT=0,
+                    USBD_REVOKE_DATE=self.date(200) if revoke=='YES' else '', USBD_ATTRIBS='',
+                    USBD_PWDENV_EXISTS='NO' if protected else 'YES', USBD_PWD_ASIS='NO',
+                    USBD_PHR_DATE=self.date(1000) if self.random.random() < 0.2 else '', USBD_PHR_GEN=0,
+                    USBD_PWD_ALG='' if protected else 'KDFAES', USBD_ROAUDIT='NO', USBD_MFA_FALLBACK='NO')
+            for g in connects[userid]:
+                auth = 'JOIN' if userid=='IBMUSER' else self.pick(['USE','CREATE','CONNECT','JOIN'],[90,4,4,2])
+                grpspecial = 'YES' if userid in ('IBMUSER','SECADM1') or self.random.random() < 0.01 else 'NO'
+                w.write('0205', USCON_NAME=userid, USCON_GRP_ID=g, USCON_CONNECT_DATE=self.date(),
+                        USCON_OWNER_ID=g, USCON_LASTCON_DATE=self.date(800), USCON_UACC='NONE', USCON_INIT_CNT=self.random.randint(0,9999),
+                        USCON_GRP_ADSP='NO', USCON_GRP_SPECIAL=grpspecial, USCON_GRP_OPER='NO', USCON_REVOKE='NO',
+                        USCON_GRP_ACC='NO', USCON_NOTERMUACC='NO', USCON_GRP_AUDIT='NO')
+                w.write('0102', GPMEM_NAME=g, GPMEM_MEMBER_ID=userid, GPMEM_AUTH=auth)
+            if userid in ('IBMUSER','OMVSKERN') or self.random.random() < 0.6:
+                if userid in ('IBMUSER','OMVSKERN','WEBSRV') or self.random.random() < 0.002:
+                    omvsuid = 0
+                elif self.random.random() < 0.01:
+                    omvsuid = self.random.randint(1, uid)  # shared UID
+                else:
+                    uid += 1
+                    omvsuid = uid
+                w.write('0270', USOMVS_NAME=userid, USOMVS_UID=omvsuid, USOMVS_HOME_PATH=f'/u/{userid.lower()}', USOMVS_PROGRAM='/bin/sh')
+            if self.random.random() < 0.3:
+                w.write('0220', USTSO_NAME=userid, USTSO_ACCOUNT='ACCT#', USTSO_LOGON_PROC='IKJACCNT', USTSO_LOGON_SIZE=2096128)
+            if self.random.random() < 0.1:
+                w.write('02G1', USCSD_NAME=userid, USCSD_TYPE='CHAR', USCSD_KEY='DEPTNAME', USCSD_VALUE=connects[userid][0])
+                w.write('02G1', USCSD_NAME=userid, USCSD_TYPE='NUM', USCSD_KEY='EMPLOYEE', USCSD_VALUE=self.random.randint(1000,99999))
+                w.write('02G1', USCSD_NAME=userid, USCSD_TYPE='FLAG', USCSD_KEY='CONTRACT', USCSD_VALUE=self.pick(['YES','NO']))
+
+    def authid(self):
+        r = self.random.random()
+        if r < 0.55:
+            return self.pick(self.groupNames)
+        elif r < 0.97:
+            return self.pick(self.userNames)
+        elif r < 0.99:
+            return '*'
+        else:
+            return f'GONE{self.random.randint(0,999):04d}'  # orphan permit
+
+    def permits(self, w, rtype, prefix, n, **key):
+        seen = set()
+        for _ in range(n):
+            authid = self.authid()
+            if authid in seen:
+                continue
+            seen.add(authid)
+            w.write(rtype, **key, **{f'{prefix}_AUTH_ID': authid, f'{prefix}_ACCESS': self.access(),
+                                     f'{prefix}_ACCESS_CNT': self.random.randint(0,99)})
+
+    def datasets(self, w):
+        profiles = [('SYS1.**','NONE','SYS1'), ('SYS1.PARMLIB','NONE','SYS1'), ('SYS1.LINKLIB','READ','SYS1'),
+                    ('SYS1.PROCLIB','READ','SYS1'), ('SYS1.RACF*.**','NONE','SYS1'), ('SYS1.VTAM*.**','NONE','SYS1'),
+                    ('SYS2.**','READ','SYS1'), ('CATALOG.**','READ','SYSCTLG'), ('IBMUSER.**','NONE','IBMUSER')]
+        hlqs = self.departments + self.teams + self.userNames[9:]
+        while len(profiles) < self.ndatasets:
+            hlq = self.pick(hlqs)
+            q = self.random.random()
+            if q < 0.4:
+                name = f'{hlq}.**'
+            elif q < 0.8:
+                name = f'{hlq}.{self.pick(["DATA","LOAD","CNTL","PROD","TEST","ARCH"])}{self.random.randint(0,99)}.**'
+            else:
+                name = f'{hlq}.Q{self.random.randint(0,9999):04d}.D{self.random.randint(0,999):03d}'
+            owner = hlq if hlq in self.owner else self.pick([hlq, 'SYS1'])
+            profiles.append((name, self.pick(['NONE','READ','UPDATE','ALTER'],[88,9,2,1]), owner))
+        done = set()
+        for (name, uacc, owner) in profiles:
+            if name in done:
+                continue
+            done.add(name)
+            generic = 'YES' if '*' in name or '%' in name else 'NO'
+            w.write('0400', DSBD_NAME=name, DSBD_VOL='' if generic=='YES' else 'VOL001', DSBD_GENERIC=generic,
+                    DSBD_CREATE_DATE=self.date(), DSBD_OWNER_ID=owner, DSBD_LASTREF_DATE=self.date(100),
+                    DSBD_LASTCHG_DATE=self.date(500), DSBD_ALTER_CNT=0, DSBD_CONTROL_CNT=0, DSBD_UPDATE_CNT=0,
+                    DSBD_READ_CNT=0, DSBD_UACC=uacc, DSBD_GRPDS='NO', DSBD_AUDIT_LEVEL='FAILURES',
+                    DSBD_GRP_ID=owner if owner in self.owner else '', DSBD_DS_TYPE='', DSBD_LEVEL=0, DSBD_WARNING='NO', DSBD_ERASE='NO')
+            key = {'DSACC_NAME': name, 'DSACC_VOL': '' if generic=='YES' else 'VOL001'}
+            self.permits(w, '0404', 'DSACC', 6 if name.startswith('SYS1') else self.pick([0,1,2,3,5,8,20],[10,25,25,20,10,8,2]), **key)
+            if self.random.random() < 0.03 or name=='SYS1.**':
+                w.write('0402', DSCACC_NAME=name, DSCACC_VOL=key['DSACC_VOL'], DSCACC_CATYPE=self.pick(['PROGRAM','TERMINAL','CONSOLE','APPCPORT']),
+                        DSCACC_CANAME=self.pick(['IKJEFT01','IEBCOPY','TERM0001','MASTER','PORTA']), DSCACC_AUTH_ID=self.authid(),
+                        DSCACC_ACCESS=self.pick(['READ','UPDATE','ALTER']), DSCACC_ACCESS_CNT=0)
+            if self.random.random() < 0.02:
+                w.write('0431', DSCSD_NAME=name, DSCSD_VOL=key['DSACC_VOL'], DSCSD_TYPE='CHAR', DSCSD_KEY='APPLID', DSCSD_VALUE=name.split('.')[0])
+
+    def general(self, w, resclass, name, uacc='NONE', owner='SYS1', appldata='', permits=None):
+        w.write('0500', GRBD_NAME=name, GRBD_CLASS_NAME=resclass, GRBD_GENERIC='YES' if '*' in name else 'NO', GRBD_CLASS=1,
+                GRBD_CREATE_DATE=self.date(), GRBD_OWNER_ID=owner, GRBD_LASTREF_DATE=self.date(100), GRBD_LASTCHG_DATE=self.date(500),
+                GRBD_UACC=uacc, GRBD_AUDIT_LEVEL='FAILURES', GRBD_LEVEL=0, GRBD_WARNING='NO', GRBD_APPL_DATA=appldata)
+        self.permits(w, '0505', 'GRACC', self.pick([0,1,2,3,6],[15,30,30,15,10]) if permits is None else permits,
+                     GRACC_NAME=name, GRACC_CLASS_NAME=resclass)
+
+    def generals(self, w):
+        for name in ['BPX.SUPERUSER','BPX.DAEMON','BPX.SERVER','BPX.FILEATTR.APF','BPX.**','IRR.RADMIN.**','IRR.PASSWORD.RESET','ICHBLP','STGADMIN.**']:
+            self.general(w, 'FACILITY', name, permits=3)
+        w.write('0505', GRACC_NAME='BPX.SUPERUSER', GRACC_CLASS_NAME='FACILITY', GRACC_AUTH_ID='SYSPROG2', GRACC_ACCESS='READ', GRACC_ACCESS_CNT=0)
+        self.general(w, 'XFACILIT', 'IRR.**', permits=2)
+        for name in ['SUPERUSER.FILESYS','SUPERUSER.FILESYS.CHOWN','SUPERUSER.PROCESS.KILL','CHOWN.UNRESTRICTED','SUPERUSER.**']:
+            self.general(w, 'UNIXPRIV', name, permits=3)
+        # started tasks with STDATA
+        for (stc, userid) in [('OMVS.*','OMVSKERN'),('CICS*.*','CICSUSR'),('WEB*.*','WEBSRV'),('**','STCUSER')]:
+            self.general(w, 'STARTED', stc, permits=0)
+            w.write('0540', GRST_NAME=stc, GRST_CLASS_NAME='STARTED', GRST_USER_ID=userid, GRST_GROUP_ID='STCGRP',
+                    GRST_TRUSTED='YES' if userid=='OMVSKERN' else 'NO', GRST_PRIVILEGED='NO', GRST_TRACE='NO')
+        # grouping classes and their members
+        for (grouping, member, nmembers) in [('GCICSTRN','TCICSTRN',8), ('GTERMINL','TERMINAL',5)]:
+            for g in range(max(2, self.ngenerals // 200)):
+                name = f'{member[1:4]}GRP{g:03d}'
+                self.general(w, grouping, name, permits=2)
+                for m in range(nmembers):
+                    resource = f'{member[0:2]}{self.random.randint(0, 999):04d}'
+                    w.write('0503', GRMEM_NAME=name, GRMEM_CLASS_NAME=grouping, GRMEM_MEMBER=resource)
+                    if m == 0:  # member also protected by a profile in the member class
+                        self.general(w, member, resource, permits=1)
+        # certificates and key rings
+        owners = self.stcUsers + self.userNames[9:19]
+        certs = []
+        for c in range(max(6, self.ngenerals // 100)):
+            owner = self.pick(owners)
+            name = f'{c:08X}.{owner}'
+            certs.append((name, owner))
+            self.general(w, 'DIGTCERT', name, uacc='TRUST', owner=owner, appldata=owner, permits=0)
+            start = self.today - timedelta(days=self.random.randint(30, 1500))
+            end = self.today + timedelta(days=self.random.randint(-200, 800))
+            w.write('0560', GRCERT_NAME=name, GRCERT_CLASS_NAME='DIGTCERT', GRCERT_START_DATE=start.isoformat(), GRCERT_START_TIME='00:00:00',
+                    GRCERT_END_DATE=end.isoformat(), GRCERT_END_TIME='23:59:59', GRCERT_KEY_TYPE='RSA', GRCERT_KEY_SIZE=2048,
+                    GRCERT_LAST_SERIAL='0', GRCERT_RING_SEQN=0, GRCERT_GEN_REQ='NO')
+            w.write('1560', CERTN_NAME=name, CERTN_CLASS_NAME='DIGTCERT', CERTN_ISSUER_DN=f'CN=CA{c % 3}', CERTN_SUBJECT_DN=f'CN={owner}')
+        for owner in self.stcUsers:
+            ring = f'{owner}.RING'
+            self.general(w, 'DIGTRING', ring, owner=owner, permits=0)
+            for (name, certowner) in self.random.sample(certs, k=min(3, len(certs))):
+                w.write('0562', KEYR_NAME=ring, KEYR_CLASS_NAME='DIGTRING', KEYR_CERT_NAME=name, KEYR_CERT_USAGE='PERSONAL',
+                        KEYR_CERT_DEFAULT='NO', KEYR_CERT_LABEL=f'LABEL{name[:8]}')
+                w.write('0561', CERTR_NAME=name, CERTR_CLASS_NAME='DIGTCERT', CERTR_RING_NAME=f'{owner}.RING')
+        # custom field definitions
+        for (field, ftype) in [('DEPTNAME','CHAR'),('EMPLOYEE','NUM'),('CONTRACT','FLAG'),('APPLID','CHAR')]:
+            entity = 'DATASET' if field=='APPLID' else 'USER'
+            self.general(w, 'CFDEF', f'{entity}.{field}', permits=0)
+            w.write('05E0', GRCFDEF_NAME=f'{entity}.{field}', GRCFDEF_CLASS='CFDEF', GRCFDEF_TYPE=ftype, GRCFDEF_MAXLEN=8,
+                    GRCFDEF_MAXVAL=99999 if ftype=='NUM' else 0, GRCFDEF_MINVAL=0, GRCFDEF_FIRST='ALPHA', GRCFDEF_OTHER='ALPHANUM',
+                    GRCFDEF_MIXED='NO', GRCFDEF_HELP=f'{field} help', GRCFDEF_LISTHEAD=f'{field}:', GRCFDEF_ACEE='NO')
+        self.general(w, 'APPL', 'PAYROLL', appldata='', permits=2)
+        w.write('0530', GRSIGN_NAME='PAYROLL', GRSIGN_CLASS_NAME='PTKTDATA', GRSIGN_PROTECTION='MASKED', GRSIGN_TYPE='PASSTICKET', GRSIGN_TIMEOUT=600, GRSIGN_REPLAY='NO')
+        self.general(w, 'PTKTDATA', 'PAYROLL', appldata='NO REPLAY PROTECTION', permits=0)
+        # scaled profiles in other classes
+        classes = ['TCICSTRN','TERMINAL','PROGRAM','SURROGAT','OPERCMDS','JESSPOOL','APPL','SERVAUTH','XFACILIT','FACILITY']
+        surrogates = self.random.sample(self.userNames, k=len(self.userNames))  # each user once, profile keys are unique
+        for g in range(self.ngenerals):
+            resclass = self.pick(classes)
+            if resclass == 'TCICSTRN':
+                name = f'TR{g:06d}'
+            elif resclass == 'SURROGAT':
+                name = f'{surrogates.pop()}.SUBMIT' if surrogates else f'BPX.SRV.S{g:06d}'
+            elif resclass == 'PROGRAM':
+                name = f'PGM{g:05d}' if self.random.random() < 0.8 else f'P{g:04d}*'
+            else:
+                name = f'{self.pick(["APP","SYS","IMS","DB2","MQ","ICH"])}{g:05d}.{self.pick(["READ","ADMIN","**"])}'
+            self.general(w, resclass, name, uacc=self.pick(['NONE','READ'],[92,8]), owner=self.pick(self.groupNames[:20]))
+            if self.random.random() < 0.02:
+                w.write('0507', GRCACC_NAME=name, GRCACC_CLASS_NAME=resclass, GRCACC_CATYPE=self.pick(['PROGRAM','TERMINAL','CONSOLE']),
+                        GRCACC_CANAME=self.pick(['IKJEFT01','TERM0001','MASTER']), GRCACC_AUTH_ID=self.authid(),
+                        GRCACC_ACCESS=self.pick(['READ','UPDATE']), GRCACC_ACCESS_CNT=0)
+            if resclass=='APPL' and self.random.random() < 0.05:
+                w.write('05J1', GRCSD_NAME=name, GRCSD_CLASS_NAME=resclass, GRCSD_TYPE='CHAR', GRCSD_KEY='APPLID', GRCSD_VALUE=name[:8])
+
+
+def generate(path, lines=10000, seed=0):
+    ''' write a synthetic unload of roughly `lines` records to path, returns the number of records per record type '''
+    with open(path, 'w', encoding='utf-8') as file:
+        w = SyntheticRACF(lines=lines, seed=seed).generate(file)
+    return w.counts
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a synthetic IRRDBU00 unload.')
+    parser.add_argument('path', help='output file')
+    parser.add_argument('--lines', type=int, default=10000, help='approximate number of records')
+    parser.add_argument('--seed', type=int, default=0, help='random seed, the same seed and lines produce the same unload')
+    args = parser.parse_args()
+    counts = generate(args.path, lines=args.lines, seed=args.seed)
+    print(f'{sum(counts.values())} records written to {args.path}')
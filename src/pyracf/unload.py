@@ -0,0 +1,157 @@
+''' Reading IRRDBU00 unloads as records of bytes: plain or gzip/bz2/xz/zstd compressed, in ASCII (UTF-8) or EBCDIC.
+
+Compression is recognized by the first bytes of the file and decompressed while reading.  EBCDIC unloads, as
+transferred in binary from z/OS, are recognized by the record type in EBCDIC digits, they may have line ends
+(NL or LF) or a record descriptor word (RDW) in front of each record (ftp "quote site rdw").
+
+Records are read in large buffers and split on the line end, records of the wanted types are kept as bytes.
+decodeFields() then slices each field from all records of a type at once, as a column of a numpy byte matrix,
+and decodes the column in one step, records and fields that are not used are never decoded.
+'''
+
+import bz2
+import codecs
+import gzip
+import io
+import lzma
+
+import numpy as np
+
+_magic = [(b'\x1f\x8b', 'gzip'), (b'BZh', 'bz2'), (b'\xfd7zXZ\x00', 'xz'), (b'\x28\xb5\x2f\xfd', 'zstd')]
+_ebcdicDigits = bytes(range(0xF0, 0xFA))
+
+
+def _cp1047():
+    ''' codec for EBCDIC code page 1047 (z/OS UNIX), Python only has cp037.  1047 differs from 037 in [ ] ^ ¬ Ý ¨ and
+    in NL and LF, which are swapped. '''
+    table = list(codecs.decode(bytes(range(256)), 'cp037'))
+    for (position, char) in [(0x5F, '^'), (0xB0, '¬'), (0xAD, '['), (0xBD, ']'), (0xBA, 'Ý'), (0xBB, '¨'), (0x15, '\n'), (0x25, '\x85')]:
+        table[position] = char
+    decoding = ''.join(table)
+    encoding = codecs.charmap_build(decoding)
+    return codecs.CodecInfo(name='cp1047',
+                            encode=lambda text, errors='strict': codecs.charmap_encode(text, errors, encoding),
+                            decode=lambda data, errors='strict': codecs.charmap_decode(data, errors, decoding))
+
+
+codecs.register(lambda name: _cp1047() if name in ('cp1047', 'ibm1047', 'ibm_1047') else None)
+
+
+def _open(path, compression):
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+    if compression == 'bz2':
+        return bz2.open(path, 'rb')
+    if compression == 'xz':
+        return lzma.open(path, 'rb')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(f'{path} is compressed with zstd, install the zstandard package to read it') from None
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True))
+    return open(path, 'rb')
+
+
+class Unload:
+    ''' an unload file, with the compression, encoding and record format detected from its first bytes.
+    encoding is 'utf-8' for ASCII unloads, cp037 is assumed for EBCDIC unless encoding='cp1047' is given. '''
+
+    def __init__(self, path, encoding=None):
+        self.path = path
+        with open(path, 'rb') as f:
+            head = f.read(8)
+        self.compression = next((name for (magic, name) in _magic if head.startswith(magic)), None)
+        with _open(path, self.compression) as f:
+            head = f.read(1 << 16)
+        if head[2:4] == b'\0\0' and all(b in _ebcdicDigits for b in head[4:8]):  # RDW, then record type
+            (ebcdic, self.recordFormat, self.lineEnd) = (True, 'rdw', None)
+        elif head[:4] and all(b in _ebcdicDigits for b in head[:4]):
+            # records end with NL (0x15) or LF (0x25), whichever is found first
+            ends = [p for p in (head.find(b'\x15'), head.find(b'\x25')) if p >= 0]
+            (ebcdic, self.recordFormat, self.lineEnd) = (True, 'lines', head[min(ends):min(ends) + 1] if ends else b'\x15')
+        else:
+            (ebcdic, self.recordFormat, self.lineEnd) = (False, 'lines', b'\n')
+        self.encoding = encoding or ('cp037' if ebcdic else 'utf-8')
+
+    def open(self):
+        ''' binary stream with the decompressed unload '''
+        return _open(self.path, self.compression)
+
+    def records(self, chunksize=1 << 24):
+        ''' the records as bytes, without line end or RDW '''
+        with self.open() as f:
+            if self.recordFormat == 'rdw':
+                yield from self._rdwRecords(f)
+            else:
+                yield from self._splitLines(f, chunksize)
+
+    def _rdwRecords(self, f):
+        while True:
+            rdw = f.read(4)
+            if len(rdw) < 4:
+                return
+            yield f.read(int.from_bytes(rdw[:2], 'big') - 4)
+
+    def _splitLines(self, f, chunksize):
+        ''' records ended by lineEnd, split from buffers of chunksize bytes '''
+        rest = b''
+        while True:
+            chunk = f.read(chunksize)
+            if not chunk:
+                break
+            lines = (rest + chunk).split(self.lineEnd)
+            rest = lines.pop()
+            yield from lines
+        if rest:
+            yield rest
+
+    def count(self):
+        ''' number of records, for progress reports '''
+        if self.recordFormat == 'rdw':
+            return sum(1 for _ in self.records())
+        lines = 0
+        last = b''
+        with self.open() as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                lines += chunk.count(self.lineEnd)
+                last = chunk[-1:]
+        return lines + (1 if last and last != self.lineEnd else 0)
+
+
+def _codePoints(encoding):
+    ''' uint32 array with the code point of each byte value, for encodings where every byte is one character '''
+    return np.array([ord(c) for c in bytes(range(256)).decode(encoding, errors='replace')], dtype=np.uint32)
+
+
+def decodeFields(lines, fields, encoding='utf-8', batch=100000):
+    ''' dict from field name to an object array with the stripped values of the field in lines (records as bytes),
+    fields is a list of (name, start, end) with 0-based start.  The fields of a batch of records are decoded per column:
+    the records are stored in a byte matrix, the columns of a field are mapped to code points and viewed as str.
+    UTF-8 records with characters that are not in Latin-1 are sliced as str, because the offsets count characters. '''
+    utf8 = codecs.lookup(encoding).name == 'utf-8'
+    codePoints = _codePoints('latin-1' if utf8 else encoding)
+    columns = {name: [] for (name, start, end) in fields}
+    for first in range(0, len(lines), batch):
+        part = lines[first:first + batch]
+        wide = {}  # row -> str, for lines that are sliced by character
+        if utf8:
+            for (row, line) in enumerate(part):
+                if not line.isascii():
+                    text = line.decode('utf-8', errors='replace')
+                    try:
+                        part[row] = text.encode('latin-1')
+                    except UnicodeEncodeError:
+                        wide[row] = text
+        width = max(map(len, part), default=0)
+        matrix = np.array(part, dtype=f'S{max(width, 1)}').view(np.uint8).reshape(len(part), -1)
+        for (name, start, end) in fields:
+            if start >= width or end <= start:
+                values = np.full(len(part), '', dtype=object)
+            else:
+                points = np.ascontiguousarray(codePoints[matrix[:, start:end]])
+                values = np.char.strip(points.view(f'U{points.shape[1]}').reshape(len(part))).astype(object)
+                for (row, text) in wide.items():
+                    values[row] = text[start:end].strip()
+            columns[name].append(values)
+    return {name: np.concatenate(parts) if parts else np.empty(0, dtype=object) for (name, parts) in columns.items()}
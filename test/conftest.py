@@ -2,11 +2,13 @@
 ## we use it to load the parameter file and RACF unload
 ## the testparms fixture is referenced in test modules by name (testparms), but because conftest.py is not a test the files are only read once
 
+import os
 import pytest
 import time
 import toml
 import warnings
 from pyracf import RACF
+from pyracf.synthetic import generate
 
 
 # several ways to load the DFs
@@ -45,6 +47,10 @@ def fromPickles(testparm):
 with open('testparm.toml', 'r') as f:
      testparm = toml.load(f)
 
+# a synthetic unload is generated when it is missing, the same lines and seed always give the same unload
+if testparm['testname']=='synthetic' and not os.path.exists(testparm['unload']):
+    generate(testparm['unload'], lines=testparm.get('lines',20000), seed=testparm.get('seed',0))
+
 # testparms (with an s) is called once for each source, in each testmember
 # we run each testmember with 3 different sources, yield returns testparm with the current source in testparm['object']
 sources = [normalParse,fancyParse,fromPickles]
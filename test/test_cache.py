@@ -0,0 +1,90 @@
+# derived views are cached until the frames they depend on are replaced
+
+import pytest
+import pandas as pd
+
+def test_cache_property(testparms):
+  r = testparms['object']
+  hits = r.status['cache']['hits']
+  assert r.specials.equals(r.specials) and r.status['cache']['hits']>hits, 'repeated property access must return the cached view'
+  users = r._users
+  try:
+    r._users = users.assign(USBD_SPECIAL='NO')
+    assert r.specials.empty, 'replacing the frame must invalidate the cached view'
+  finally:
+    r._users = users
+  assert not r.specials.empty, 'restoring the frame must give the original view again'
+
+def test_cache_gfilter_acl(testparms):
+  r = testparms['object']
+  t1 = r.datasets.gfilter('SYS1.**')
+  hits = r.status['cache']['hits']
+  assert t1.equals(r.datasets.gfilter('SYS1.**')) and r.status['cache']['hits']==hits+1, 'gfilter on the same frame must be cached'
+  assert t1.acl(resolve=True).equals(t1.acl(resolve=True)) and r.status['cache']['hits']==hits+2, 'acl on the same frame must be cached'
+  misses = r.status['cache']['misses']
+  t1.acl(resolve=False)
+  assert r.status['cache']['misses']==misses+1, 'parameters are part of the cache key'
+
+def test_cache_bounded(testparms):
+  r = testparms['object']
+  for n in range(r._cache.maxsize+10):
+    r.datasets.gfilter(f'X{n}.**').acl()
+  assert r.status['cache']['entries']<=r._cache.maxsize, 'cache must evict the least recently used views'
+
+def test_cache_admin_index(testparms):
+  r = testparms['object']
+  admins = r.groupAdmins
+  r.clear_cache()
+  for n in range(r._cache.maxsize+10):  # evicts everything from the LRU cache
+    r.datasets.gfilter(f'Y{n}.**').acl()
+  assert r.groupAdmins.equals(admins)
+  assert r._adminIndex() is r._adminIndex(), 'the admin index is kept outside the LRU cache'
+  connectData = r._connectData
+  try:
+    r._connectData = connectData.assign(GPMEM_AUTH='USE', USCON_GRP_SPECIAL='NO')
+    assert set(r.groupAdmins['AUTHORITY'])<={'OWNER'}, 'replacing a frame must rebuild the admin index'
+  finally:
+    r._connectData = connectData
+  assert r.groupAdmins.equals(admins)
+
+def test_cache_per_object(testparms):
+  r = testparms['object']
+  from pyracf.cache import cacheOf
+  assert cacheOf(r.datasets) is r._cache, 'frame methods are cached with the RACF object of the frame'
+  assert cacheOf(r.datasets.gfilter('SYS1.**')) is r._cache, 'selected frames keep the cache of their RACF object'
+  r.clear_cache()
+  part = r.datasets.head(100)
+  entries = r.status['cache']['entries']
+  part.gfilter('**')
+  assert r.status['cache']['entries']==entries+1
+  del part
+  import gc; gc.collect()
+  assert r.status['cache']['entries']==entries, 'results are dropped with the frame they were derived from'
+
+def test_cache_maxbytes(testparms):
+  r = testparms['object']
+  maxbytes = r._cache.maxbytes
+  try:
+    r._cache.maxbytes = 100000
+    parts = [r.datasets.head(1000+n) for n in range(20)]  # kept, so their results are only dropped to stay within maxbytes
+    for part in parts:
+      part.gfilter('**')
+    assert r.status['cache']['bytes']<=100000, 'cache must evict views beyond maxbytes'
+  finally:
+    r._cache.maxbytes = maxbytes
+
+def test_cache_copies(testparms):
+  r = testparms['object']
+  x = r.datasets.gfilter('**')
+  before = x.copy()
+  x['NEW'] = 1
+  x.loc[x.index[0],'DSBD_UACC'] = 'ALTER'
+  x.drop(x.index[-1], inplace=True)
+  assert r.datasets.gfilter('**').equals(before), 'modifying a cached result must not change the next result'
+  for view in (lambda: r.specials, lambda: r.datasets.gfilter('**').acl(), lambda: r.groupAdmins):
+    before = view()
+    changed = view()
+    changed['FOO'] = 1
+    changed.iloc[0,0] = 'CHANGED'
+    changed.drop(changed.index, inplace=True)
+    assert view().equals(before), 'each call returns its own copy'
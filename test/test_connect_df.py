@@ -22,3 +22,15 @@ def test_connect_3(testparms):
   assert connect_combo.shape[0]==1, 'should be only 1 connect SYS1<->IBMUSER'
 
 
+
+
+def test_groupAdmins(testparms):
+  r = testparms['object']
+  admins = r.groupAdmins
+  assert admins.columns.tolist()==['ADMIN_ID','AUTHORITY','VIA']
+  assert set(admins['AUTHORITY'])<={'OWNER','GRPSPECIAL','CONNECT','JOIN'}
+  assert r._adminIndex()[0] is r._adminIndex()[0] and r.groupAdmins.equals(admins), 'groupAdmins must be computed once'
+  acl = r.datasets.gfilter('SYS1.**').acl(permits=False, admin=True)
+  groupEntries = acl.loc[acl['USER_ID']=='-group-']
+  for (group,admin,authority) in groupEntries[['AUTH_ID','ADMIN_ID','AUTHORITY']].values[:50]:
+    assert ((admins.index==group) & (admins['ADMIN_ID']==admin) & (admins['AUTHORITY']==authority)).any(), 'acl(admin=True) must use groupAdmins'
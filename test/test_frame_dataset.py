@@ -2,6 +2,8 @@
 
 import pytest 
 import pandas as pd
+import warnings
+from pyracf import RACF
 
 def test_frame_dataset(testparms):
   r = testparms['object']
@@ -36,3 +38,82 @@ def test_frame_datasets_acl_admin(testparms):
   assert t1.shape[1]>=8, 'datasets.acl(explode) must have 8 columns or 10'
 
 
+
+def test_frame_datasetPermit_key(testparms):
+  r = testparms['object']
+  (profile,id,access) = r.datasetAccess.index[0]
+  t1 = r.datasetPermit(profile,id,access)
+  t2 = r.datasetAccess.loc[[(profile,id,access)]]
+  assert t1.to_records().tolist()==t2.to_records().tolist(), 'hash index and .loc must select the same permits'
+  assert r.datasetPermit(profile,'NOTTHERE',access).shape[0]==0, 'missing permits must generate an empty frame'
+
+def test_frame_datasets_pfilter(testparms):
+  r = testparms['object']
+  t1 = r.datasets.pfilter('SYS1.')
+  t2 = r.datasets.loc[r.datasets.index.str.startswith('SYS1.')]
+  assert t1.index.tolist()==t2.index.tolist(), 'pfilter must select the same profiles as a prefix scan'
+  assert t1.shape[0]>1
+  assert r.datasets.pfilter('NOTTHERE.').shape[0]==0
+
+def test_frame_sorted(testparms):
+  r = testparms['object']
+  for df in [r.datasets, r.datasetAccess, r.connectData, r.generalAccess]:
+    assert df.index.is_monotonic_increasing, 'correlated frames must have a sorted index'
+    assert df.attrs.get('sorted'), 'sorted flag must be set, and saved in pickles'
+  with warnings.catch_warnings():
+    warnings.simplefilter('error', pd.errors.PerformanceWarning)
+    r.connect(None,'IBMUSER')
+    r.datasetPermit(id='IBMUSER')
+
+def test_frame_datasets_acl_pushdown(testparms):
+  r = testparms['object']
+  columns = ['NAME','VOL','USER_ID','AUTH_ID','ACCESS']
+  for options in [dict(allows='UPDATE'), dict(access='READ', explode=True), dict(allows='UPDATE', resolve=True)]:
+    t1 = r.datasets.gfilter('SYS1.**').acl(**options)
+    t2 = r.datasets.gfilter('SYS1.**').acl(**{k:v for (k,v) in options.items() if k not in ['access','allows']})
+    t2 = t2.loc[t2['ACCESS'].isin(RACF.accessAllows(options['allows'])) if 'allows' in options else t2['ACCESS']==options['access']]
+    assert t1[columns].values.tolist()==t2[columns].values.tolist(), f'acl({options}) must select the same entries as filtering the complete acl'
+  user = r.connectData.index[0][1]
+  t1 = r.datasets.acl(resolve=True, user=user)
+  t2 = r.datasets.acl(resolve=True)
+  assert t1[columns].values.tolist()==t2.loc[t2['USER_ID']==user, columns].values.tolist(), 'acl(user=) must select the entries of the user'
+  assert r.datasets.acl(profile='SYS1.**').equals(r.datasets.gfilter('SYS1.**').acl()), 'acl(profile=) must select the same entries as gfilter'
+
+def test_frame_datasets_acl_chunks(testparms):
+  r = testparms['object']
+  columns = ['NAME','VOL','USER_ID','AUTH_ID','ACCESS']
+  chunks = list(r.datasets.gfilter('SYS1.**').acl(resolve=True, chunksize=3))
+  t1 = pd.concat(chunks, ignore_index=True)
+  t2 = r.datasets.gfilter('SYS1.**').acl(resolve=True)
+  assert len(chunks)>1, 'acl(chunksize=3) must return several frames'
+  assert all(c['NAME'].nunique()<=3 for c in chunks), 'each chunk must have at most chunksize profiles'
+  assert t1[columns].values.tolist()==t2[columns].values.tolist(), 'chunks must have the same entries as the complete acl'
+  chunks = list(r.datasetAccess.gfilter('SYS1.**').acl(explode=True, admin=True, chunksize=2))
+  t1 = pd.concat(chunks, ignore_index=True).sort_values(columns+['ADMIN_ID','VIA'])
+  t2 = r.datasetAccess.gfilter('SYS1.**').acl(explode=True, admin=True).sort_values(columns+['ADMIN_ID','VIA'])
+  assert t1[columns+['ADMIN_ID']].values.tolist()==t2[columns+['ADMIN_ID']].values.tolist(), 'chunks of an access frame, with admins'
+
+def test_frame_datasetConditionalAccess_when(testparms):
+  r = testparms['object']
+  d = r.datasetConditionalAccess
+  (catype, caname) = d[['DSCACC_CATYPE','DSCACC_CANAME']].iloc[0]
+  t1 = d.when(catype, caname)
+  t2 = d.loc[(d['DSCACC_CATYPE']==catype) & (d['DSCACC_CANAME']==caname)]
+  assert t1.equals(t2), 'when( ) must select the permits with the condition'
+  assert d.when(catype).shape[0]==(d['DSCACC_CATYPE']==catype).sum()
+  assert d.when(catype, 'NOTTHERE').shape[0]==0
+  assert d.when(catype=catype, caname=caname).equals(t1), 'when( ) takes keyword arguments'
+  assert d.when(catype=catype).shape[0]==d.when(catype).shape[0]
+  t3 = d.when(catype, caname).acl(resolve=True)
+  assert t3.shape[0]>=1 and set(t3['CANAME'])=={caname}, 'acl(resolve=True) must resolve the conditional permits'
+  with pytest.raises(Exception):
+    r.datasetAccess.when('PROGRAM')
+
+def test_when_generic_caname(testparms):
+  from pyracf.conditional import ConditionIndex
+  cacc = pd.DataFrame({'GRCACC_RECORD_TYPE':['0507']*3, 'GRCACC_CATYPE':['TERMINAL','TERMINAL','PROGRAM'],
+                       'GRCACC_CANAME':['TRM*','TRM001','TRM001']})
+  index = ConditionIndex(cacc, RACF._generic2regex)
+  assert index.positions('TERMINAL','TRM001').tolist()==[0,1], 'generic CANAME must match'
+  assert index.positions('TERMINAL','XYZ').tolist()==[]
+  assert index.positions(None,'TRM001').tolist()==[0,1,2]
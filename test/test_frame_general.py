@@ -34,3 +34,48 @@ def test_frame_generals_acl(testparms):
   assert t1.shape[0]<t2.shape[0], 'generals.acl must generate more lines than generals'
   assert t2.shape[1]>=5, 'generals.acl must have 5 columns, 5 or more'
 
+
+def test_frame_generals_pfilter(testparms):
+  r = testparms['object']
+  t1 = r.generals.pfilter('FACILITY','BPX.')
+  t2 = r.generals.gfilter('FACILITY','BPX.**')
+  assert set(t1.index.tolist())>=set(t2.index.tolist())-{('FACILITY','BPX.**')}, 'pfilter must find profiles starting with the prefix'
+  assert all(n.startswith('BPX.') for (c,n) in t1.index)
+  assert r.generals.pfilter('FACILITY').shape[0]==r.general('FACILITY').shape[0], 'a prefix on the class level selects the class'
+
+def test_frame_generals_acl_grouping(testparms):
+  r = testparms['object']
+  members = r.groupingMembers
+  assert set(members['GROUPING_CLASS'])>={'GCICSTRN','GTERMINL'}
+  (grouping, groupingName) = members.loc['TCICSTRN'][['GROUPING_CLASS','GROUPING_NAME']].iloc[0]
+  t1 = r.generals.gfilter(grouping, groupingName).acl(grouping=True)
+  assert set(t1['CLASS_NAME'])=={'TCICSTRN'}, 'grouping profiles must be shown for each member'
+  assert set(t1['NAME'])==set(members.loc[members['GROUPING_NAME']==groupingName].loc['TCICSTRN'].index)
+  assert set(t1['GROUPING'])=={groupingName}
+  t2 = r.generals.gfilter('TCICSTRN').acl(grouping=True)
+  direct = r.generals.gfilter('TCICSTRN').acl()
+  assert t2.loc[t2['GROUPING']!=' '].shape[0]>0, 'member profiles must get the permits of the grouping profiles that list them'
+  assert t2.loc[t2['GROUPING']==' '].shape[0]==direct.shape[0], 'permits on the member profiles must still be there'
+
+def test_certificates(testparms):
+  r = testparms['object']
+  certs = r.certificates
+  assert len(certs)==len(r.CERT) and certs['END'].is_monotonic_increasing, 'one row per certificate, sorted by the end date'
+  for (key, cert) in certs.iloc[:20].iterrows():
+    assert cert['END']==pd.Timestamp(r.CERT.loc[key,'GRCERT_END_DATE']+' '+r.CERT.loc[key,'GRCERT_END_TIME'])
+    assert cert['OWNER']==r.generals.loc[[key],'GRBD_APPL_DATA'].iloc[0]
+  asof = pd.Timestamp('2024-01-01')
+  expiring = r.certificates_expiring(90, asof=asof)
+  assert ((expiring['END']>=asof) & (expiring['END']<=asof+pd.Timedelta(days=90))).all()
+  assert len(expiring)==((certs['END']>=asof) & (certs['END']<=asof+pd.Timedelta(days=90))).sum()
+  assert len(r.certificates_expiring(90, asof=asof, expired=True))==(certs['END']<=asof+pd.Timedelta(days=90)).sum()
+
+def test_keyring_certificates(testparms):
+  r = testparms['object']
+  links = r.keyringCertificates
+  assert len(links)==len(r.KEYRING) and links['END'].is_monotonic_increasing
+  assert set(zip(links['RING'],links['NAME']))>=set(zip(r.CERTreferences['CERTR_RING_NAME'],r.CERTreferences['CERTR_NAME'])), 'references are on the rings'
+  assert set(links.loc[links['STARTED'],'RING_OWNER'])<=set(r.STDATA['GRST_USER_ID'])
+  started = r.certificates_expiring(800, asof='2024-01-01', started=True)
+  assert started['STARTED'].all() and (started['END']>=pd.Timestamp('2024-01-01')).all()
+  assert (started['OWNER']==r.certificates.reindex(pd.MultiIndex.from_frame(started[['CLASS_NAME','NAME']]))['OWNER'].to_numpy()).all()
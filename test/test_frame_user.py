@@ -0,0 +1,77 @@
+# test the reports on the users frame
+
+import pandas as pd
+
+def test_user_lifecycle(testparms):
+  r = testparms['object']
+  report = r.user_lifecycle(asof='2024-01-01', dormant=90)
+  assert report.index.equals(r.users.index)
+  assert report.equals(r.user_lifecycle(asof='2024-01-01', dormant=90)), 'the report is cached'
+  for userid in report.index[:200]:
+    lastjob = pd.to_datetime(r.users.loc[userid,'USBD_LASTJOB_DATE'], errors='coerce')
+    lastcon = pd.to_datetime(r.connect(None,userid)['USCON_LASTCON_DATE'], errors='coerce').max()
+    lastuse = max([d for d in (lastjob, lastcon) if pd.notna(d)], default=pd.NaT)
+    row = report.loc[userid]
+    assert (pd.isna(lastuse) and pd.isna(row['LAST_USE_DATE'])) or row['LAST_USE_DATE']==lastuse, f'last use of {userid}'
+    assert row['DORMANT']==(pd.isna(lastuse) or (pd.Timestamp('2024-01-01')-lastuse).days>=90)
+    assert row['LAST_USE_BUCKET']==('never' if pd.isna(lastuse) else
+                                    next((f'{lo}-{hi-1}' for (lo,hi) in [(0,30),(30,90),(90,180),(180,365)] if lo<=row['LAST_USE_DAYS']<hi), '365+'))
+  specials = report.loc[report['DORMANT_PRIVILEGED'] & report['SPECIAL']].index
+  assert set(specials)<=set(r.specials.index) and not report.loc[specials,'REVOKED'].any()
+  groupSpecials = r.connectData.loc[r.connectData['USCON_GRP_SPECIAL']=='YES','USCON_NAME'].value_counts()
+  assert report['GRP_SPECIAL'].reindex(groupSpecials.index).tolist()==groupSpecials.tolist()
+  assert report['REVOKED'].sum()>=len(r.revoked)
+
+def test_uid_index(testparms):
+  r = testparms['object']
+  uids = pd.to_numeric(r.userOMVS['USOMVS_UID'], errors='coerce').dropna().astype('int64')
+  assert len(r.uidIndex)==len(uids) and r.uidIndex.index.is_monotonic_increasing
+  for (userid, uid) in uids.iloc[:200].items():
+    assert userid in r.uid_users(uid)['USER_ID'].tolist(), f'reverse lookup of UID {uid}'
+  shared = uids.loc[uids.duplicated(keep=False)]
+  assert sorted(r.duplicateUIDs['USER_ID'])==sorted(shared.index), 'users with a shared UID'
+  assert (r.duplicateUIDs['COUNT']==shared.value_counts().reindex(r.duplicateUIDs.index).to_numpy()).all()
+  gids = pd.to_numeric(r.groupOMVS['GPOMVS_GID'], errors='coerce').dropna().astype('int64')
+  assert sorted(r.duplicateGIDs['GROUP'])==sorted(gids.loc[gids.duplicated(keep=False)].index), 'groups with a shared GID'
+  assert r.gid_groups(gids.iloc[0])['GROUP'].tolist().count(gids.index[0])==1
+
+def test_superusers(testparms):
+  r = testparms['object']
+  superusers = r.superusers
+  assert set(superusers.loc[superusers['VIA']=='UID(0)','USER_ID'])==set(r.uid_users(0)['USER_ID'])
+  bpx = superusers.loc[superusers['VIA']=='BPX.SUPERUSER']
+  permits = r.generalAccess.loc[(r.generalAccess['GRACC_CLASS_NAME']=='FACILITY') & (r.generalAccess['GRACC_NAME']=='BPX.SUPERUSER')]
+  assert set(bpx['AUTH_ID'])<=set(permits['GRACC_AUTH_ID']), 'BPX.SUPERUSER access through the permits'
+  assert bpx['ACCESS'].isin(['READ','UPDATE','CONTROL','ALTER']).all()
+  assert (superusers.loc[superusers['VIA']=='UID(0)','UID']==0).all()
+
+def test_custom_fields(testparms):
+  r = testparms['object']
+  fields = r.userCustomFields
+  assert set(fields.index)==set(r.userCSDATA.index) and fields.index.isin(r.users.index).all(), 'one row per user with custom fields'
+  assert str(fields['EMPLOYEE'].dtype)=='Int64' and str(fields['CONTRACT'].dtype)=='boolean', 'NUM and FLAG fields are typed by CFDEF'
+  for (userid, field) in r.userCSDATA.iloc[:300].set_index('USCSD_KEY', append=True).index:
+    value = r.userCSDATA.loc[(r.userCSDATA['USCSD_NAME']==userid) & (r.userCSDATA['USCSD_KEY']==field),'USCSD_VALUE'].iloc[-1]
+    assert str(fields.loc[userid,field])==(value if field!='CONTRACT' else str(value=='YES')), f'{field} of {userid}'
+  assert len(r.users.join(r.userCustomFields).query('EMPLOYEE>50000 and CONTRACT==True'))==\
+         ((fields['EMPLOYEE']>50000) & fields['CONTRACT']).sum()
+  assert r.datasetCustomFields.index.equals(r.datasetCSDATA.index.unique().sort_values())
+  assert r.generalCustomFields.index.names==r.generals.index.names
+
+def test_user_lifecycle_revoke_dates(testparms):
+  r = testparms['object']
+  original = r._users
+  users = original.copy()
+  (resumeLater, resumeBefore, resumed) = users.index[:3]
+  users.loc[[resumeLater, resumeBefore, resumed], 'USBD_REVOKE'] = 'NO'
+  users.loc[resumeLater, ['USBD_REVOKE_DATE','USBD_RESUME_DATE']] = ['2024-01-01','2024-06-01']
+  users.loc[resumeBefore, ['USBD_REVOKE_DATE','USBD_RESUME_DATE']] = ['2024-01-01','2023-12-01']
+  users.loc[resumed, ['USBD_REVOKE_DATE','USBD_RESUME_DATE']] = ['2024-01-01','2024-02-01']
+  r._users = users
+  try:
+    report = r.user_lifecycle(asof='2024-03-01')
+  finally:
+    r._users = original
+  assert report.loc[resumeLater,'REVOKED'], 'revoked until the resume date has passed'
+  assert report.loc[resumeBefore,'REVOKED'], 'a resume date before the revoke date does not resume'
+  assert not report.loc[resumed,'REVOKED'], 'resumed after the revoke date'
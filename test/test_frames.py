@@ -8,6 +8,7 @@ externalFrames = ['ALIAS',
  'CERT',
  'CERTname',
  'CERTreferences',
+ 'certificates',
  'CFDEF',
  'DLFDATA',
  'DLFDATAjobnames',
@@ -42,6 +43,7 @@ externalFrames = ['ALIAS',
  'connects',
  'datasetAccess',
  'datasetCSDATA',
+ 'datasetCustomFields',
  'datasetCategories',
  'datasetConditionalAccess',
  'datasetDFP',
@@ -50,6 +52,7 @@ externalFrames = ['ALIAS',
  'datasets',
  'generalAccess',
  'generalCSDATA',
+ 'generalCustomFields',
  'generalCategories',
  'generalConditionalAccess',
  'generalMembers',
@@ -62,18 +65,25 @@ externalFrames = ['ALIAS',
  'genericMembers',
  'generics',
  'groupCSDATA',
+ 'groupCustomFields',
  'groupConnect',
  'groupDFP',
  'groupOMVS',
  'groupTME',
  'groupUSRDATA',
+ 'groupAdmins',
+ 'gidIndex',
+ 'duplicateGIDs',
+ 'groupingMembers',
  'groups',
  'groupsWithoutUsers',
  'installdata',
+ 'keyringCertificates',
  'operations',
  'revoked',
  'specials',
  'subgroups',
+ 'superusers',
  'uacc_alter_datasets',
  'uacc_control_datasets',
  'uacc_read_datasets',
@@ -85,6 +95,7 @@ externalFrames = ['ALIAS',
  'userCICSrslKeys',
  'userCICStslKeys',
  'userCSDATA',
+ 'userCustomFields',
  'userCategories',
  'userClasses',
  'userDFP',
@@ -105,6 +116,8 @@ externalFrames = ['ALIAS',
  'userUSRDATA',
  'userWORKATTR',
  'users',
+ 'uidIndex',
+ 'duplicateUIDs',
 ]
 
 internalFrames = ['_connectData',
@@ -220,6 +233,7 @@ deprecatedFrames = [
 
 methods = [
  'parsed',
+ 'clear_cache',
  'connect',
  'dataset',
  'datasetConditionalPermit',
@@ -236,8 +250,24 @@ methods = [
  'parse_fancycli',
  'save_pickle',
  'save_pickles',
+ 'save_timings',
+ 'save_sqlite',
+ 'sql',
+ 'share',
+ 'overlay',
+ 'map_partitions',
  'status',
  'user',
+ 'users_many',
+ 'user_lifecycle',
+ 'uid_users',
+ 'certificates_expiring',
+ 'gid_groups',
+ 'groups_many',
+ 'datasets_many',
+ 'generals_many',
+ 'access_of',
+ 'access_of_many',
  'parse_t',
  'xls',
 ]
@@ -259,16 +289,68 @@ otherAttributes = [
  '_starttime',
  '_stoptime',
  '_state',
+ '_timer',
+ '_cache',
+ '_profileIndex',
+ '_adminIndex',
+ '_admins',
+ '_viewFrame',
+ '_uaccProfiles',
+ '_accessOrder',
+ '_accessRanks',
+ '_sqlite',
+ '_lazy',
+ '_lazyFrames',
+ '_lazyLock',
+ '_lazySources',
+ '_eagerRecords',
+ '_indexFrame',
+ '_publishFrame',
+ '_materialize',
+ '_snapshotFrames',
+ '_parseDates',
+ '_connectUsers',
+ '_userDates',
+ '_bucket',
+ '_userLifecycle',
+ '_artifacts',
+ '_threads',
+ 'correlateStages',
+ '_columnStages',
+ '_deferredArtifacts',
+ '_correlateConnectAuth',
+ '_correlateIdstarDatasets',
+ '_correlateIdstarGenerals',
+ '_correlateOwnertree',
+ '_correlateGrouptree',
+ '_correlateGrouptreeLines',
+ '_correlateOwnertreeLines',
+ '_correlateProfileIndex',
+ '_correlateOmvsIds',
+ '_uidIndex',
+ '_gidIndex',
+ '_idFrame',
+ '_sharedIds',
+ '_superusers',
+ '_parseTimestamps',
+ '_correlateCustomFields',
+ '_customFields',
+ '_customFieldRecords',
+ '_customFieldTypes',
+ '_customFieldValues',
+ '_customFieldFrame',
+ '_customFieldsOf',
 ]
 
 # attributes that don't get created for pickles (for example), so if we find them that's fine, if we don't it's fine too
 optionalAttributes = [
  'accessAllows',
  'accessKeywords',
- 'generic2regex',
+ '_generic2regex',
  'rankedAccess',
  'THREAD_COUNT',
  '_irrdbu00',
+ '_unload',
  '_parsed',
  '_unloadlines',
 ]
@@ -277,7 +359,9 @@ frameMethods = [
  'acl',
  'gfilter',
  'rfilter',
- 'giveMeProfiles',
+ 'pfilter',
+ 'when',
+ '_giveMeProfiles',
 ]
 
 
@@ -0,0 +1,50 @@
+# what-if changes in an overlay must show in the queries on the overlay, and leave the RACF object unchanged
+
+def test_overlay_permit(testparms):
+  r = testparms['object']
+  (profile, authid, access) = r._datasetAccess.index[0]
+  before = r._datasetAccess
+  whatif = r.overlay().permit(profile, id=authid, access='ALTER').permit(profile, id='NEWGROUP', access='READ')
+  acl = whatif.acl(whatif.datasetAccess.gfilter(profile))
+  assert acl.loc[acl['AUTH_ID']==authid, 'ACCESS'].tolist()==['ALTER'], 'a new permit replaces the permit of the ID'
+  assert 'NEWGROUP' in acl['AUTH_ID'].tolist()
+  assert r._datasetAccess is before and r.datasetAccess.loc[(profile, authid)].index.tolist()==[access], 'the base frames do not change'
+  assert whatif._datasetAccess.index.names==before.index.names and whatif._connectData is r._connectData
+  whatif.permit(profile, id='NEWGROUP', delete=True)
+  assert 'NEWGROUP' not in whatif.acl(whatif.datasetAccess.gfilter(profile))['AUTH_ID'].tolist()
+  diff = whatif.diff()
+  assert diff[['CLASS_NAME','NAME']].drop_duplicates().values.tolist()==[['DATASET', profile]], 'only the changed profile is compared'
+  assert set(diff['ACCESS_AFTER'])<={'ALTER'}
+
+def test_overlay_connect(testparms):
+  r = testparms['object']
+  (group, userid) = r._connectData.index[0]
+  whatif = r.overlay().remove_user(group, userid).connect_user('SYS1', userid, authority='CONNECT')
+  assert group not in whatif.connect(None, userid).index and 'SYS1' in whatif.connect(None, userid).index
+  assert group in r.connect(None, userid).index
+  assert whatif.connects.loc[('SYS1', userid), 'GPMEM_AUTH']=='CONNECT'
+  access = set(whatif.access_of(userid)['NAME'])
+  assert access!=set(r.access_of(userid)['NAME']), 'effective access is evaluated on the overlay'
+  diff = whatif.diff()
+  assert (diff['USER_ID']==userid).all() and set(diff['CHANGE'])<={'added','removed','changed'}
+
+def test_overlay_owner(testparms):
+  r = testparms['object']
+  profile = r._datasets.index[0]
+  whatif = r.overlay().owner(profile, 'IBMUSER')
+  assert whatif.datasets.loc[profile, 'DSBD_OWNER_ID']=='IBMUSER' and r.datasets.loc[profile, 'DSBD_OWNER_ID']!='IBMUSER'
+  diff = whatif.diff(admin=True)
+  assert ((diff['USER_ID']=='IBMUSER') & (diff['AUTHORITY']=='OWNER') & (diff['CHANGE']=='added')).any(), 'the new owner can change the ACL'
+
+def test_overlay_frame_acl(testparms):
+  r = testparms['object']
+  (group, userid) = r._connectData.index[0]
+  profile = r._datasetAccess.loc[r._datasetAccess['DSACC_AUTH_ID']==group].index[0][0]
+  assert userid in r.datasetAccess.gfilter(profile).acl(explode=True)['USER_ID'].tolist()
+  whatif = r.overlay().remove_user(group, userid)
+  assert userid not in whatif.datasetAccess.gfilter(profile).acl(explode=True)['USER_ID'].tolist(), 'frame.acl() evaluates the overlay'
+  assert userid in r.datasetAccess.gfilter(profile).acl(explode=True)['USER_ID'].tolist(), 'and frames of the RACF object do not'
+  for i in range(3):  # the selection and the whole frame agree after each change
+    whatif.permit(profile, id=f'NEW{i}', access='UPDATE')
+    assert whatif.datasetAccess.gfilter(profile).equals(whatif.datasetAccess.loc[[profile]])
+  assert whatif.datasetAccess.index.is_monotonic_increasing and len(whatif.datasetAccess)==len(r.datasetAccess)+3
@@ -1,6 +1,9 @@
 # verify the result of parsing, not the actual content of dfs
 
 import pytest 
+import json
+import os
+from pyracf import RACF, StoopidException
 
 def test_status(testparms):
   assert testparms['object'].status['status']=='Ready'
@@ -12,3 +15,82 @@ def test_parsed_records(testparms):
   with pytest.raises(KeyError):
     r.parsed('0100')>0, 'old-fashioned references to record types should not work'
 
+
+def test_status_phases(testparms, tmp_path):
+  r = testparms['object']
+  phases = r.status['phases']
+  assert 'correlate.grouptreeLines' in phases, 'correlate stages must be timed'
+  assert any(p.startswith('frame.') or p.startswith('load.') for p in phases), 'frame creation or pickle loading must be timed'
+  assert all(p['seconds']>=0 and p['calls']>0 for p in phases.values())
+  timings = json.loads(r.save_timings(tmp_path/'timings.json'))
+  assert timings['phases'].keys()==phases.keys(), 'JSON export must contain the same phases'
+
+def test_schema_matches_offsets():
+  from pyracf.schema import recordOffsets
+  with open('src/pyracf/offsets.json') as f:
+    offsets = json.load(f)
+  assert recordOffsets.keys()=={rinfo['record-type'] for rinfo in offsets.values()}, 'schema.py must be generated from offsets.json'
+  for rinfo in offsets.values():
+    assert recordOffsets[rinfo['record-type']]==tuple((o['field-name'], int(o['start']), int(o['end'])) for o in rinfo['offsets'])
+
+def test_lazy_frames(testparms):
+  r = RACF(testparms['unload'], lazy=True)
+  r.parse_t()
+  assert '_userTSO' in r._lazyFrames and 'userTSO' in dir(r), 'segment frames are built on first use'
+  assert '_datasetAccess' not in r._lazyFrames
+  tso = r.userTSO
+  assert '_userTSO' not in r._lazyFrames and r._userTSO is tso
+  assert tso.equals(testparms['object']._userTSO), 'lazy frames must be the same as the frames built by parse_t'
+  assert tso.index.names==['_NAME']
+
+def test_correlate_stages(testparms):
+  r = RACF(testparms['unload'], artifacts=['grouptreeLines'], threads=4)
+  r.parse_t()
+  phases = r.status['phases']
+  assert 'correlate.grouptreeLines' in phases and 'correlate.ownertreeLines' not in phases, 'only the selected artifacts are made'
+  assert '_ownertreeLines' not in r.__dict__
+  assert r._grouptreeLines.equals(testparms['object']._grouptreeLines), 'stages on threads must give the same result'
+  assert r.user('IBMUSER').shape[0]==1, 'frames are indexed whatever artifacts are selected'
+  assert r.datasets.gfilter('SYS1.**').acl(admin=True).shape==RACF.acl(testparms['object'], testparms['object'].datasets.gfilter('SYS1.**'), admin=True).shape,\
+         'artifacts that were not selected are made on first use'
+  assert r._ownertreeLines.equals(testparms['object']._ownertreeLines)
+  assert r.getdatasetrisk('SYS1.**').keys()==testparms['object'].getdatasetrisk('SYS1.**').keys()
+  with pytest.raises(StoopidException):
+    RACF(pickles=testparms['pickledir'], prefix=testparms['pickleprefix'], artifacts=['nonsense'])
+
+def test_pickle_snapshot(testparms, tmp_path):
+  r = testparms['object']
+  manifest = r.save_pickles(path=str(tmp_path), prefix='snap-', compression='gzip')
+  assert json.loads((tmp_path/'snap-manifest.json').read_text())==manifest, 'the manifest is written with the pickles'
+  assert manifest['frames']['USBD']['records']==r._users.shape[0] and manifest['frames']['USBD']['file']==f"snap-USBD.{manifest['generation']}.pickle.gz"
+  stale = next(name for name in RACF._recordname_type if name not in manifest['frames'])
+  (tmp_path/f'snap-{stale}.pickle').write_bytes(b'not a pickle')  # left by an earlier save
+  r2 = RACF(pickles=str(tmp_path), prefix='snap-', lazy=True)
+  assert '_userTSO' in r2._lazyFrames, 'segment frames of a snapshot are read on first use'
+  assert r2._users.equals(r._users), 'compressed pickles must load the same frames'
+  assert r2.userTSO.equals(r._userTSO)
+  manifest2 = r2.save_pickles(path=str(tmp_path), prefix='snap-', threads=1)
+  assert manifest2['frames'].keys()==manifest['frames'].keys()
+  assert sorted(p.name for p in tmp_path.glob('snap-USBD.*'))==[manifest2['frames']['USBD']['file']], 'pickles that are not in the new snapshot are removed'
+  assert not (tmp_path/f'snap-{stale}.pickle').exists()
+
+def test_pickle_snapshot_interrupted(testparms, tmp_path, monkeypatch):
+  r = testparms['object']
+  r.save_pickles(path=str(tmp_path), prefix='snap-')
+  replace = os.replace
+  def interrupted(source, target):
+    if target.endswith('manifest.json'):
+      raise OSError('interrupted')
+    replace(source, target)
+  monkeypatch.setattr(os, 'replace', interrupted)
+  with pytest.raises(StoopidException):
+    r.save_pickles(path=str(tmp_path), prefix='snap-', compression='gzip')
+  monkeypatch.setattr(os, 'replace', replace)
+  r2 = RACF(pickles=str(tmp_path), prefix='snap-')
+  assert r2._groups.equals(r._groups), 'an interrupted save leaves the previous snapshot readable'
+  manifest = json.loads((tmp_path/'snap-manifest.json').read_text())
+  (tmp_path/manifest['frames']['GPBD']['file']).unlink()
+  with pytest.raises(StoopidException, match='GPBD'):
+    RACF(pickles=str(tmp_path), prefix='snap-')
+  with pytest.raises(StoopidException):
+    RACF(pickles=str(tmp_path/'missing'))
@@ -0,0 +1,76 @@
+# batch lookups through the hash index must match the single profile methods
+
+import pytest
+import numpy as np
+import pandas as pd
+from pyracf import RACF
+
+def test_users_many(testparms):
+  r = testparms['object']
+  ids = list(r.users.index[:5])+['NOTTHERE']
+  records = r.users_many(ids)
+  assert len(records)==6
+  assert records[-1] is None, 'unknown user IDs return None'
+  assert [rec.USBD_NAME for rec in records[:-1]]==ids[:-1]
+  assert records[0].USBD_DEFGRP_ID==r.user(ids[0])['USBD_DEFGRP_ID'].iloc[0]
+  frame = r.users_many(ids, frame=True)
+  assert list(frame.index)==ids[:-1], 'frame=True returns the found users in one frame'
+
+def test_generals_many(testparms):
+  r = testparms['object']
+  records = r.generals_many([('FACILITY','BPX.SUPERUSER'),('FACILITY','BPX.NOTTHERE')])
+  assert records[0].GRBD_NAME=='BPX.SUPERUSER'
+  assert records[1] is None
+
+def test_single_lookup_list(testparms):
+  r = testparms['object']
+  assert r.user('IBMUSER','LIST')['USBD_NAME']=='IBMUSER', 'LIST option returns a Series for one profile'
+  assert r.user('NOTTHERE','LIST')==[], 'LIST option returns an empty list for missing profiles'
+
+def test_single_lookup_list_tuple(testparms):
+  r = testparms['object']
+  t1 = r.connect('SYS1','IBMUSER','LIST')
+  t2 = r.general('FACILITY','BPX.SUPERUSER','LIST')
+  assert isinstance(t1, pd.DataFrame) and len(t1)==1, 'LIST option with a tuple key returns a frame, like .loc[[key]]'
+  assert isinstance(t2, pd.DataFrame) and t2.index.tolist()==[('FACILITY','BPX.SUPERUSER')]
+  assert r.general('FACILITY','BPX.NOTTHERE','LIST')==[]
+
+def test_access_of(testparms):
+  r = testparms['object']
+  user = r.connectData.index[len(r.connectData)//2][1]
+  t1 = r.access_of(user)
+  assert set(t1['USER_ID'])=={user}
+  assert t1.duplicated(['CLASS_NAME','NAME','VOL','CATYPE','CANAME']).sum()==0, 'resolve=True gives one entry per profile'
+  groups = set(r.connect(None, user).index)
+  assert set(t1['AUTH_ID'])<=groups|{user,'*','-uacc-'}, 'entries come from the user, its groups, ID(*) or UACC'
+  # permits on data sets through the user and its groups are found by acl too
+  t2 = r.datasets.acl(explode=True, user=user)
+  t3 = r.access_of(user, resolve=False, uacc=False)
+  t3 = t3.loc[(t3['CLASS_NAME']=='DATASET') & (t3['AUTH_ID']!='*')]
+  assert sorted(zip(t2['NAME'],t2['AUTH_ID'],t2['ACCESS']))==sorted(zip(t3['NAME'],t3['AUTH_ID'],t3['ACCESS']))
+
+def test_access_of_many(testparms):
+  r = testparms['object']
+  users = list(r.users.index[:20])
+  t1 = r.access_of_many(users)
+  t2 = pd.concat([r.access_of(u) for u in users], ignore_index=True)
+  assert t1.equals(t2), 'batch form must give the same entries as access_of per user'
+  # access_of takes its own path for one user, it must give the rows of the batch form in the same order
+  users = list(r.connectData.index.get_level_values(1).unique()[::97])+['NOSUCH']
+  for (resolve, uacc) in [(True,True),(True,False),(False,True),(False,False)]:
+    for u in users:
+      assert r.access_of(u, resolve=resolve, uacc=uacc).equals(r.access_of_many([u], resolve=resolve, uacc=uacc)), f'access_of({u}, {resolve}, {uacc})'
+
+def test_access_of_uacc(testparms):
+  r = testparms['object']
+  users = list(r.users.index[:50])
+  resolved = r.access_of_many(users)
+  entries = r.access_of_many(users, resolve=False)
+  # resolve the entries here: user permit, else highest group permit, else the higher of ID(*) and UACC (UACC on a tie)
+  precedence = np.where(entries['AUTH_ID']==entries['USER_ID'], 3, np.where(entries['AUTH_ID'].isin(['*','-uacc-']), 1, 2))
+  rank = entries['ACCESS'].map(lambda a: RACF.accessKeywords.index(a) if a in RACF.accessKeywords else 0)
+  keys = ['USER_ID','CLASS_NAME','NAME','VOL','CATYPE','CANAME']
+  expected = entries.assign(R=10*precedence+rank+(entries['AUTH_ID']=='-uacc-')*0.5).sort_values(keys+['R'], kind='stable')\
+                    .drop_duplicates(keys, keep='last').sort_values(keys, kind='stable')
+  assert resolved.values.tolist()==expected[resolved.columns].values.tolist()
+  assert (resolved['AUTH_ID']=='-uacc-').any(), 'UACC gives access to the profiles without a permit of the user'
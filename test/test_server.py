@@ -0,0 +1,58 @@
+# the query server must give the same answers as the RACF object it serves
+
+import pytest
+from pyracf import StoopidException
+from pyracf.server import QueryServer, Client
+
+@pytest.fixture
+def server(testparms):
+  s = QueryServer({'pickles': testparms['pickledir'], 'prefix': testparms['pickleprefix']}, address=('127.0.0.1', 0), racf=testparms['object'])
+  s.start()
+  yield s
+  s.shutdown()
+
+def test_server_call(testparms, server):
+  r = testparms['object']
+  c = Client(server._httpd.server_address)
+  assert c.status()['input-lines']==r.status['input-lines']
+  assert c.call('connect', 'SYS1')['USCON_NAME'].tolist()==r.connect('SYS1')['USCON_NAME'].tolist(), 'connects must be the same through the server'
+  assert c.call('access_of', 'U0000001').shape[0]==r.access_of('U0000001').shape[0]
+  with pytest.raises(StoopidException, match='not supported'):
+    c.call('orphans')
+
+def test_server_frame(testparms, server):
+  r = testparms['object']
+  c = Client(server._httpd.server_address)
+  t1 = c.frame('datasets', gfilter=['SYS1.**'], acl={'resolve': True})
+  assert t1.shape==r.datasets.gfilter('SYS1.**').acl(resolve=True).shape, 'acl must be the same through the server'
+
+def test_server_reload(testparms, server):
+  before = server.snapshot
+  c = Client(server._httpd.server_address)
+  c.reload()
+  assert server.snapshot is not before and server.snapshot.racf._state==before.racf._state
+  assert c.call('user', 'IBMUSER').shape[0]==before.racf.user('IBMUSER').shape[0]
+
+def test_server_unix(testparms, tmp_path):
+  s = QueryServer({}, address=str(tmp_path/'pyracf.socket'), racf=testparms['object'])
+  s.start()
+  try:
+    assert Client(s.address).call('group', 'SYS1').shape[0]==1
+  finally:
+    s.shutdown()
+
+def test_server_reload_errors(testparms, tmp_path):
+  s = QueryServer({'pickles': str(tmp_path/'missing'), 'prefix': ''}, address=('127.0.0.1', 0), racf=testparms['object'])
+  s.start()
+  try:
+    c = Client(s._httpd.server_address)
+    with pytest.raises(StoopidException, match='PermissionError'):
+      c.request('/reload', {'pickles': testparms['pickledir']})
+    with pytest.raises(StoopidException) as e:
+      c.reload()
+    assert 'not found' not in str(e.value), 'a failed reload is a server error, not an unknown path'
+    assert s.snapshot.racf is testparms['object'], 'the old snapshot stays after a failed reload'
+    with pytest.raises(StoopidException, match='not found'):
+      c.request('/nothere')
+  finally:
+    s.shutdown()
@@ -0,0 +1,36 @@
+# frames attached from shared memory must have the values of the frames that were published
+
+from pyracf import sharedframes
+from pyracf.sharedframes import attach, detach
+
+def profilesAndPermits(part, frames):
+  return (part.index.get_level_values(0).nunique(), part.shape[0], frames['_connectData'].shape[0])
+
+def test_share(testparms):
+  r = testparms['object']
+  with r.share() as shared:
+    frames = attach(shared.handle)
+    df = frames['_datasetAccess']
+    assert df.shape==r._datasetAccess.shape
+    assert (df.astype(object).values==r._datasetAccess.values).all(), 'columns must have the same values'
+    assert list(df.index.get_level_values(0).astype(object))==list(r._datasetAccess.index.get_level_values(0))
+    assert df.gfilter(None, 'U0000001').shape[0]==r._datasetAccess.gfilter(None, 'U0000001').shape[0], 'frame methods must work on attached frames'
+
+def test_map_partitions(testparms):
+  r = testparms['object']
+  results = r.map_partitions(profilesAndPermits, n=3, processes=2)
+  assert len(results)==3
+  assert sum(p for (p,_,_) in results)==r._datasetAccess.index.get_level_values(0).nunique(), 'all rows of a profile must be in one partition'
+  assert sum(n for (_,n,_) in results)==r._datasetAccess.shape[0]
+  assert all(c==r._connectData.shape[0] for (_,_,c) in results), 'every worker must see all of connectData'
+
+def test_detach(testparms):
+  r = testparms['object']
+  with r.share(['_connectData']) as shared:
+    frames = attach(shared.handle)
+    token = shared.handle['_connectData']['token']
+    assert attach(shared.handle)['_connectData'] is frames['_connectData'], 'a block is attached once per process'
+    detach(shared.handle)
+    assert token not in sharedframes._attached
+    assert frames['_connectData'].shape==r._connectData.shape, 'a detached frame remains usable'
+  assert frames['_connectData'].equals(frames['_connectData'].copy()), 'a detached frame remains usable after close( )'
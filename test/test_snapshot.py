@@ -0,0 +1,64 @@
+# a snapshot store must rebuild every version from its deltas
+
+import json
+import os
+import pytest
+from pyracf.snapshot import SnapshotStore
+
+
+def sameRows(a, b):
+  (a, b) = (a.reset_index(), b.reset_index())
+  return a.sort_values(list(a.columns)).reset_index(drop=True).equals(b.sort_values(list(b.columns)).reset_index(drop=True))
+
+def test_snapshot_store(testparms, tmp_path):
+  r = testparms['object']
+  march = r._snapshotFrames()
+  april = dict(march)
+  april['DSACC'] = march['DSACC'].iloc[10:].copy()
+  april['DSACC'].iloc[0, april['DSACC'].columns.get_loc('DSACC_ACCESS')] = 'ALTER'
+  del april['GPBD']
+  store = SnapshotStore(str(tmp_path/'store'))
+  assert store.append(r, date='2026-03-01')==1
+  assert store.append(april, date='2026-04-01')==2
+  assert store.versions['removed'].tolist()==[0, len(march['GPBD'])+11], 'the second version has only the changed rows'
+  assert store.version('2026-03-31')==1
+  with pytest.raises(ValueError):
+    store.append(april, date='2026-02-01')
+
+  store = SnapshotStore(str(tmp_path/'store'))
+  old = store.frames(date='2026-03-31')
+  assert old.keys()==march.keys() and all(sameRows(old[name], march[name]) for name in march), 'deltas must rebuild the first version'
+  assert old['DSACC'].index.names==march['DSACC'].index.names
+  new = store.frames(version=2, head=False)
+  assert new.keys()==april.keys() and sameRows(new['DSACC'], april['DSACC'])
+
+  profile = march['DSACC'].index[10][0]
+  history = store.history('DSACC', profile)
+  assert set(history['_version'])=={1, 2} and set(history.loc[history['_version']==2, '_op'])=={'add', 'del'}
+  assert (history.index.get_level_values(0)==profile).all() and '_date' in history.columns
+
+  mysys = store.racf(date='2026-03-15')
+  assert mysys.users.shape==r.users.shape and mysys.connectData.shape==r.connectData.shape
+
+def test_snapshot_store_interrupted(testparms, tmp_path, monkeypatch):
+  r = testparms['object']
+  march = r._snapshotFrames()
+  april = dict(march, DSACC=march['DSACC'].iloc[5:])
+  store = SnapshotStore(str(tmp_path/'store'))
+  store.append(march, date='2026-03-01')
+  replace = os.replace
+  def interrupted(source, target):
+    if target.endswith('store.json'):
+      raise OSError('interrupted')
+    replace(source, target)
+  monkeypatch.setattr(os, 'replace', interrupted)
+  with pytest.raises(OSError):
+    store.append(april, date='2026-04-01')  # head is written, the catalog is not
+  monkeypatch.setattr(os, 'replace', replace)
+  store = SnapshotStore(str(tmp_path/'store'))
+  assert store.versions['version'].tolist()==[1]
+  assert store.append(april, date='2026-04-01')==2
+  assert store.versions['removed'].tolist()==[0, 5], 'the delta is computed against version 1, not the head of the interrupted append'
+  manifest = json.loads((tmp_path/'store'/'head'/'manifest.json').read_text())
+  (tmp_path/'store'/'head'/manifest['frames']['DSACC']['file']).write_bytes(b'not a pickle')
+  assert sameRows(SnapshotStore(str(tmp_path/'store')).frames()['DSACC'], april['DSACC']), 'a damaged head is rebuilt from the deltas'
@@ -0,0 +1,20 @@
+# frames exported to SQLite must give the same answers as the frames
+
+import os
+import pytest
+
+def test_sql(testparms):
+  r = testparms['object']
+  assert r.sql('select count(*) as n from USBD')['n'][0]==r.users.shape[0], 'USBD table must have all users'
+  t1 = r.sql("select USCON_NAME from USCON where USCON_GRP_ID=? order by USCON_NAME", params=('SYS1',))
+  assert t1['USCON_NAME'].tolist()==sorted(r.connect('SYS1').index), 'connects must be the same in SQL and in the frames'
+  assert r.sql('select count(*) as n from ownertreeLines')['n'][0]==r._ownertreeLines.shape[0]
+
+def test_save_sqlite(testparms, tmp_path):
+  r = testparms['object']
+  previous = r._sqlite
+  fileName = r.save_sqlite(str(tmp_path/'racf.sqlite'))
+  assert os.path.exists(fileName) and not os.path.exists(fileName+'.tmp')
+  indexes = r.sql("select name from sqlite_master where type='index' and tbl_name='DSACC'")['name'].tolist()
+  assert 'ix_DSACC' in indexes and 'ix_DSACC_AUTH_ID' in indexes, 'index fields must be indexed in SQLite'
+  r._sqlite = previous
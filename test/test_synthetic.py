@@ -0,0 +1,27 @@
+# the synthetic unload generator must be reproducible and scale with the requested size
+
+import time
+import pytest
+from pyracf import RACF
+from pyracf.synthetic import generate
+
+def test_synthetic_reproducible(tmp_path):
+  c1 = generate(tmp_path/'s1.unload', lines=5000, seed=7)
+  c2 = generate(tmp_path/'s2.unload', lines=5000, seed=7)
+  assert c1==c2, 'same seed and size must give the same record counts'
+  assert (tmp_path/'s1.unload').read_bytes()==(tmp_path/'s2.unload').read_bytes(), 'same seed and size must give the same unload'
+
+def test_synthetic_scale(tmp_path):
+  small = sum(generate(tmp_path/'small.unload', lines=10000).values())
+  large = sum(generate(tmp_path/'large.unload', lines=40000).values())
+  assert 0.8*10000 < small < 1.2*10000, 'number of records must be close to the requested size'
+  assert 3*small < large, 'record count must grow with the requested size'
+
+def test_synthetic_unique_profiles(tmp_path):
+  generate(tmp_path/'u.unload', lines=20000, seed=0)
+  r = RACF(str(tmp_path/'u.unload'))
+  r.parse()
+  while r._state!=r.STATE_READY:
+    time.sleep(0.1)
+  for frame in ['_users','_groups','_datasets','_generals']:
+    assert getattr(r,frame).index.is_unique, f'{frame} must not contain duplicate profile keys'
@@ -0,0 +1,67 @@
+# compressed and EBCDIC unloads must give the same frames as the plain unload
+
+import gzip
+import lzma
+import pytest
+from pyracf import RACF
+from pyracf.synthetic import generate
+from pyracf.unload import decodeFields
+
+@pytest.fixture(scope='module')
+def plain(tmp_path_factory):
+  unload = tmp_path_factory.mktemp('unload')/'plain.unload'
+  generate(unload, lines=3000, seed=3)
+  r = RACF(str(unload))
+  r.parse_t()
+  return (unload, r)
+
+def parsedAs(path, content, encoding=None):
+  with (gzip.open(path,'wb') if path.suffix=='.gz' else lzma.open(path,'wb') if path.suffix=='.xz' else open(path,'wb')) as f:
+    f.write(content)
+  r = RACF(str(path), encoding=encoding)
+  r.parse_t()
+  return r
+
+def assertSameFrames(r, expected):
+  assert r._unloadlines==expected._unloadlines, 'records must be counted for the progress report'
+  for rinfo in RACF._recordtype_info.values():
+    assert getattr(r, rinfo['df']).equals(getattr(expected, rinfo['df'])), f'{rinfo["name"]} must be the same'
+
+def test_unload_compressed(plain, tmp_path):
+  (unload, expected) = plain
+  for name in ['racf.unload.gz', 'racf.unload.xz']:
+    r = parsedAs(tmp_path/name, unload.read_bytes())
+    assert r._unload.compression==name.split('.')[-1].replace('gz','gzip')
+    assertSameFrames(r, expected)
+
+def test_unload_ebcdic(plain, tmp_path):
+  (unload, expected) = plain
+  lines = unload.read_text().splitlines()
+  r = parsedAs(tmp_path/'racf.cp037', b''.join(l.encode('cp037')+b'\x25' for l in lines))
+  assert r._unload.encoding=='cp037'
+  assertSameFrames(r, expected)
+  rdw = b''.join((len(l)+4).to_bytes(2,'big')+b'\0\0'+l.encode('cp1047') for l in lines)
+  r = parsedAs(tmp_path/'racf.rdw.gz', rdw, encoding='cp1047')
+  assert r._unload.recordFormat=='rdw'
+  assertSameFrames(r, expected)
+
+def test_unload_utf8_offsets(plain, tmp_path):
+  (unload, expected) = plain
+  lines = unload.read_text().splitlines()
+  user = next(i for (i,l) in enumerate(lines) if l.startswith('0200 '))
+  name = lines[user][5:13].strip()
+  lines[user] = lines[user][:5]+'É'+lines[user][6:]  # first character of the user ID
+  r = parsedAs(tmp_path/'racf.unload', '\n'.join(lines).encode('utf-8'))
+  changed = r._users.loc[r._users['USBD_NAME']=='É'+name[1:]]
+  assert changed.shape[0]==1, 'offsets count characters in UTF-8 unloads'
+  assert changed['USBD_CREATE_DATE'].iloc[0]==expected._users.loc[name,'USBD_CREATE_DATE']
+
+def test_decode_fields():
+  fields = [('TYPE',0,4), ('NAME',5,13), ('TEXT',14,20), ('PAST',30,40)]
+  lines = [b'0200 IBMUSER  ABC\r', 'ÉÉ00 €URO     xyz  '.encode('utf-8'), b'0100 SYS1']
+  columns = decodeFields(lines, fields)
+  assert list(columns['NAME'])==['IBMUSER', '€URO', 'SYS1'], 'offsets count characters, also outside Latin-1'
+  assert list(columns['TYPE'])==['0200', 'ÉÉ00', '0100']
+  assert list(columns['TEXT'])==['ABC', 'xyz', ''], 'line ends and short records give stripped or empty values'
+  assert list(columns['PAST'])==['', '', '']
+  assert list(decodeFields([l.encode('cp037') for l in ['0200 [IBM]', '0100 ^¬']], fields[:2], 'cp037')['NAME'])==['[IBM]', '^¬']